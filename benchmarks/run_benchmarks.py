@@ -0,0 +1,339 @@
+"""
+Headless timings for the data preparation behind each viewer, run against synthetic exports.
+
+    python -m benchmarks.run_benchmarks                      # generate a default league and time everything
+    python -m benchmarks.run_benchmarks --data /tmp/kmffl    # reuse (or create) exports in a directory
+    python -m benchmarks.run_benchmarks --save-baseline      # record the current timings as the baseline
+    python -m benchmarks.run_benchmarks --only sim --repeat 5
+
+Each benchmark runs with Streamlit caches cleared, so timings are cold-path costs. Results are
+compared with the stored baseline (benchmarks/baseline.json by default) and the command exits
+non-zero when a median is slower than the baseline by more than --tolerance. Baselines are
+machine-specific; record one on the machine you compare on. KMFFL_DIAGNOSTICS=1 adds peak
+memory per benchmark, but tracing slows allocation-heavy code, so don't compare those timings.
+"""
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+import duckdb
+import streamlit as st
+from streamlit import config as st_config
+from streamlit import logger as st_logger
+
+# Bare-mode warnings from cached functions and st.* calls would drown the report. Parsing the
+# config resets the log level, so parse it first
+st_config.get_option("logger.level")
+st_logger.set_log_level("error")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for path in (REPO_ROOT, REPO_ROOT / "streamlit_ui"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from benchmarks.synthetic_league import generate_league, regular_weeks, write_league
+from streamlit_ui.data.aggregates import materialize_aggregates
+from streamlit_ui.data.league_data import LeagueData
+from streamlit_ui.data.parquet_store import source_exists, sync_parquet
+from streamlit_ui.data.query_service import QueryService
+from streamlit_ui.data.timings import timed
+from streamlit_ui.tabs.draft_data.draft_optimizer import (
+    build_lineup_model, budget_frontier, calculate_aggregated_buckets, marginal_report, optimal_lineups, preprocess_data,
+    solve_lineup
+)
+from streamlit_ui.tabs.matchup_data_and_simulations.expected_record_distribution import expected_record_distribution
+from streamlit_ui.tabs.matchup_data_and_simulations.gavi_stat import GAVI_COLUMNS, compute_xwins
+from streamlit_ui.tabs.matchup_data_and_simulations.playoff_odds_simulation import simulate_playoff_odds
+from streamlit_ui.tabs.matchup_data_and_simulations.schedule_matrix import (
+    TENSOR_COLUMNS, build_score_tensor, head_to_head_records, schedule_swap_records
+)
+from streamlit_ui.tabs.matchup_data_and_simulations.shuffle_scores_and_schedules.shuffle_schedule import (
+    simulate_win_distribution
+)
+from streamlit_ui.tabs.matchup_data_and_simulations.shuffle_scores_and_schedules.shuffle_scores import (
+    calculate_std_dev, simulate_tweaked_seasons
+)
+from streamlit_ui.tabs.player_stats.career_player_subprocesses import career_player_basic_stats
+from streamlit_ui.tabs.player_stats.season_player_subprocesses import season_player_basic_stats
+from streamlit_ui.tabs.player_stats.weekly_player_subprocesses import weekly_player_advanced_stats
+from streamlit_ui.tabs.player_stats.weekly_player_subprocesses import weekly_player_basic_stats
+from streamlit_ui.tabs.transactions.trade_by_trade_summary_data import display_trade_by_trade_summary_data
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+# Differences below this are treated as timer noise whatever the ratio
+MIN_REGRESSION_MS = 5.0
+SIMULATIONS = 2000
+DRAFT_SLOTS = {'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1, 'DEF': 1, 'K': 1}
+DRAFT_BUDGET = 200
+
+TABLES = {
+    "Matchup Data": "matchup",
+    "Player Data": "player",
+    "Schedules": "schedule",
+    "All Transactions": "transactions",
+    "Draft History": "draft",
+    "Injury Data": "injury",
+}
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+class LeagueFixture:
+    """
+    The exports loaded the way the app loads them: DuckDB views plus the season/career
+    aggregates, materialized through LeagueData.
+    """
+
+    def __init__(self, data_dir):
+        self.service = QueryService(duckdb.connect())
+        tables = {}
+        for key, stem in TABLES.items():
+            path = Path(data_dir) / f"{stem}.parquet"
+            if source_exists(path):
+                sync_parquet(self.service.cursor(), path, stem, persistent=False)
+                tables[key] = stem
+        tables.update(materialize_aggregates(self.service.cursor(), tables))
+        self.tables = tables
+        self.data = LeagueData(tables, self.service)
+        self._draft_candidates = None
+
+    def frame(self, key):
+        return self.data.frame(key)
+
+    @property
+    def matchup(self):
+        return self.frame("Matchup Data")
+
+    @property
+    def player(self):
+        return self.frame("Player Data")
+
+    def season(self):
+        """
+        Latest season with a complete regular season, and its regular-season matchups.
+        """
+        matchup = self.matchup
+        last = int(matchup["year"].max())
+        df = matchup[(matchup["year"] == last) & (matchup["is_playoffs"] == 0) & (matchup["is_consolation"] == 0)]
+        return last, df
+
+    def draft_candidates(self):
+        """
+        The optimizer's (position, cost bucket) rows over every season, built once.
+        """
+        if self._draft_candidates is None:
+            player = self.player
+            aggregated = preprocess_data(self.frame("Draft History"), self.frame("Player Season Points"),
+                                         int(player["year"].min()), int(player["year"].max()))
+            buckets = calculate_aggregated_buckets(aggregated)
+            self._draft_candidates = buckets[['primary_position', 'Average cost', 'Median PPG']]
+        return self._draft_candidates
+
+
+@benchmark("load.materialize_all")
+def bench_load(league):
+    league.data = LeagueData(league.tables, league.service)
+    return sum(len(league.frame(key)) for key in league.data.available)
+
+
+# Viewers hand the stat builders filtered copies, which some of them modify, so pass copies here too
+@benchmark("players.weekly_basic_stats")
+def bench_weekly_basic(league):
+    return len(weekly_player_basic_stats.get_basic_stats(league.player.copy(), "QB"))
+
+
+@benchmark("players.weekly_advanced_stats")
+def bench_weekly_advanced(league):
+    return len(weekly_player_advanced_stats.get_advanced_stats(league.player.copy()))
+
+
+@benchmark("players.season_basic_stats")
+def bench_season_basic(league):
+    return len(season_player_basic_stats.get_basic_stats(league.player.copy(), "WR"))
+
+
+@benchmark("players.career_basic_stats")
+def bench_career_basic(league):
+    return len(career_player_basic_stats.get_basic_stats(league.player.copy(), "RB"))
+
+
+@benchmark("draft.preprocess_data")
+def bench_draft_preprocess(league):
+    player = league.player
+    return len(preprocess_data(league.frame("Draft History"), league.frame("Player Season Points"),
+                               int(player["year"].min()), int(player["year"].max())))
+
+
+@benchmark("draft.lineup_milp")
+def bench_lineup_milp(league):
+    selected, _ = solve_lineup(*build_lineup_model(league.draft_candidates(), DRAFT_SLOTS, 1, DRAFT_BUDGET))
+    return int(selected.sum())
+
+
+@benchmark("draft.lineup_top5")
+def bench_lineup_top5(league):
+    lineups, _ = optimal_lineups(league.draft_candidates(), DRAFT_SLOTS, 1, DRAFT_BUDGET, top_k=5)
+    return len(lineups)
+
+
+@benchmark("draft.budget_sweep")
+def bench_budget_sweep(league):
+    return len(budget_frontier(league.draft_candidates(), DRAFT_SLOTS, 1, tuple(range(100, 301, 10))))
+
+
+@benchmark("draft.marginal_values")
+def bench_marginal_values(league):
+    return len(marginal_report(league.draft_candidates(), DRAFT_SLOTS, 1, DRAFT_BUDGET))
+
+
+@benchmark("transactions.trade_by_trade")
+def bench_trade_by_trade(league):
+    # The viewer computes and renders in one function; rendering is a no-op outside `streamlit run`
+    display_trade_by_trade_summary_data(
+        league.frame("All Transactions"), league.player.copy(), league.frame("Draft History"),
+        league.frame("Season Metadata")
+    )
+    return len(league.frame("All Transactions"))
+
+
+@benchmark("sim.shuffle_schedule")
+def bench_shuffle_schedule(league):
+    _, season = league.season()
+    simulate_win_distribution(season, SIMULATIONS, seed=0, parallel=False)
+    return len(season)
+
+
+@benchmark("sim.tweak_scores")
+def bench_tweak_scores(league):
+    year, season = league.season()
+    std_dev_df = calculate_std_dev(season, year, True, False)
+    simulate_tweaked_seasons(season, std_dev_df, SIMULATIONS, "Normal", seed=0, parallel=False)
+    return len(season)
+
+
+@benchmark("sim.playoff_odds")
+def bench_playoff_odds(league):
+    year, _ = league.season()
+    matchup = league.matchup[league.matchup["year"] <= year]
+    odds = simulate_playoff_odds(matchup, year, regular_weeks(year) // 2, SIMULATIONS,
+                                 schedule_df=league.frame("Schedules"), seed=0)
+    return len(odds)
+
+
+@benchmark("sim.expected_record")
+def bench_expected_record(league):
+    year, season = league.season()
+    return len(expected_record_distribution(season, int(season["week"].max())))
+
+
+@benchmark("matchups.gavi_xwins")
+def bench_gavi(league):
+    return len(compute_xwins(league.matchup[GAVI_COLUMNS + ["teams_beat_this_week"]], "teams_beat_this_week"))
+
+
+@benchmark("matchups.schedule_matrix")
+def bench_schedule_matrix(league):
+    managers, scores, opponents = build_score_tensor(league.matchup[TENSOR_COLUMNS])
+    schedule_swap_records(scores, opponents)
+    head_to_head_records(scores, opponents)
+    return scores.size
+
+
+def run(league, names, repeat):
+    results = {}
+    for name in names:
+        samples, peak, rows = [], None, None
+        for _ in range(repeat):
+            st.cache_data.clear()
+            with timed("benchmark", name) as record:
+                rows = BENCHMARKS[name](league)
+            samples.append(record["wall_ms"])
+            if record.get("peak_mb") is not None:
+                peak = max(peak or 0.0, record["peak_mb"])
+        results[name] = {
+            "median_ms": round(statistics.median(samples), 3), "min_ms": round(min(samples), 3),
+            "peak_mb": peak, "rows": rows,
+        }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Benchmarks whose median exceeds the baseline by more than `tolerance` (and MIN_REGRESSION_MS).
+    """
+    regressions = {}
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("median_ms")
+        if before is None:
+            continue
+        after = result["median_ms"]
+        if after > before * (1 + tolerance) and after - before > MIN_REGRESSION_MS:
+            regressions[name] = (before, after)
+    return regressions
+
+
+def print_results(results, baseline):
+    print(f"{'benchmark':<32}{'median ms':>12}{'min ms':>12}{'baseline':>12}{'change':>9}{'peak MB':>10}{'rows':>10}")
+    for name, r in results.items():
+        before = baseline.get(name, {}).get("median_ms")
+        change = f"{(r['median_ms'] / before - 1) * 100:+.0f}%" if before else ""
+        before = f"{before:.1f}" if before else ""
+        peak = f"{r['peak_mb']:.1f}" if r["peak_mb"] is not None else ""
+        print(f"{name:<32}{r['median_ms']:>12.1f}{r['min_ms']:>12.1f}{before:>12}{change:>9}{peak:>10}"
+              f"{r['rows'] if r['rows'] is not None else '':>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark KMFFL data preparation on synthetic exports.")
+    parser.add_argument("--data", help="Directory with exports; generated there when missing (default: temp dir)")
+    parser.add_argument("--seasons", type=int, default=12)
+    parser.add_argument("--managers", type=int, default=10)
+    parser.add_argument("--players", type=int, default=800)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default="", help="Run benchmarks whose name contains this text")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    scale = {"seasons": args.seasons, "managers": args.managers, "players": args.players, "seed": args.seed}
+    data_dir = Path(args.data) if args.data else Path(tempfile.mkdtemp(prefix="kmffl_bench_"))
+    if not source_exists(data_dir / "matchup.parquet"):
+        write_league(generate_league(args.seasons, args.managers, args.players, seed=args.seed), data_dir)
+    league = LeagueFixture(data_dir)
+
+    names = [n for n in BENCHMARKS if args.only in n]
+    results = run(league, names, args.repeat)
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get("results", {}) if stored.get("scale") == scale else {}
+    if stored and not baseline:
+        print(f"Baseline in {args.baseline} was recorded at a different scale; not comparing.")
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        merged = {**baseline, **results}
+        args.baseline.write_text(json.dumps({"scale": scale, "results": merged}, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, (before, after) in regressions.items():
+        print(f"REGRESSION {name}: {before:.1f} ms -> {after:.1f} ms")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
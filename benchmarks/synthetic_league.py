@@ -0,0 +1,452 @@
+"""
+Synthetic league exports with the same schema as the real parquet files, at any scale.
+
+    python -m benchmarks.synthetic_league --out /tmp/kmffl --seasons 12 --managers 10 --players 800
+
+Point the app at the output with KMFFL_DATA_DIR. Values are random but internally consistent:
+team scores are the sum of each roster's starters, records and seeds follow from the scores,
+and draft, transaction and injury rows reference real players and managers of the same season.
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+# Share of the player pool, mean and spread of weekly points per position
+POSITION_POOL = {"QB": 0.12, "RB": 0.25, "WR": 0.33, "TE": 0.15, "K": 0.07, "DEF": 0.08}
+POSITION_POINTS = {"QB": (17.0, 7.0), "RB": (10.0, 6.0), "WR": (9.5, 6.0), "TE": (7.0, 4.5), "K": (8.0, 3.5),
+                   "DEF": (7.5, 5.0)}
+ROSTER = {"QB": 2, "RB": 4, "WR": 5, "TE": 2, "K": 1, "DEF": 1}
+STARTERS = ["QB", "RB", "RB", "WR", "WR", "TE", "W/R/T", "K", "DEF"]
+FLEX_POSITIONS = ("RB", "WR", "TE")
+NFL_TEAMS = [
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+    "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+]
+UNROSTERED = "Unrostered"
+
+PLAYOFF_TEAMS = 6
+PLAYOFF_BYES = 2
+PLAYOFF_WEEKS = 3
+
+# Stat columns of the weekly player export, grouped by the position that produces them
+PLAYER_STATS = {
+    "QB": ["Pass Yds", "Pass TD", "Int", "completions", "attempts", "sack_yards", "sack_fumbles",
+           "passing_2pt_conversions", "passing_air_yards", "passing_yards_after_catch", "passing_first_downs",
+           "passing_epa", "dakota", "pacr"],
+    "RB": ["Rush Yds", "Rush Att", "Rush TD", "rushing_fumbles", "rushing_fumbles_lost", "rushing_first_downs",
+           "rushing_epa"],
+    "WR": ["Rec", "Rec Yds", "Rec TD", "Targets", "receiving_fumbles", "receiving_fumbles_lost",
+           "receiving_first_downs", "receiving_epa", "target_share", "wopr", "racr", "receiving_2pt_conversions",
+           "receiving_air_yards", "receiving_yards_after_catch", "air_yards_share"],
+    "K": ["FG Yds", "FG%", "field_goal_result", "field_goal_attempt", "PAT Made", "extra_point_attempt"],
+    "DEF": ["Def Yds Allow", "Fum Rec", "Fum Ret TD", "Pts Allow", "Pts Allow 0", "Pts Allow 1-6", "Pts Allow 7-13",
+            "Pts Allow 14-20", "Pts Allow 21-27", "Pts Allow 28-34", "Pts Allow 35+", "Yds Allow 0-99",
+            "Yds Allow 100-199", "Yds Allow 200-299", "Yds Allow 300-399", "Yds Allow 400-499", "Yds Allow 500+",
+            "defensive_td", "Safe", "Defensive Interceptions", "Eligible_Defensive_Points_Allowed",
+            "Extra Point Return TD", "3 and Outs", "4 Dwn Stops", "blocked_kick", "Muffed Punt Recoveries",
+            "Muffed Punts", "qb_hit", "Sack", "TFL", "combined tfl and sacks", "defensive_extra_point_conv", "XPR",
+            "Total Points Allowed"],
+}
+STAT_SOURCES = {"QB": ("QB", "RB"), "RB": ("RB", "WR"), "WR": ("WR", "RB"), "TE": ("WR", "RB"), "K": ("K",),
+                "DEF": ("DEF",)}
+
+# Matchup columns the generator does not derive; filled with plausible noise of the right type
+MATCHUP_FLOAT_FILL = [
+    "proj_score_error", "abs_proj_score_error", "above_proj_score", "below_proj_score", "expected_spread",
+    "expected_odds", "win_vs_spread", "lose_vs_spread", "underdog_wins", "favorite_losses", "gpa", "grade",
+    "division_id", "waiver_priority", "has_draft_grade", "faab_balance", "number_of_moves", "number_of_trades",
+    "auction_budget_spent", "auction_budget_total", "win_probability", "coverage_value", "value", "felo_score",
+    "felo_tier", "playoff_rounds_won", "manager_season_rank", "final_regular_losses", "sacko",
+    "league_alltime_rank", "manager_alltime_rank", "final_wins", "playoff_rounds_played", "league_all_time_ranking",
+    "league_season_rank", "final_playoff_seed", "final_losses", "league_season_ranking", "final_regular_wins",
+    "manager_season_ranking", "manager_all_time_ranking", "manager_all_time_ranking_percentile",
+    "real_total_matchup_score", "real_opponent_points", "real_score", "league_all_time_ranking_percentile",
+    "manager_alltime_percentile", "inflation_rate", "league_alltime_percentile", "real_margin",
+    "personal_season_mean", "personal_season_median", "seed_points_to_date", "__cap_week", "avg_seed",
+    "p_playoffs", "p_bye", "exp_final_wins", "exp_final_pf", "p_semis", "p_final", "p_champ", "power_rating",
+    "shuffle_avg_wins", "shuffle_avg_seed", "shuffle_avg_playoffs", "shuffle_avg_bye", "wins_vs_shuffle_wins",
+    "seed_vs_shuffle_seed",
+]
+MATCHUP_FLAG_FILL = [
+    "is_playoffs_raw", "is_consolation_raw", "postseason", "quarterfinal", "semifinal", "championship", "champion",
+    "valid_season_game", "above_opponent_median", "below_opponent_median",
+]
+MATCHUP_COUNT_FILL = ["winning_streak", "losing_streak", "seed_wins_to_date"]
+MATCHUP_TEXT_FILL = ["matchup_recap_title", "matchup_recap_url", "url", "image_url", "week_start", "week_end"]
+
+
+def regular_weeks(year):
+    return 13 if year < 2021 else 14
+
+
+def _player_pool(num_players, rng):
+    positions = rng.choice(POSITIONS, size=num_players, p=[POSITION_POOL[p] for p in POSITIONS])
+    names = [f"{pos} Player {i:04d}" for i, pos in enumerate(positions)]
+    means = np.array([POSITION_POINTS[p][0] for p in positions]) * rng.lognormal(0, 0.35, num_players)
+    return pd.DataFrame({
+        "player": names,
+        "player_id": np.arange(100000, 100000 + num_players),
+        "nfl_position": positions,
+        "nfl_team": rng.choice(NFL_TEAMS, size=num_players),
+        "talent": means,
+    })
+
+
+def _draft_rosters(pool, managers, rng):
+    """
+    Season rosters: each manager drafts ROSTER by position, best available first with some noise.
+    Returns {player index: manager}.
+    """
+    owner = {}
+    for pos, count in ROSTER.items():
+        candidates = pool.index[pool["nfl_position"] == pos].to_numpy()
+        order = candidates[np.argsort(-(pool.loc[candidates, "talent"].to_numpy() * rng.lognormal(0, 0.3, len(candidates))))]
+        picks = order[:count * len(managers)]
+        for slot, idx in enumerate(picks):
+            owner[idx] = managers[slot % len(managers)]
+    return owner
+
+
+def _lineups(pool, owner):
+    """
+    Starting slot of every rostered player by season-long talent; everyone else sits on the bench.
+    """
+    slots = {}
+    roster = pd.DataFrame({"manager": pd.Series(owner)}).join(pool[["nfl_position", "talent"]])
+    for manager, players in roster.groupby("manager"):
+        players = players.sort_values("talent", ascending=False)
+        used = set()
+        for slot in STARTERS:
+            allowed = FLEX_POSITIONS if slot == "W/R/T" else (slot,)
+            for idx, row in players.iterrows():
+                if idx not in used and row["nfl_position"] in allowed:
+                    used.add(idx)
+                    slots[idx] = slot
+                    break
+        for idx in players.index:
+            slots.setdefault(idx, "BN")
+    return slots
+
+
+def _pairings(managers, rng):
+    order = rng.permutation(len(managers))
+    return [(managers[order[i]], managers[order[i + 1]]) for i in range(0, len(order), 2)]
+
+
+def _season(year, pool, managers, team_names, rng):
+    owner = _draft_rosters(pool, managers, rng)
+    slots = _lineups(pool, owner)
+    reg_weeks = regular_weeks(year)
+    total_weeks = reg_weeks + PLAYOFF_WEEKS
+
+    player_rows, matchup_rows = [], []
+    wins = dict.fromkeys(managers, 0)
+    points_for = dict.fromkeys(managers, 0.0)
+    seeds = {m: i + 1 for i, m in enumerate(managers)}
+    for week in range(1, total_weeks + 1):
+        std = np.array([POSITION_POINTS[p][1] for p in pool["nfl_position"]])
+        points = np.round(np.maximum(rng.normal(pool["talent"], std), -4.0), 2)
+
+        if week <= reg_weeks:
+            pairs = _pairings(managers, rng)
+        else:
+            # Postseason pairs neighbouring seeds; the top PLAYOFF_TEAMS are in the playoffs
+            ranked = sorted(managers, key=lambda m: seeds[m])
+            pairs = [(ranked[i], ranked[i + 1]) for i in range(0, len(ranked), 2)]
+        opponent = {a: b for a, b in pairs} | {b: a for a, b in pairs}
+
+        starters = pd.DataFrame({
+            "manager": pd.Series(owner), "slot": pd.Series(slots), "points": points[list(owner)]
+        })
+        team_points = starters[starters["slot"] != "BN"].groupby("manager")["points"].sum().round(2)
+        beat = {m: int((team_points < team_points[m]).sum()) for m in managers}
+
+        for m in managers:
+            tp, op = float(team_points[m]), float(team_points[opponent[m]])
+            is_playoffs = int(week > reg_weeks and seeds[m] <= PLAYOFF_TEAMS)
+            matchup_rows.append({
+                "week": week, "year": year, "manager": m, "team_name": team_names[m], "team_points": tp,
+                "opponent": opponent[m], "opponent_points": op, "win": int(tp > op), "loss": int(tp < op),
+                "teams_beat_this_week": beat[m], "opponent_teams_beat_this_week": beat[opponent[m]],
+                "is_playoffs": is_playoffs, "is_consolation": int(week > reg_weeks and not is_playoffs),
+            })
+            if week <= reg_weeks:
+                wins[m] += int(tp > op)
+                points_for[m] += tp
+        if week <= reg_weeks:
+            ranked = sorted(managers, key=lambda m: (-wins[m], -points_for[m]))
+            seeds = {m: i + 1 for i, m in enumerate(ranked)}
+        for row in matchup_rows[-len(managers):]:
+            row["playoff_seed_to_date"] = seeds[row["manager"]]
+
+        week_players = pool[["player", "player_id", "nfl_position", "nfl_team"]].copy()
+        week_players["year"] = year
+        week_players["week"] = week
+        week_players["points"] = points
+        week_players["manager"] = [owner.get(i, UNROSTERED) for i in pool.index]
+        week_players["fantasy_position"] = [slots.get(i, "") for i in pool.index]
+        week_players["opponent"] = week_players["manager"].map(opponent).fillna("")
+        week_players["team_points"] = week_players["manager"].map(team_points)
+        week_players["is_playoffs"] = (week > reg_weeks) & week_players["manager"].map(seeds).le(PLAYOFF_TEAMS)
+        player_rows.append(week_players)
+
+    matchup = pd.DataFrame(matchup_rows)
+    final_seed = matchup[matchup["week"] == reg_weeks].set_index("manager")["playoff_seed_to_date"]
+    matchup["team_made_playoffs"] = matchup["manager"].map(final_seed <= PLAYOFF_TEAMS).astype(float)
+    matchup["team_got_bye"] = matchup["manager"].map(final_seed <= PLAYOFF_BYES).astype(int)
+    players = pd.concat(player_rows, ignore_index=True)
+    players["is_playoffs"] = players["is_playoffs"].astype(int)
+    return matchup, players, owner
+
+
+def _finish_matchup(matchup, managers, rng):
+    df = matchup.sort_values(["year", "week", "manager"], ignore_index=True)
+    n = len(df)
+    week_key = [df["year"], df["week"]]
+    df["team_projected_points"] = (df["team_points"] + rng.normal(0, 15, n)).round(2)
+    df["opponent_projected_points"] = (df["opponent_points"] + rng.normal(0, 15, n)).round(2)
+    df["margin"] = (df["team_points"] - df["opponent_points"]).round(2)
+    df["total_matchup_score"] = (df["team_points"] + df["opponent_points"]).round(2)
+    df["close_margin"] = (df["margin"].abs() < 10).astype(float)
+    df["weekly_mean"] = df.groupby(week_key)["team_points"].transform("mean")
+    df["weekly_median"] = df.groupby(week_key)["team_points"].transform("median")
+    df["league_weekly_mean"] = df["weekly_mean"]
+    df["league_weekly_median"] = df["weekly_median"]
+    df["above_league_median"] = (df["team_points"] > df["weekly_median"]).astype(int)
+    df["below_league_median"] = (df["team_points"] < df["weekly_median"]).astype(int)
+    df["proj_wins"] = (df["team_projected_points"] > df["opponent_projected_points"]).astype(int)
+    df["proj_losses"] = 1 - df["proj_wins"]
+
+    season = [df["manager"], df["year"]]
+    regular = (df["is_playoffs"] == 0) & (df["is_consolation"] == 0)
+    df["wins_to_date"] = df["win"].where(regular, 0).groupby(season).cumsum()
+    df["losses_to_date"] = df["loss"].where(regular, 0).groupby(season).cumsum()
+    df["points_scored_to_date"] = df["team_points"].where(regular, 0).groupby(season).cumsum()
+    df["cumulative_week"] = df.groupby(week_key).ngroup() + 1
+    for key, col in (("manager_week", "manager"), ("opponent_week", "opponent")):
+        df[key] = df[col].str.replace(" ", "") + df["cumulative_week"].astype(str)
+    for key, col in (("manager_year", "manager"), ("opponent_year", "opponent")):
+        df[key] = df[col].str.replace(" ", "") + df["year"].astype(str)
+
+    columns = {}
+    for m in managers:
+        name = m.lower().replace(" ", "")
+        vs = df["opponent"] == m
+        columns[f"w_vs_{name}"] = (df["win"] * vs).astype(int)
+        columns[f"l_vs_{name}"] = (df["loss"] * vs).astype(int)
+    for m in managers:
+        name = m.lower().replace(" ", "")
+        columns[f"w_vs_{name}_sched"] = rng.integers(0, 2, n)
+        columns[f"l_vs_{name}_sched"] = 1 - columns[f"w_vs_{name}_sched"]
+    for col in MATCHUP_FLOAT_FILL:
+        columns[col] = rng.random(n).round(4)
+    for col in MATCHUP_FLAG_FILL:
+        columns[col] = rng.integers(0, 2, n)
+    for col in MATCHUP_COUNT_FILL:
+        columns[col] = rng.integers(0, 6, n)
+    for col in MATCHUP_TEXT_FILL:
+        columns[col] = ""
+    columns["_original_win"] = df["win"]
+    columns["_original_loss"] = df["loss"]
+    columns["win_eff"] = df["win"]
+    columns["loss_eff"] = df["loss"]
+    for k in range(1, len(managers) + 1):
+        columns[f"x{k}_seed"] = rng.random(n).round(4)
+        columns[f"shuffle_{k}_seed"] = rng.random(n).round(4)
+    for k in range(0, max(regular_weeks(y) for y in df["year"].unique()) + 1):
+        columns[f"x{k}_win"] = rng.random(n).round(4)
+        columns[f"shuffle_{k}_win"] = rng.random(n).round(4)
+    return pd.concat([df, pd.DataFrame(columns)], axis=1)
+
+
+def _finish_players(players, seasons_owner, rng):
+    df = players.sort_values(["year", "week", "player"], ignore_index=True)
+    n = len(df)
+    for pos, cols in PLAYER_STATS.items():
+        producing = df["nfl_position"].isin([p for p, sources in STAT_SOURCES.items() if pos in sources])
+        for col in cols:
+            df[col] = np.where(producing, rng.gamma(1.5, 4.0, n).round(1), 0.0)
+    df["yahoo_position"] = df["nfl_position"]
+    df["owner"] = df["manager"]
+    df["team"] = df["manager"]
+    df["started"] = (~df["fantasy_position"].isin(["", "BN"])).astype(int)
+    df["benched"] = (df["fantasy_position"] == "BN").astype(int)
+    df["IR"] = 0
+    df["optimal_player"] = rng.integers(0, 2, n)
+    df["league_wide_optimal_player"] = (rng.random(n) < 0.02).astype(int)
+    df["headshot_url"] = ""
+    df["cumulative_week"] = df.groupby(["year", "week"]).ngroup() + 1
+    df["rolling_point_total"] = df.groupby(["player", "year"])["points"].cumsum().round(2)
+    df["cumulative_avg"] = (df["rolling_point_total"] / (df.groupby(["player", "year"]).cumcount() + 1)).round(2)
+    df["season_ppg"] = df.groupby(["player", "year"])["points"].transform("mean").round(2)
+    names = np.where(df["manager"] < df["opponent"], df["manager"], df["opponent"])
+    others = np.where(df["manager"] < df["opponent"], df["opponent"], df["manager"])
+    df["team_1"] = names
+    df["team_2"] = others
+    df["matchup_name"] = np.where(df["opponent"] != "", pd.Series(names) + " vs. " + pd.Series(others), "")
+
+    # Keeper inputs: season totals joined back onto each week
+    season_points = df.groupby(["player", "year"])["points"].agg(["mean", "sum"]).reset_index()
+    nxt = season_points.assign(year=season_points["year"] - 1).rename(
+        columns={"mean": "avg_points_next_year", "sum": "total_points_next_year"})
+    df = df.merge(season_points.rename(columns={"mean": "avg_points_this_year"})[
+        ["player", "year", "avg_points_this_year"]], on=["player", "year"], how="left")
+    df = df.merge(nxt, on=["player", "year"], how="left")
+    df["cost"] = np.where(df["manager"] != UNROSTERED, rng.integers(1, 60, len(df)), 0)
+    df["keeper_price"] = df["cost"] + 5
+    df["avg_cost_next_year"] = df["cost"] * 1.1
+    df["faab_bid"] = 0
+    df["is_keeper_status"] = 0
+    df["Is Keeper Status"] = 0
+    df["kept_next_year"] = (rng.random(len(df)) < 0.05).astype(int)
+    return df
+
+
+def _schedule(matchup):
+    df = matchup[["is_playoffs", "is_consolation", "manager", "team_name", "manager_week", "manager_year",
+                  "opponent", "opponent_week", "opponent_year", "week", "year", "team_points",
+                  "opponent_points", "cumulative_week"]]
+    return df.rename(columns={"opponent_points": "opponent_score"})
+
+
+def _draft(pool, seasons_owner, rng):
+    rows = []
+    for year, owner in seasons_owner.items():
+        picks = sorted(owner, key=lambda i: -pool.loc[i, "talent"])
+        for pick, idx in enumerate(picks, start=1):
+            player = pool.loc[idx]
+            cost = float(max(1, round(70 * np.exp(-pick / 40) + rng.normal(0, 3))))
+            keeper = float(rng.random() < 0.08)
+            rows.append({
+                "year": year, "pick": float(pick), "round": float((pick - 1) // len(set(owner.values())) + 1),
+                "team_key": f"nfl.l.{year}.t.{owner[idx]}", "manager": owner[idx],
+                "player_id": int(player["player_id"]), "cost": cost, "player_name": player["player"],
+                "primary_position": player["nfl_position"], "avg_pick": str(pick), "avg_round": "",
+                "avg_cost": str(cost), "percent_drafted": "100", "is_keeper_status": keeper,
+                "is_keeper_cost": cost if keeper else np.nan, "savings": 0.0,
+                "player_year": player["player"].replace(" ", "") + str(year),
+                "manager_year": owner[idx].replace(" ", "") + str(year), "nfl_team": player["nfl_team"],
+            })
+    draft = pd.DataFrame(rows)
+    draft["cost_bucket"] = draft.groupby(["year", "primary_position"])["cost"].rank(
+        ascending=False, method="first").floordiv(3).add(1)
+    return draft
+
+
+def _transactions(players, rng, per_week=6):
+    rostered = players[players["manager"] != UNROSTERED]
+    sample = rostered.groupby(["year", "week"]).sample(n=per_week, random_state=int(rng.integers(1 << 31)))
+    sample = sample.sort_values(["year", "week"], ignore_index=True)
+    n = len(sample)
+    kind = rng.choice(["add", "drop", "trade"], size=n, p=[0.45, 0.45, 0.1])
+    start = pd.to_datetime(sample["year"].astype(str) + "-09-01") + pd.to_timedelta(sample["week"] - 1, unit="W")
+    manager = sample["manager"].str.replace(" ", "")
+    player = sample["player"].str.replace(" ", "")
+    df = pd.DataFrame({
+        "transaction_id": sample["year"].astype(str) + ".tr." + pd.Series(np.arange(1, n + 1)).astype(str),
+        "manager": sample["manager"], "player_name": sample["player"],
+        "faab_bid": np.where(kind == "add", rng.integers(0, 40, n), 0), "week": sample["week"],
+        "year": sample["year"], "cumulative_week": sample["cumulative_week"],
+        "week_start": start, "week_end": start + pd.Timedelta(days=6),
+        "trader_team_key": "", "tradee_team_key": "", "transaction_type": kind,
+        "source_type": np.where(kind == "add", "freeagents", "team"),
+        "destination": np.where(kind == "drop", "waivers", "team"), "status": "successful",
+        "human_readable_timestamp": start.dt.strftime("%Y-%m-%d"),
+        "manager_week": manager + sample["cumulative_week"].astype(str),
+        "manager_year": manager + sample["year"].astype(str),
+        "player_week": player + sample["cumulative_week"].astype(str),
+        "player_year": player + sample["year"].astype(str),
+    })
+    return df.astype({"week_start": "datetime64[ns]", "week_end": "datetime64[ns]"})
+
+
+def _injuries(players, rng, rate=0.04):
+    sample = players[rng.random(len(players)) < rate]
+    first_last = sample["player"].str.split(" ", n=1)
+    statuses = ["Questionable", "Doubtful", "Out"]
+    return pd.DataFrame({
+        "year": sample["year"].to_numpy(), "game_type": "REG", "nfl_team": sample["nfl_team"].to_numpy(),
+        "week": sample["week"].to_numpy(), "gsis_id": sample["player_id"].astype(str).to_numpy(),
+        "position": sample["nfl_position"].to_numpy(), "full_name": sample["player"].to_numpy(),
+        "first_name": first_last.str[0].to_numpy(), "last_name": first_last.str[1].to_numpy(),
+        "report_primary_injury": rng.choice(["Knee", "Ankle", "Hamstring", "Concussion"], len(sample)),
+        "report_secondary_injury": "", "report_status": rng.choice(statuses, len(sample)),
+        "practice_primary_injury": "", "practice_secondary_injury": "",
+        "practice_status": rng.choice(["Full", "Limited", "Did Not Participate"], len(sample)),
+        "date_modified": pd.Timestamp("2020-01-01").as_unit("ns"), "cumulative_week": sample["cumulative_week"].to_numpy(),
+        "player_week": (sample["player"].str.replace(" ", "") + sample["cumulative_week"].astype(str)).to_numpy(),
+        "player_year": (sample["player"].str.replace(" ", "") + sample["year"].astype(str)).to_numpy(),
+    })
+
+
+def generate_league(seasons=12, managers=10, players=800, start_year=2014, seed=0):
+    """
+    All six exports as {file stem: DataFrame}: matchup, player, schedule, transactions, draft, injury.
+    managers must be even so every week pairs up.
+    """
+    if managers % 2 or managers < PLAYOFF_TEAMS:
+        raise ValueError(f"managers must be even and at least {PLAYOFF_TEAMS}")
+    rng = np.random.default_rng(seed)
+    names = [f"Manager {i + 1:02d}" for i in range(managers)]
+    team_names = {m: f"Team {m.split()[-1]}" for m in names}
+    pool = _player_pool(players, rng)
+
+    matchups, weekly, owners = [], [], {}
+    for year in range(start_year, start_year + seasons):
+        matchup, season_players, owner = _season(year, pool, names, team_names, rng)
+        matchups.append(matchup)
+        weekly.append(season_players)
+        owners[year] = owner
+
+    matchup = _finish_matchup(pd.concat(matchups, ignore_index=True), names, rng)
+    player = _finish_players(pd.concat(weekly, ignore_index=True), owners, rng)
+    return {
+        "matchup": matchup,
+        "player": player,
+        "schedule": _schedule(matchup),
+        "transactions": _transactions(player, rng),
+        "draft": _draft(pool, owners, rng),
+        "injury": _injuries(player, rng),
+    }
+
+
+def write_league(tables, out_dir, partition_player=False):
+    """
+    Write the exports as <out_dir>/<stem>.parquet, or player/year=YYYY/ partitions with partition_player.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stem, df in tables.items():
+        if stem == "player" and partition_player:
+            for year, season in df.groupby("year"):
+                folder = out_dir / stem / f"year={year}"
+                folder.mkdir(parents=True, exist_ok=True)
+                season.drop(columns="year").to_parquet(folder / "part-0.parquet", index=False)
+        else:
+            df.to_parquet(out_dir / f"{stem}.parquet", index=False)
+    return out_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic KMFFL parquet exports.")
+    parser.add_argument("--out", required=True, help="Directory to write the parquet files to")
+    parser.add_argument("--seasons", type=int, default=12)
+    parser.add_argument("--managers", type=int, default=10)
+    parser.add_argument("--players", type=int, default=800)
+    parser.add_argument("--start-year", type=int, default=2014)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--partition-player", action="store_true", help="Write player as year=YYYY partitions")
+    args = parser.parse_args(argv)
+
+    tables = generate_league(args.seasons, args.managers, args.players, args.start_year, args.seed)
+    out_dir = write_league(tables, args.out, args.partition_player)
+    for stem, df in tables.items():
+        print(f"{stem:<13} {len(df):>9,} rows x {df.shape[1]} columns")
+    print(f"Written to {out_dir.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
 import sys
+from collections import ChainMap
 from pathlib import Path
 from typing import Dict, Optional, Callable, Any
 
@@ -21,18 +22,14 @@ REPO_ROOT = _resolve_repo_root()
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from streamlit_ui.tabs.matchup_data_and_simulations.matchups.matchup_overview import display_matchup_overview
-from streamlit_ui.tabs.keepers.keepers_home import KeeperDataViewer
-from streamlit_ui.tabs.matchup_data_and_simulations.simulation_home import display_simulations_viewer
-from streamlit_ui.tabs.player_stats.weekly_player_stats_overview import StreamlitWeeklyPlayerDataViewer
-from streamlit_ui.tabs.player_stats.season_player_stats_overview import StreamlitSeasonPlayerDataViewer
-from streamlit_ui.tabs.player_stats.career_player_stats_overview import StreamlitCareerPlayerDataViewer
-from streamlit_ui.tabs.draft_data.draft_data_overview import display_draft_data_overview
-from streamlit_ui.tabs.injury_data.injury_overview import display_injury_overview
-from streamlit_ui.tabs.transactions.transactions_adds_drops_trades_overview import AllTransactionsViewer
-from streamlit_ui.tabs.team_names.team_names import display_team_names
-from streamlit_ui.tabs.homepage.homepage_overview import display_homepage_overview
-from streamlit_ui.tabs.graphs.graphs_overview import display_graphs_overview
+from streamlit_ui.tabs.diagnostics.diagnostics_panel import diagnostics_requested, display_diagnostics_panel
+from streamlit_ui.data.aggregates import AGGREGATE_KEYS, materialize_aggregates
+from streamlit_ui.data.league_data import LeagueData
+from streamlit_ui.data.parquet_store import duckdb_database, source_exists, source_signature, sync_parquet
+from streamlit_ui.data.query_service import get_duckdb_connection
+from streamlit_ui.data.season_metadata import season_metadata_for
+from streamlit_ui.data.timings import row_count, timed
+from streamlit_ui.tabs.tab_registry import lazy_tabs, tab_is_open, tab_module
 
 DATA_DIR = Path(os.getenv("KMFFL_DATA_DIR", APP_DIR)).resolve()
 FILE_MAP: Dict[str, Path] = {
@@ -44,99 +41,79 @@ FILE_MAP: Dict[str, Path] = {
     "Injury Data": DATA_DIR / "injury.parquet",
 }
 
-@st.cache_resource
-def get_duckdb_connection():
-    return duckdb.connect(database=":memory:")
-
-def load_parquet_duckdb(con: duckdb.DuckDBPyConnection, path: Path, table_name: str) -> None:
-    safe_path = str(path).replace("'", "''")
-    con.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM read_parquet('{safe_path}')")
+def load_parquet_duckdb(con: duckdb.DuckDBPyConnection, path: Path, table_name: str) -> bool:
+    # Views over the parquet in memory; with KMFFL_DUCKDB_FILE, tables re-ingested only when the file changed
+    return sync_parquet(con, path, table_name, persistent=duckdb_database() != ":memory:")
 
 @st.cache_data(show_spinner=False)
-def load_all_dfs(file_map: Dict[str, Path], _con: duckdb.DuckDBPyConnection) -> Dict[str, Optional[Any]]:
+def load_all_dfs(file_map: Dict[str, Path], _con: duckdb.DuckDBPyConnection,
+                 signature: tuple = ()) -> Dict[str, Optional[Any]]:
+    # `signature` is a stat of every source and weekly delta, so new files trigger a re-sync
     tables = {}
     for key, path in file_map.items():
-        if not path.exists():
+        if not source_exists(path):
             st.warning(f"{key}: File not found at {path}")
             tables[key] = None
             continue
         try:
             table_name = key.lower().replace(" ", "_")
-            load_parquet_duckdb(_con, path, table_name)
-            row_count = _con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
-            st.success(f"{key}: Loaded {row_count:,} rows into DuckDB")
+            with timed("load", key) as record:
+                reloaded = load_parquet_duckdb(_con, path, table_name)
+                rows = _con.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+                record.update(rows_out=rows, reloaded=reloaded)
+            if reloaded:
+                st.success(f"{key}: Loaded {rows:,} rows into DuckDB")
+            else:
+                st.success(f"{key}: {rows:,} rows unchanged since last load")
             tables[key] = table_name
         except Exception as e:
             st.error(f"{key}: Failed to load - {type(e).__name__}: {e}")
             tables[key] = None
-    return tables
 
-def query_to_df(con: duckdb.DuckDBPyConnection, query: str):
-    return con.execute(query).df()
+    # Season and career rollups the viewers read instead of re-aggregating weekly rows
+    try:
+        with timed("load", "aggregates"):
+            tables.update(materialize_aggregates(_con, tables))
+    except Exception as e:
+        st.error(f"Aggregates: Failed to build - {type(e).__name__}: {e}")
+        tables.update(dict.fromkeys(AGGREGATE_KEYS))
+    return tables
 
 def safe_render(title: str, fn: Callable[..., Any], *args, **kwargs) -> None:
     try:
-        fn(*args, **kwargs)
+        with timed("render", title, rows_in=row_count(*args, *kwargs.values())):
+            fn(*args, **kwargs)
     except Exception as e:
         st.error(f"❌ {title} crashed: {type(e).__name__}: {e}")
         st.exception(e)
 
-def main() -> None:
-    st.set_page_config(page_title="KMFFL App", layout="wide")
-    st.title("KMFFL App")
-
-    con = get_duckdb_connection()
-    tables = load_all_dfs(FILE_MAP, con)
-
-    # REMOVE enforce_minimum_schema call
-
-    df_dict = {}
-    for key, table_name in tables.items():
-        if table_name:
-            df_dict[key] = query_to_df(con, f"SELECT * FROM {table_name}")
-        else:
-            df_dict[key] = None
-
-    available = {k for k, v in df_dict.items() if v is not None}
-
-    tabs = st.tabs(["Home", "Managers", "Players", "Draft", "Transactions", "Simulations", "Extras"])
-
-    with tabs[0]:
-        if "Matchup Data" in available:
-            safe_render("Home", display_homepage_overview, df_dict)
-        else:
-            st.warning("Home requires matchup.parquet")
-
-    with tabs[1]:
-        if "Matchup Data" in available:
-            safe_render("Managers", display_matchup_overview, df_dict)
-        else:
-            st.warning("Managers requires matchup.parquet")
-
-    with tabs[2]:
-        sub_tabs = st.tabs(["Stats", "Injuries"])
+def render_players_tab(data: LeagueData) -> None:
+    available = data.available
+    sub_tabs = lazy_tabs(["Stats", "Injuries"], key="players_tabs")
+    if tab_is_open(sub_tabs[0]):
         with sub_tabs[0]:
-            player_data = df_dict.get("Player Data")
-            matchup_data = df_dict.get("Matchup Data")
-            stats_tabs = st.tabs(["Weekly", "Season", "Career"])
-            with stats_tabs[0]:
-                if player_data is not None and matchup_data is not None:
-                    safe_render("Weekly", StreamlitWeeklyPlayerDataViewer(player_data, matchup_data).display)
-                else:
-                    st.warning("Weekly stats need player.parquet and matchup.parquet")
-            with stats_tabs[1]:
-                if player_data is not None and matchup_data is not None:
-                    safe_render("Season", StreamlitSeasonPlayerDataViewer(player_data, matchup_data).display)
-                else:
-                    st.warning("Season stats need player.parquet and matchup.parquet")
-            with stats_tabs[2]:
-                if player_data is not None and matchup_data is not None:
-                    safe_render("Career", StreamlitCareerPlayerDataViewer(player_data, matchup_data).display)
-                else:
-                    st.warning("Career stats need player.parquet and matchup.parquet")
+            stats_tabs = lazy_tabs(["Weekly", "Season", "Career"], key="player_stats_tabs")
+            viewers = {
+                "Weekly": "StreamlitWeeklyPlayerDataViewer",
+                "Season": "StreamlitSeasonPlayerDataViewer",
+                "Career": "StreamlitCareerPlayerDataViewer",
+            }
+            for tab, (name, viewer) in zip(stats_tabs, viewers.items()):
+                if not tab_is_open(tab):
+                    continue
+                with tab:
+                    if {"Player Data", "Matchup Data"}.issubset(available):
+                        viewer_cls = getattr(tab_module(name), viewer)
+                        args = [data["Player Data"], data["Matchup Data"]]
+                        if name == "Career":
+                            args += [data.get("Player Seasons"), data.get("Player Careers")]
+                        safe_render(name, viewer_cls(*args).display)
+                    else:
+                        st.warning(f"{name} stats need player.parquet and matchup.parquet")
+    if tab_is_open(sub_tabs[1]):
         with sub_tabs[1]:
-            injury_ready = df_dict.get("Injury Data")
-            player_ready = df_dict.get("Player Data")
+            injury_ready = data.get("Injury Data")
+            player_ready = data.get("Player Data")
             if injury_ready is not None and player_ready is not None:
                 if "player" not in injury_ready.columns and "full_name" in injury_ready.columns:
                     injury_ready = injury_ready.rename(columns={"full_name": "player"})
@@ -145,52 +122,102 @@ def main() -> None:
                 if "player" in player_ready.columns:
                     player_ready["player"] = player_ready["player"].astype(str).str.strip()
 
-                prepared = {
-                    **df_dict,
+                prepared = ChainMap({
                     "Injury Data": injury_ready,
                     "Player Data": player_ready,
-                }
-                safe_render("Injuries", display_injury_overview, prepared)
+                }, data)
+                safe_render("Injuries", tab_module("Injuries").display_injury_overview, prepared)
             else:
                 st.info("Injuries need injury.parquet and player.parquet")
 
-    with tabs[3]:
-        if "Draft History" in available:
-            safe_render("Draft", display_draft_data_overview, df_dict)
-        else:
-            st.info("Draft requires draft.parquet")
-
-    with tabs[4]:
-        needs = {"All Transactions", "Player Data", "Injury Data", "Draft History"}
-        if needs.issubset(available):
-            safe_render("Transactions", AllTransactionsViewer(
-                df_dict["All Transactions"], df_dict["Player Data"],
-                df_dict["Injury Data"], df_dict["Draft History"]
-            ).display)
-        else:
-            st.info("Transactions need transactions.parquet, player.parquet, injury.parquet, and draft.parquet")
-
-    with tabs[5]:
-        st.header("Simulations")
-        if {"Matchup Data", "Player Data"}.issubset(available):
-            safe_render("Simulations", display_simulations_viewer,
-                        df_dict["Matchup Data"], df_dict["Player Data"])
-        else:
-            st.info("Simulations need matchup.parquet and player.parquet")
-
-    with tabs[6]:
-        extras_tabs = st.tabs(["Graphs", "Keeper", "Team Names"])
+def render_extras_tab(data: LeagueData) -> None:
+    extras_tabs = lazy_tabs(["Graphs", "Keeper", "Team Names"], key="extras_tabs")
+    if tab_is_open(extras_tabs[0]):
         with extras_tabs[0]:
-            if df_dict:
-                safe_render("Graphs", display_graphs_overview, df_dict)
+            if data:
+                safe_render("Graphs", tab_module("Graphs").display_graphs_overview, data)
+    if tab_is_open(extras_tabs[1]):
         with extras_tabs[1]:
             st.header("Keeper")
-            if "Player Data" in available:
-                safe_render("Keeper", KeeperDataViewer(df_dict["Player Data"]).display)
+            if "Player Data" in data.available:
+                keepers = tab_module("Keeper")
+                safe_render("Keeper", keepers.KeeperDataViewer(data.select(keepers.KEEPER_COLUMNS)["Player Data"]).display)
             else:
                 st.info("Keeper requires player.parquet")
+    if tab_is_open(extras_tabs[2]):
         with extras_tabs[2]:
-            safe_render("Team Names", display_team_names, df_dict.get("Matchup Data"))
+            safe_render("Team Names", tab_module("Team Names").display_team_names, data.get("Matchup Data"))
+
+def main() -> None:
+    st.set_page_config(page_title="KMFFL App", layout="wide")
+    st.title("KMFFL App")
+
+    con = get_duckdb_connection()
+    with timed("load", "load_all_dfs"):
+        tables = load_all_dfs(FILE_MAP, con, source_signature(FILE_MAP.values()))
+
+    # REMOVE enforce_minimum_schema call
+
+    # Tables are only pulled into pandas when a tab first asks for them
+    data = LeagueData(tables)
+    available = data.available
+
+    # Only the open tab runs, and a tab's module is imported the first time it is opened
+    tabs = lazy_tabs(["Home", "Managers", "Players", "Draft", "Transactions", "Simulations", "Extras"], key="main_tabs")
+
+    if tab_is_open(tabs[0]):
+        with tabs[0]:
+            if "Matchup Data" in available:
+                safe_render("Home", tab_module("Home").display_homepage_overview, data)
+            else:
+                st.warning("Home requires matchup.parquet")
+
+    if tab_is_open(tabs[1]):
+        with tabs[1]:
+            if "Matchup Data" in available:
+                safe_render("Managers", tab_module("Managers").display_matchup_overview, data)
+            else:
+                st.warning("Managers requires matchup.parquet")
+
+    if tab_is_open(tabs[2]):
+        with tabs[2]:
+            render_players_tab(data)
+
+    if tab_is_open(tabs[3]):
+        with tabs[3]:
+            if "Draft History" in available:
+                safe_render("Draft", tab_module("Draft").display_draft_data_overview, data)
+            else:
+                st.info("Draft requires draft.parquet")
+
+    if tab_is_open(tabs[4]):
+        with tabs[4]:
+            needs = {"All Transactions", "Player Data", "Injury Data", "Draft History"}
+            if needs.issubset(available):
+                safe_render("Transactions", tab_module("Transactions").AllTransactionsViewer(
+                    data["All Transactions"], data["Player Data"],
+                    data["Injury Data"], data["Draft History"], season_metadata_for(data)
+                ).display)
+            else:
+                st.info("Transactions need transactions.parquet, player.parquet, injury.parquet, and draft.parquet")
+
+    if tab_is_open(tabs[5]):
+        with tabs[5]:
+            st.header("Simulations")
+            if {"Matchup Data", "Player Data"}.issubset(available):
+                simulations = tab_module("Simulations")
+                sim_data = data.select(simulations.SIMULATION_COLUMNS)
+                safe_render("Simulations", simulations.display_simulations_viewer,
+                            sim_data["Matchup Data"], sim_data["Player Data"], sim_data.get("Schedules"))
+            else:
+                st.info("Simulations need matchup.parquet and player.parquet")
+
+    if tab_is_open(tabs[6]):
+        with tabs[6]:
+            render_extras_tab(data)
+
+    if diagnostics_requested():
+        display_diagnostics_panel()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
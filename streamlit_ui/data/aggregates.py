@@ -0,0 +1,317 @@
+from itertools import combinations
+from typing import Dict, List, Optional
+
+import duckdb
+
+from streamlit_ui.data.parquet_store import link_sources, table_version
+from streamlit_ui.data.query_service import quote_ident
+
+# Records the source version each aggregate table was built from, so a persistent database
+# only rebuilds them when matchup, player or schedule data changed
+AGGREGATES_TABLE = "_kmffl_aggregates"
+
+MANAGER_SEASONS = "manager_seasons"
+MANAGER_CAREERS = "manager_careers"
+PLAYER_SEASONS = "player_seasons"
+PLAYER_CAREERS = "player_careers"
+PLAYER_SEASON_POINTS = "player_season_points"
+SEASON_METADATA = "season_metadata"
+
+# LeagueData keys for the aggregate tables
+AGGREGATE_KEYS: Dict[str, str] = {
+    "Manager Seasons": MANAGER_SEASONS,
+    "Manager Careers": MANAGER_CAREERS,
+    "Player Seasons": PLAYER_SEASONS,
+    "Player Careers": PLAYER_CAREERS,
+    "Player Season Points": PLAYER_SEASON_POINTS,
+    "Season Metadata": SEASON_METADATA,
+}
+
+# The Regular Season / Playoffs / Consolation checkboxes; manager rows are aggregated once for
+# every combination and labelled in `game_types` (see game_selection)
+GAME_TYPES = {
+    "regular_season": "is_playoffs = 0 AND is_consolation = 0",
+    "playoffs": "is_playoffs = 1",
+    "consolation": "is_consolation = 1",
+}
+# Season standings leave out consolation games, which also carry is_playoffs = 1
+NO_CONSOLATION = "no_consolation"
+
+# Weekly matchup columns -> season rule, mirroring CareerTeamRatingsViewer
+SEASON_SUM = ["win", "loss"]
+SEASON_MEAN = [
+    "team_points", "opponent_points", "power_rating", "power rating", "exp_final_wins", "avg_seed",
+    "p_playoffs", "p_bye", "p_semis", "p_final", "p_champ", "shuffle_1_seed",
+]
+SEASON_LAST = [
+    "Final Playoff Seed", "x1_seed", "shuffle_avg_wins", "wins_vs_shuffle_wins",
+    "shuffle_avg_playoffs", "shuffle_avg_bye", "shuffle_avg_seed", "seed_vs_shuffle_seed",
+]
+# ...and the totals SeasonStandingsViewer needs
+STANDINGS_SUM = ["is_playoffs", "quarterfinal", "semifinal", "championship", "champion"]
+STANDINGS_FIRST = ["team_name", "playoff_seed_to_date"]
+
+# Season rows -> career rule
+CAREER_SUM = ["win", "loss", "wins_vs_shuffle_wins", "seed_vs_shuffle_seed"]
+CAREER_MEAN = [
+    "team_points", "opponent_points", "power_rating", "power rating", "exp_final_wins", "avg_seed",
+    "p_playoffs", "p_bye", "p_semis", "p_final", "p_champ", "Final Playoff Seed",
+    "shuffle_avg_wins", "shuffle_avg_playoffs", "shuffle_avg_bye", "shuffle_avg_seed", "shuffle_1_seed",
+]
+
+# Player rows are grouped by these (and year, for seasons); every other numeric column is summed
+PLAYER_GRAIN = ["player", "nfl_position", "manager", "started"]
+# Columns the player aggregates are built from
+PLAYER_KEYS = {"year", "week", "player", "nfl_position", "manager", "fantasy_position"}
+# Averaged across weeks (stored as a sum plus a "<column> weeks" count of non-null values)
+PLAYER_MEAN = ["FG%"]
+# Taken from a player's earliest week (with "<column> seen" = year * 100 + week)
+PLAYER_FIRST = ["nfl_team", "owner"]
+STARTED = "fantasy_position IS NOT NULL AND fantasy_position NOT IN ('BN', 'IR')"
+
+# Season metadata comes from the schedule, with the matchup rows filling in seasons it lacks
+SEASON_METADATA_KEYS = {"year", "week", "manager", "is_playoffs", "is_consolation"}
+SEASON_METADATA_SOURCES = ["Schedules", "Matchup Data"]
+
+# Player-season points index the draft views join drafted players against: points and weeks
+# within the season (through its last playoff week) per player and year
+SEASON_POINTS_KEYS = {"player", "year", "week", "points"}
+SEASON_POINTS_FIRST = ["yahoo_position", "ppg_season"]
+
+NUMERIC_TYPES = ("TINYINT", "SMALLINT", "INTEGER", "BIGINT", "HUGEINT", "UTINYINT", "USMALLINT",
+                 "UINTEGER", "UBIGINT", "FLOAT", "DOUBLE", "DECIMAL")
+
+
+def game_selection(regular_season: bool, playoffs: bool, consolation: bool) -> str:
+    """
+    `game_types` label of the manager rows matching the game-type checkboxes; none ticked means all games.
+    """
+    chosen = [name for name, ticked in zip(GAME_TYPES, (regular_season, playoffs, consolation)) if ticked]
+    return "+".join(chosen or GAME_TYPES)
+
+
+def _game_selections() -> Dict[str, str]:
+    selections = {}
+    names = list(GAME_TYPES)
+    for size in range(1, len(names) + 1):
+        for chosen in combinations(names, size):
+            selections["+".join(chosen)] = " OR ".join(f"({GAME_TYPES[n]})" for n in chosen)
+    selections[NO_CONSOLATION] = "is_consolation IS DISTINCT FROM 1"
+    return selections
+
+
+def _column_types(con: duckdb.DuckDBPyConnection, table_name: str) -> Dict[str, str]:
+    return {row[0]: row[1] for row in con.execute(f"DESCRIBE {table_name}").fetchall()}
+
+
+def _manager_seasons_sql(source: str, present: set) -> str:
+    q = quote_ident
+    aggs = ["count(*) AS games", "count(*) FILTER (WHERE win = 1) AS wins"]
+    aggs += [f"coalesce(sum({q(c)}), 0) AS {q(c)}" for c in SEASON_SUM + STANDINGS_SUM if c in present]
+    aggs += [f"coalesce(sum({q(c)}), 0) AS {q(c + ' total')}" for c in ("team_points", "opponent_points")
+             if c in present]
+    aggs += [f"avg({q(c)}) AS {q(c)}" for c in SEASON_MEAN if c in present]
+    aggs += [f"{fn}({q(c)}) AS {q(c)}" for c, fn in (("Winning Streak", "max"), ("Losing Streak", "min"))
+             if c in present]
+    last = {c: c for c in SEASON_LAST if c in present}
+    if "Final Playoff Seed" not in present and "x1_seed" in present:
+        last["Final Playoff Seed"] = "x1_seed"
+    aggs += [f"arg_max({q(src)}, week) FILTER (WHERE {q(src)} IS NOT NULL) AS {q(c)}" for c, src in last.items()]
+    aggs += [f"arg_min({q(c)}, week) FILTER (WHERE {q(c)} IS NOT NULL) AS {q(c)}" for c in STANDINGS_FIRST
+             if c in present]
+    if "sacko" in present:
+        aggs.append("coalesce(bool_or(sacko = 1), false) AS sacko")
+
+    # Each weekly row is counted under every selection it belongs to
+    games = "\nUNION ALL\n".join(
+        f"SELECT '{label}' AS game_types, * FROM {source} WHERE {condition}"
+        for label, condition in _game_selections().items()
+    )
+    return f"""
+        CREATE OR REPLACE TABLE {MANAGER_SEASONS} AS
+        WITH games AS ({games})
+        SELECT game_types, manager, year, {', '.join(aggs)}
+        FROM games
+        GROUP BY game_types, manager, year
+    """
+
+
+def _manager_careers_sql(present: set) -> str:
+    q = quote_ident
+    aggs = ["count(*) AS seasons"]
+    aggs += [f"coalesce(sum({q(c)}), 0) AS {q(c)}" for c in CAREER_SUM if c in present]
+    aggs += [f"avg({q(c)}) AS {q(c)}" for c in CAREER_MEAN if c in present]
+    aggs += [f"{fn}({q(c)}) AS {q(c)}" for c, fn in (("Winning Streak", "max"), ("Losing Streak", "min"))
+             if c in present]
+    return f"""
+        CREATE OR REPLACE TABLE {MANAGER_CAREERS} AS
+        SELECT game_types, manager, {', '.join(aggs)}
+        FROM {MANAGER_SEASONS}
+        GROUP BY game_types, manager
+    """
+
+
+def _player_seasons_sql(source: str, types: Dict[str, str]) -> str:
+    q = quote_ident
+    skip = PLAYER_KEYS | set(PLAYER_GRAIN) | set(PLAYER_FIRST)
+    stats = [c for c, t in types.items() if c not in skip and t.startswith(NUMERIC_TYPES)]
+    aggs = ["count(*) AS weeks"]
+    aggs += [f"sum({q(c)}) AS {q(c)}" for c in stats]
+    aggs += [f"count({q(c)}) AS {q(c + ' weeks')}" for c in PLAYER_MEAN if c in stats]
+    for c in PLAYER_FIRST:
+        if c in types:
+            aggs.append(f"arg_min({q(c)}, week) FILTER (WHERE {q(c)} IS NOT NULL) AS {q(c)}")
+            aggs.append(f"min(year * 100 + week) FILTER (WHERE {q(c)} IS NOT NULL) AS {q(c + ' seen')}")
+    return f"""
+        CREATE OR REPLACE TABLE {PLAYER_SEASONS} AS
+        SELECT year, player, nfl_position, manager, coalesce({STARTED}, false) AS started, {', '.join(aggs)}
+        FROM {source}
+        GROUP BY ALL
+    """
+
+
+def _player_careers_sql(types: Dict[str, str]) -> str:
+    q = quote_ident
+    firsts = [c for c in PLAYER_FIRST if c in types]
+    seen = {c + " seen" for c in firsts}
+    aggs = [f"sum({q(c)}) AS {q(c)}" for c in types
+            if c not in PLAYER_GRAIN and c != "year" and c not in firsts and c not in seen]
+    for c in firsts:
+        aggs.append(f"arg_min({q(c)}, {q(c + ' seen')}) AS {q(c)}")
+        aggs.append(f"min({q(c + ' seen')}) AS {q(c + ' seen')}")
+    return f"""
+        CREATE OR REPLACE TABLE {PLAYER_CAREERS} AS
+        SELECT {', '.join(PLAYER_GRAIN)}, {', '.join(aggs)}
+        FROM {PLAYER_SEASONS}
+        GROUP BY {', '.join(PLAYER_GRAIN)}
+    """
+
+
+def _season_metadata_sql(sources: List[str]) -> str:
+    columns = ", ".join(sorted(SEASON_METADATA_KEYS))
+    # Each source only adds the years the ones before it don't cover
+    games = []
+    for i, source in enumerate(sources):
+        uncovered = " AND ".join(f"year NOT IN (SELECT DISTINCT year FROM {s})" for s in sources[:i])
+        games.append(f"SELECT {columns} FROM {source}" + (f" WHERE {uncovered}" if uncovered else ""))
+    # Seasons still in progress borrow the playoff length of the latest season that has one
+    return f"""
+        CREATE OR REPLACE TABLE {SEASON_METADATA} AS
+        WITH games AS ({' UNION ALL '.join(games)}), seasons AS (
+            SELECT year,
+                   coalesce(max(week) FILTER (WHERE is_playoffs = 0 AND is_consolation = 0), 0) AS regular_weeks,
+                   count(DISTINCT week) FILTER (WHERE is_playoffs = 1 OR is_consolation = 1) AS playoff_weeks,
+                   count(DISTINCT manager) AS league_size
+            FROM games
+            GROUP BY year
+        ), formats AS (
+            SELECT year, regular_weeks, league_size, coalesce(
+                nullif(playoff_weeks, 0),
+                last_value(nullif(playoff_weeks, 0) IGNORE NULLS) OVER (ORDER BY year),
+                0
+            ) AS playoff_weeks
+            FROM seasons
+        )
+        SELECT year, regular_weeks, playoff_weeks, regular_weeks + playoff_weeks AS last_week, league_size
+        FROM formats
+        ORDER BY year
+    """
+
+
+def _player_season_points_sql(source: str, types: Dict[str, str]) -> str:
+    q = quote_ident
+    points = "TRY_CAST(points AS DOUBLE)"
+    aggs = [
+        f"coalesce(sum({points}), 0) AS points",
+        "count(DISTINCT week) AS weeks",
+        # The optimizer's PPG only counts weeks with positive points
+        f"coalesce(sum({points}) FILTER (WHERE {points} > 0), 0) AS positive_points",
+        f"count(DISTINCT week) FILTER (WHERE {points} > 0) AS positive_weeks",
+    ]
+    aggs += [f"arg_min({q(c)}, week) FILTER (WHERE {q(c)} IS NOT NULL) AS {q(c)}" for c in SEASON_POINTS_FIRST
+             if c in types]
+    # Seasons the metadata doesn't cover keep every week
+    return f"""
+        CREATE OR REPLACE TABLE {PLAYER_SEASON_POINTS} AS
+        SELECT player, year, {', '.join(aggs)}
+        FROM {source} LEFT JOIN {SEASON_METADATA} USING (year)
+        WHERE player IS NOT NULL AND week <= coalesce(last_week, week)
+        GROUP BY player, year
+    """
+
+
+def _stored_version(con: duckdb.DuckDBPyConnection, table_name: str) -> Optional[str]:
+    row = con.execute(f"SELECT version FROM {AGGREGATES_TABLE} WHERE table_name = ?", [table_name]).fetchone()
+    return row[0] if row else None
+
+
+def _build(con: duckdb.DuckDBPyConnection, sources: List[str], targets: List[str], build) -> bool:
+    """
+    Run `build` unless every table in `targets` was already built from this version of `sources`.
+    """
+    version = " ".join(repr(table_version(source)) for source in sources)
+    existing = {row[0] for row in con.execute(
+        "SELECT table_name FROM information_schema.tables WHERE table_type = 'BASE TABLE'"
+    ).fetchall()}
+    if all(t in existing and _stored_version(con, t) == version for t in targets):
+        return False
+    build()
+    for t in targets:
+        con.execute(f"INSERT OR REPLACE INTO {AGGREGATES_TABLE} VALUES (?, ?)", [t, version])
+    return True
+
+
+def materialize_aggregates(con: duckdb.DuckDBPyConnection, tables: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """
+    Build the manager-season/career, player-season/career and season metadata tables from the
+    loaded matchup, player and schedule tables, once per version of their sources; returns them by
+    LeagueData key (None when the source table or a column they are grouped by is missing).
+
+    Manager rows are aggregated with CareerTeamRatingsViewer's season rules for every game-type
+    selection; player rows sum every numeric stat per season, manager and started flag. The
+    season metadata holds each year's regular-season and playoff length and league size, and the
+    player-season points index sums points per player and year through the season's last week.
+    """
+    con.execute(f"CREATE TABLE IF NOT EXISTS {AGGREGATES_TABLE} (table_name VARCHAR PRIMARY KEY, version VARCHAR)")
+    built = dict.fromkeys(AGGREGATE_KEYS)
+
+    matchup = tables.get("Matchup Data")
+    if matchup:
+        present = set(_column_types(con, matchup))
+        if {"manager", "year", "week", "win", "is_playoffs", "is_consolation"} <= present:
+            def build_managers():
+                con.execute(_manager_seasons_sql(matchup, present))
+                con.execute(_manager_careers_sql(set(_column_types(con, MANAGER_SEASONS))))
+
+            _build(con, [matchup], [MANAGER_SEASONS, MANAGER_CAREERS], build_managers)
+            link_sources(MANAGER_SEASONS, [matchup])
+            link_sources(MANAGER_CAREERS, [matchup])
+            built.update({"Manager Seasons": MANAGER_SEASONS, "Manager Careers": MANAGER_CAREERS})
+
+    schedules = [tables[key] for key in SEASON_METADATA_SOURCES
+                 if tables.get(key) and SEASON_METADATA_KEYS <= set(_column_types(con, tables[key]))]
+    if schedules:
+        _build(con, schedules, [SEASON_METADATA], lambda: con.execute(_season_metadata_sql(schedules)))
+        link_sources(SEASON_METADATA, schedules)
+        built["Season Metadata"] = SEASON_METADATA
+
+    player = tables.get("Player Data")
+    if player:
+        types = _column_types(con, player)
+        if schedules and SEASON_POINTS_KEYS <= set(types):
+            # Rebuilt when either the player rows or the season lengths change
+            _build(con, [player, SEASON_METADATA], [PLAYER_SEASON_POINTS],
+                   lambda: con.execute(_player_season_points_sql(player, types)))
+            link_sources(PLAYER_SEASON_POINTS, [player, SEASON_METADATA])
+            built["Player Season Points"] = PLAYER_SEASON_POINTS
+
+        if PLAYER_KEYS <= set(types):
+            def build_players():
+                con.execute(_player_seasons_sql(player, types))
+                con.execute(_player_careers_sql(_column_types(con, PLAYER_SEASONS)))
+
+            _build(con, [player], [PLAYER_SEASONS, PLAYER_CAREERS], build_players)
+            link_sources(PLAYER_SEASONS, [player])
+            link_sources(PLAYER_CAREERS, [player])
+            built.update({"Player Seasons": PLAYER_SEASONS, "Player Careers": PLAYER_CAREERS})
+    return built
@@ -0,0 +1,158 @@
+from fnmatch import fnmatchcase
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+import streamlit as st
+
+from streamlit_ui.data.parquet_store import table_version
+from streamlit_ui.data.query_service import QueryService, get_query_service, quote_ident
+from streamlit_ui.data.schema import normalize_frame
+
+# String-heavy exports handed to pandas through Arrow, skipping the object-dtype round trip
+ARROW_STRING_TABLES = frozenset({"Player Data", "All Transactions"})
+
+# Stat-heavy tables whose float columns are held as float32; matchup scores stay float64 so
+# simulated ties match the recorded results exactly
+FLOAT32_TABLES = frozenset({"Player Data"})
+
+
+@st.cache_data(show_spinner=False)
+def _materialize(_service: QueryService, table_name: str, columns: Optional[Tuple[str, ...]] = None,
+                 arrow_strings: bool = False, float32: bool = False, version: Tuple = (),
+                 years: Optional[Tuple[int, ...]] = None) -> pd.DataFrame:
+    # `version` only feeds the cache key, so a weekly delta invalidates just the tables it touched
+    select = "*" if columns is None else ", ".join(quote_ident(c) for c in columns)
+    sql = f"SELECT {select} FROM {table_name}"
+    if years is not None:
+        # Pushed into the scan, so a season-partitioned source only reads the seasons asked for
+        sql += f" WHERE year IN ({', '.join('?' * len(years))})" if years else " WHERE false"
+    params = list(years or [])
+    if arrow_strings:
+        df = _service.query_arrow_df(sql, params, strings_only=True)
+    else:
+        df = _service.query(sql, params)
+    return normalize_frame(df, float32=float32)
+
+
+class LeagueData(Mapping):
+    """
+    Lazy view over the league tables loaded into DuckDB.
+
+    Behaves like the old ``df_dict`` (``data["Matchup Data"]``, ``data.get("Player Data")``),
+    but a table is only pulled into pandas the first time a tab asks for it.
+    Frames come back with compact dtypes (int16 year/week, int8 flags; see ``normalize_frame``).
+    Use ``frame(key, columns, years)`` when a tab only needs a handful of columns or seasons, or
+    ``select(columns_by_key)`` to hand a tab a mapping that only carries what it declared.
+    """
+
+    def __init__(self, tables: Dict[str, Optional[str]], service: Optional[QueryService] = None):
+        self._service = service or get_query_service()
+        self._tables = dict(tables)
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._columns: Dict[str, List[str]] = {}
+
+    @property
+    def available(self) -> set:
+        return {k for k, v in self._tables.items() if v}
+
+    def table_name(self, key: str) -> Optional[str]:
+        return self._tables.get(key)
+
+    def columns(self, key: str) -> List[str]:
+        table_name = self._tables.get(key)
+        if not table_name:
+            return []
+        if key not in self._columns:
+            cur = self._service.execute(f"SELECT * FROM {table_name} LIMIT 0")
+            self._columns[key] = [d[0] for d in cur.description]
+        return self._columns[key]
+
+    def frame(self, key: str, columns: Optional[Sequence[str]] = None,
+              years: Optional[Sequence[int]] = None) -> Optional[pd.DataFrame]:
+        """
+        A table, optionally narrowed to `columns` (globs allowed) and to the seasons in `years`.
+        """
+        table_name = self._tables.get(key)
+        if not table_name:
+            return None
+        if years is not None:
+            years = tuple(sorted({int(y) for y in years}))
+        if columns is None and years is None:
+            if key not in self._frames:
+                self._frames[key] = _materialize(
+                    self._service, table_name, arrow_strings=key in ARROW_STRING_TABLES,
+                    float32=key in FLOAT32_TABLES, version=table_version(table_name)
+                )
+            return self._frames[key]
+
+        # Serve projections and season slices from the full frame when a tab already materialized it
+        present = None if columns is None else self.resolve_columns(key, columns)
+        if key in self._frames:
+            df = self._frames[key]
+            if years is not None:
+                df = df[df["year"].isin(years)]
+            return df if present is None else df[present]
+        return _materialize(
+            self._service, table_name, None if present is None else tuple(present),
+            arrow_strings=key in ARROW_STRING_TABLES, float32=key in FLOAT32_TABLES,
+            version=table_version(table_name), years=years
+        )
+
+    def resolve_columns(self, key: str, columns: Sequence[str]) -> List[str]:
+        """
+        Expand glob patterns such as ``shuffle_*_seed`` against the table, in table order,
+        and drop names the table does not have.
+        """
+        available = self.columns(key)
+        wanted = list(dict.fromkeys(columns))
+        return [c for c in available if any(c == w or fnmatchcase(c, w) for w in wanted)]
+
+    def select(self, columns_by_key: Mapping[str, Sequence[str]]) -> "ProjectedLeagueData":
+        return ProjectedLeagueData(self, columns_by_key)
+
+    def __getitem__(self, key: str) -> Optional[pd.DataFrame]:
+        if key not in self._tables:
+            raise KeyError(key)
+        return self.frame(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._tables
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+
+class ProjectedLeagueData(Mapping):
+    """
+    LeagueData restricted to the columns a tab declared; keys without a declaration load in full.
+    Projections are pushed down to the parquet scan behind each DuckDB view.
+    """
+
+    def __init__(self, data: LeagueData, columns_by_key: Mapping[str, Sequence[str]]):
+        self._data = data
+        self._columns_by_key = dict(columns_by_key)
+
+    @property
+    def available(self) -> set:
+        return self._data.available
+
+    def frame(self, key: str, columns: Optional[Sequence[str]] = None,
+              years: Optional[Sequence[int]] = None) -> Optional[pd.DataFrame]:
+        return self._data.frame(key, columns if columns is not None else self._columns_by_key.get(key), years)
+
+    def __getitem__(self, key: str) -> Optional[pd.DataFrame]:
+        if key not in self._data:
+            raise KeyError(key)
+        return self.frame(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
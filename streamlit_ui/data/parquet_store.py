@@ -0,0 +1,314 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import duckdb
+
+APP_DIR = Path(__file__).resolve().parents[1]
+
+# Bookkeeping table in a persistent database: one fingerprint per ingested parquet file
+SOURCES_TABLE = "_kmffl_sources"
+
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Weekly delta exports live in <data dir>/deltas/<file stem>/
+DELTA_DIR = "deltas"
+
+# Hive-style season partitions: <data dir>/<file stem>/year=YYYY/*.parquet
+PARTITION_KEY = "year"
+
+# Source parquet behind each synced table, for table_version
+_TABLE_SOURCES: Dict[str, List[Path]] = {}
+
+
+def duckdb_database() -> str:
+    """
+    Database the app runs on: ``:memory:`` unless KMFFL_DUCKDB_FILE names a file, which is
+    resolved under KMFFL_DATA_DIR when relative.
+    """
+    name = os.getenv("KMFFL_DUCKDB_FILE")
+    if not name:
+        return ":memory:"
+    path = Path(name)
+    if not path.is_absolute():
+        path = Path(os.getenv("KMFFL_DATA_DIR", APP_DIR)) / path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return str(path.resolve())
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stored_fingerprint(con: duckdb.DuckDBPyConnection, table_name: str) -> Optional[Tuple[int, int, str]]:
+    row = con.execute(
+        f"SELECT size, mtime_ns, sha256 FROM {SOURCES_TABLE} WHERE table_name = ?", [table_name]
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+def _table_exists(con: duckdb.DuckDBPyConnection, table_name: str) -> bool:
+    return con.execute(
+        "SELECT count(*) FROM information_schema.tables WHERE table_name = ? AND table_type = 'BASE TABLE'",
+        [table_name],
+    ).fetchone()[0] > 0
+
+
+def delta_files(path: Path) -> List[Path]:
+    """
+    Weekly delta files for a parquet export, applied in name order:
+    ``<data dir>/deltas/<stem>/*.parquet`` (e.g. ``deltas/matchup/2025_week05.parquet``).
+    Each holds complete replacement rows for the (year, week) pairs it contains.
+    """
+    folder = path.parent / DELTA_DIR / path.stem
+    return sorted(folder.glob("*.parquet")) if folder.is_dir() else []
+
+
+def partition_files(path: Path) -> List[Path]:
+    """
+    Season partitions standing in for a monolithic export, e.g. ``player/year=2024/*.parquet``
+    next to where ``player.parquet`` would be. When present they take precedence over the file.
+    """
+    folder = path.parent / path.stem
+    if not folder.is_dir():
+        return []
+    return sorted(folder.glob(f"{PARTITION_KEY}=*/*.parquet"))
+
+
+def _partition_year(path: Path) -> str:
+    return path.parent.name.split("=", 1)[1]
+
+
+def source_exists(path: Path) -> bool:
+    return path.exists() or bool(partition_files(path))
+
+
+def _quote_path(path: Path) -> str:
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def _scan(path: Path, partitions: List[Path]) -> str:
+    if not partitions:
+        return f"read_parquet({_quote_path(path)})"
+    # Partition values come from the directory names, so `year` filters skip whole seasons
+    files = "[" + ", ".join(_quote_path(f) for f in partitions) + "]"
+    return f"read_parquet({files}, hive_partitioning = true, union_by_name = true)"
+
+
+def _file_key(path: Path) -> Tuple[str, int, int]:
+    stat = path.stat()
+    return path.name, stat.st_size, stat.st_mtime_ns
+
+
+def source_signature(paths) -> Tuple:
+    """
+    Cheap stat-based signature of source files, their season partitions and deltas; changes
+    whenever one is added, removed or rewritten.
+    """
+    signature = []
+    for path in paths:
+        partitions = partition_files(path)
+        if partitions:
+            signature.extend((_partition_year(f),) + _file_key(f) for f in partitions)
+        elif path.exists():
+            signature.append(_file_key(path))
+        else:
+            continue
+        signature.extend(_file_key(d) for d in delta_files(path))
+    return tuple(signature)
+
+
+def table_version(table_name: str) -> Tuple:
+    """
+    Version of a synced table's sources; cache keys include it so only changed tables go cold.
+    """
+    return source_signature(_TABLE_SOURCES.get(table_name, []))
+
+
+def link_sources(table_name: str, source_tables) -> None:
+    """
+    Give a table derived from synced tables the same sources, so its version follows theirs.
+    """
+    _TABLE_SOURCES[table_name] = [p for t in source_tables for p in _TABLE_SOURCES.get(t, [])]
+
+
+def _create_view(con: duckdb.DuckDBPyConnection, base: str, table_name: str, deltas: List[Path]) -> None:
+    if not deltas:
+        con.execute(f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM {base}")
+        return
+    # Rows for a (year, week) come from the newest delta holding it, else from the full export
+    delta_list = "[" + ", ".join(_quote_path(d) for d in deltas) + "]"
+    con.execute(f"""
+        CREATE OR REPLACE VIEW {table_name} AS
+        WITH delta AS (
+            SELECT * EXCLUDE (filename)
+            FROM read_parquet({delta_list}, union_by_name = true, filename = true)
+            QUALIFY filename = max(filename) OVER (PARTITION BY year, week)
+        )
+        SELECT * FROM {base} b
+        WHERE NOT EXISTS (SELECT 1 FROM delta d WHERE d.year = b.year AND d.week = b.week)
+        UNION ALL BY NAME
+        SELECT * FROM delta
+    """)
+
+
+def _upsert_delta(con: duckdb.DuckDBPyConnection, table_name: str, delta: Path) -> None:
+    source = f"read_parquet({_quote_path(delta)})"
+    con.execute("BEGIN TRANSACTION")
+    try:
+        con.execute(f"""
+            DELETE FROM {table_name}
+            USING (SELECT DISTINCT year, week FROM {source}) d
+            WHERE {table_name}.year = d.year AND {table_name}.week = d.week
+        """)
+        con.execute(f"INSERT INTO {table_name} BY NAME SELECT * FROM {source}")
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+
+def _record_source(con: duckdb.DuckDBPyConnection, source_key: str, path: Path, sha: str) -> None:
+    stat = path.stat()
+    con.execute(
+        f"INSERT OR REPLACE INTO {SOURCES_TABLE} VALUES (?, ?, ?, ?, ?, current_timestamp)",
+        [source_key, str(path), stat.st_size, stat.st_mtime_ns, sha],
+    )
+
+
+def _content_changed(con: duckdb.DuckDBPyConnection, source_key: str, path: Path) -> Tuple[bool, str]:
+    """
+    (changed, sha256) for a source file; the hash is only computed when size or mtime moved.
+    """
+    stored = _stored_fingerprint(con, source_key)
+    stat = path.stat()
+    if stored is not None and stored[:2] == (stat.st_size, stat.st_mtime_ns):
+        return False, stored[2]
+    sha = file_sha256(path)
+    return stored is None or stored[2] != sha, sha
+
+
+def _stored_keys(con: duckdb.DuckDBPyConnection, prefix: str) -> set:
+    return {
+        row[0] for row in con.execute(
+            f"SELECT table_name FROM {SOURCES_TABLE} WHERE starts_with(table_name, ?)", [prefix]
+        ).fetchall()
+    }
+
+
+def _forget_sources(con: duckdb.DuckDBPyConnection, prefix: str) -> None:
+    con.execute(f"DELETE FROM {SOURCES_TABLE} WHERE starts_with(table_name, ?)", [prefix])
+
+
+def _reload_seasons(con: duckdb.DuckDBPyConnection, table_name: str, partitions: List[Path], years) -> None:
+    con.execute("BEGIN TRANSACTION")
+    try:
+        for year in sorted(years):
+            files = [f for f in partitions if _partition_year(f) == year]
+            con.execute(f"DELETE FROM {table_name} WHERE CAST({PARTITION_KEY} AS VARCHAR) = ?", [year])
+            if files:
+                con.execute(f"INSERT INTO {table_name} BY NAME SELECT * FROM {_scan(files[0], files)}")
+        con.execute("COMMIT")
+    except Exception:
+        con.execute("ROLLBACK")
+        raise
+
+
+def _sync_partitions(con: duckdb.DuckDBPyConnection, path: Path, table_name: str, partitions: List[Path],
+                     rebuild: bool) -> bool:
+    """
+    Partitioned sources are tracked per file (``table@year=2024/part-0.parquet``) and only the
+    seasons whose files were added, changed or removed are deleted and re-read.
+    """
+    prefix = f"{table_name}@"
+    stored = _stored_keys(con, prefix)
+    keys = {f"{prefix}{f.parent.name}/{f.name}": f for f in partitions}
+    changes = {}
+    for key, f in keys.items():
+        changed, sha = _content_changed(con, key, f)
+        if rebuild or changed:
+            changes[key] = (f, sha)
+    removed = stored - keys.keys()
+    if not (rebuild or changes or removed):
+        return False
+
+    if not rebuild:
+        years = {_partition_year(f) for f, _ in changes.values()}
+        years |= {key[len(prefix):].split("/", 1)[0].split("=", 1)[1] for key in removed}
+        try:
+            _reload_seasons(con, table_name, partitions, years)
+        except duckdb.Error:
+            # A season that added columns cannot be inserted into the old schema
+            rebuild = True
+            changes = {key: (f, _content_changed(con, key, f)[1]) for key, f in keys.items()}
+    if rebuild:
+        con.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM {_scan(path, partitions)}")
+        _forget_sources(con, prefix)
+    else:
+        for key in removed:
+            con.execute(f"DELETE FROM {SOURCES_TABLE} WHERE table_name = ?", [key])
+    for key, (f, sha) in changes.items():
+        _record_source(con, key, f, sha)
+    return True
+
+
+def sync_parquet(con: duckdb.DuckDBPyConnection, path: Path, table_name: str, persistent: bool) -> bool:
+    """
+    Make `table_name` reflect the parquet export at `path` (or its season partitions) plus its
+    weekly deltas; returns True when data was (re)read.
+
+    In memory the table is a view over read_parquet, so queries only scan the columns they
+    select and, for a partitioned source, only the seasons they filter on. In a persistent
+    database the source is ingested once and re-ingested only when its content changes: size
+    and mtime are checked first, and the SHA-256 only when those moved. Partitioned sources
+    reload just the changed seasons. New or changed deltas are upserted by (year, week)
+    without touching the rest of history.
+    """
+    deltas = delta_files(path)
+    partitions = partition_files(path)
+    _TABLE_SOURCES[table_name] = [path]
+    if not persistent:
+        _create_view(con, _scan(path, partitions), table_name, deltas)
+        return True
+
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {SOURCES_TABLE} (
+            table_name VARCHAR PRIMARY KEY, path VARCHAR, size BIGINT, mtime_ns BIGINT,
+            sha256 VARCHAR, loaded_at TIMESTAMP
+        )
+    """)
+    applied = _stored_keys(con, f"{table_name}#")
+    delta_keys = [f"{table_name}#{d.name}" for d in deltas]
+
+    # A delta that disappeared cannot be undone in place, so rebuild from the full export
+    rebuild = not _table_exists(con, table_name) or bool(applied - set(delta_keys))
+    if partitions:
+        # Switching from the monolithic file drops whatever it held
+        rebuild = rebuild or _stored_fingerprint(con, table_name) is not None
+        con.execute(f"DELETE FROM {SOURCES_TABLE} WHERE table_name = ?", [table_name])
+        base_reloaded = _sync_partitions(con, path, table_name, partitions, rebuild)
+    else:
+        base_changed, base_sha = _content_changed(con, table_name, path)
+        base_reloaded = rebuild or base_changed
+        if base_reloaded:
+            con.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM {_scan(path, partitions)}")
+            _forget_sources(con, f"{table_name}@")
+        _record_source(con, table_name, path, base_sha)
+    if base_reloaded:
+        _forget_sources(con, f"{table_name}#")
+        applied = set()
+
+    # Deltas after the first new or changed one are replayed so later weeks still win
+    replay = False
+    for delta, key in zip(deltas, delta_keys):
+        changed, sha = _content_changed(con, key, delta)
+        replay = replay or changed or key not in applied
+        if replay:
+            _upsert_delta(con, table_name, delta)
+            _record_source(con, key, delta, sha)
+    return base_reloaded or replay
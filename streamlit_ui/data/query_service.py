@@ -0,0 +1,124 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence, Union
+
+import duckdb
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+from streamlit_ui.data.parquet_store import duckdb_database
+from streamlit_ui.data.timings import row_count, sql_label, timed
+
+Frame = Union[pd.DataFrame, pa.Table]
+
+
+def quote_ident(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def fetch_arrow(result: duckdb.DuckDBPyConnection) -> pa.Table:
+    # DuckDB 1.4 renamed fetch_arrow_table to to_arrow_table
+    fetch = getattr(result, "to_arrow_table", None) or result.fetch_arrow_table
+    return fetch()
+
+
+def arrow_to_pandas(table: pa.Table, strings_only: bool = False) -> pd.DataFrame:
+    """
+    Arrow table to pandas with ArrowDtype columns, so strings never pass through object dtype.
+    With strings_only, numeric and temporal columns stay NumPy-backed for code that expects them.
+    """
+    if not strings_only:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def types_mapper(arrow_type: pa.DataType):
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return pd.ArrowDtype(arrow_type)
+        return None
+
+    return table.to_pandas(types_mapper=types_mapper)
+
+
+@st.cache_resource
+def get_duckdb_connection():
+    return duckdb.connect(database=duckdb_database())
+
+
+class QueryService:
+    """
+    One DuckDB database shared by every Streamlit session.
+
+    Each thread gets its own cursor on the shared connection, pandas frames and Arrow
+    tables stay registered on that cursor until a different one is bound to the same
+    name, and callers pass values as bound parameters instead of formatting them into SQL.
+    """
+
+    def __init__(self, con: duckdb.DuckDBPyConnection):
+        self._con = con
+        self._local = threading.local()
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        cur = getattr(self._local, "cursor", None)
+        if cur is None:
+            cur = self._con.cursor()
+            self._local.cursor = cur
+            self._local.registered = {}
+        return cur
+
+    def register(self, name: str, df: Frame) -> None:
+        cur = self.cursor()
+        registered: Dict[str, Any] = self._local.registered
+        names = df.schema.names if isinstance(df, pa.Table) else list(df.columns)
+        duplicates = sorted({str(c) for c in names if names.count(c) > 1})
+        if duplicates:
+            # DuckDB only rejects these for Arrow-backed columns, with an unhelpful conversion error
+            raise ValueError(f"Cannot register {name!r}: duplicate column names {duplicates}")
+        # Columns are bound at registration time, so re-register when the shape changes
+        if isinstance(df, pa.Table):
+            signature = (id(df), df.schema, df.num_rows)
+        else:
+            signature = (id(df), tuple(df.columns), tuple(df.dtypes), len(df))
+        current = registered.get(name)
+        if current is not None and current[0] == signature:
+            return
+        cur.register(name, df)
+        # Keep a reference so the id in the signature cannot be recycled
+        registered[name] = (signature, df)
+
+    def unregister(self, name: str) -> None:
+        registered = getattr(self._local, "registered", {})
+        if registered.pop(name, None) is not None:
+            self.cursor().unregister(name)
+
+    def execute(self, sql: str, params: Optional[Sequence[Any]] = None, **frames: Frame):
+        for name, df in frames.items():
+            self.register(name, df)
+        cur = self.cursor()
+        return cur.execute(sql, params) if params is not None else cur.execute(sql)
+
+    def _timed_fetch(self, sql: str, params: Optional[Sequence[Any]], frames: Dict[str, Frame],
+                     fetch: Callable[[duckdb.DuckDBPyConnection], Any]):
+        with timed("query", sql_label(sql), rows_in=row_count(*frames.values())) as record:
+            result = fetch(self.execute(sql, params, **frames))
+            record["rows_out"] = len(result)
+        return result
+
+    def query(self, sql: str, params: Optional[Sequence[Any]] = None, **frames: Frame) -> pd.DataFrame:
+        return self._timed_fetch(sql, params, frames, lambda result: result.df())
+
+    def query_arrow(self, sql: str, params: Optional[Sequence[Any]] = None, **frames: Frame) -> pa.Table:
+        return self._timed_fetch(sql, params, frames, fetch_arrow)
+
+    def query_arrow_df(self, sql: str, params: Optional[Sequence[Any]] = None, strings_only: bool = False,
+                       **frames: Frame) -> pd.DataFrame:
+        return self._timed_fetch(
+            sql, params, frames, lambda result: arrow_to_pandas(fetch_arrow(result), strings_only)
+        )
+
+
+@st.cache_resource
+def get_query_service() -> QueryService:
+    return QueryService(get_duckdb_connection())
+
+
+def duckdb_filter(df: pd.DataFrame, sql: str, params: Optional[Sequence[Any]] = None, name: str = "df") -> pd.DataFrame:
+    return get_query_service().query(sql, params, **{name: df})
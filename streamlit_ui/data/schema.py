@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+from pandas.api import types as ptypes
+
+# Keys every tab filters and joins on; small enough for int16 in every table
+KEY_COLUMNS = ("year", "week")
+
+# Known 0/1 flags, stored as int8. Other integer columns keep their dtype even when one load
+# happens to hold only 0s and 1s (proj_wins, faab_bid), so dtypes don't depend on the data
+FLAG_COLUMNS = (
+    "win", "loss", "is_playoffs", "is_consolation", "postseason", "quarterfinal", "semifinal",
+    "championship", "champion", "sacko", "team_got_bye", "above_league_median",
+    "below_league_median", "above_opponent_median", "below_opponent_median", "started", "benched",
+    "optimal_player", "league_wide_optimal_player", "is_keeper_status", "kept_next_year",
+)
+
+
+def _key_dtype(series: pd.Series) -> pd.Series:
+    if not ptypes.is_numeric_dtype(series) or ptypes.is_bool_dtype(series):
+        series = pd.to_numeric(series, errors="coerce")
+    if series.isna().any():
+        # Nulls stay float, which is what the old per-tab to_numeric calls produced
+        return series
+    values = series.to_numpy()
+    if len(values) and (
+        (values != np.floor(values)).any() or values.min() < np.iinfo(np.int16).min
+        or values.max() > np.iinfo(np.int16).max
+    ):
+        return series
+    return series.astype(np.int16)
+
+
+def normalize_frame(df: pd.DataFrame, float32: bool = False) -> pd.DataFrame:
+    """
+    Compact dtypes for a freshly loaded table, so tabs can skip their own coercion:
+    year/week become int16 (numeric, and NaN-aware when a value is missing), the integer
+    FLAG_COLUMNS become int8 when they hold only 0/1, and with ``float32`` the float stat columns
+    are halved.
+    Label columns keep their string dtype; see ARROW_STRING_TABLES in league_data.
+    """
+    converted = {}
+    for col in KEY_COLUMNS:
+        if col in df.columns:
+            converted[col] = _key_dtype(df[col])
+    for col in df.columns:
+        if col in converted:
+            continue
+        series = df[col]
+        if col in FLAG_COLUMNS and isinstance(series.dtype, np.dtype) and series.dtype.kind in "iu":
+            if len(series) and series.min() >= 0 and series.max() <= 1:
+                converted[col] = series.astype(np.int8)
+        elif float32 and series.dtype == np.float64:
+            converted[col] = series.astype(np.float32)
+    if not converted:
+        return df
+    df = df.copy(deep=False)
+    for col, series in converted.items():
+        df[col] = series
+    return df
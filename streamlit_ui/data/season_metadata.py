@@ -0,0 +1,59 @@
+import pandas as pd
+import streamlit as st
+
+from streamlit_ui.data.aggregates import SEASON_METADATA_KEYS, SEASON_METADATA_SOURCES
+
+
+def season_metadata_for(df_dict):
+    """
+    The "Season Metadata" table, built from the schedule and matchup rows when the materialized
+    table isn't available. None without either.
+    """
+    metadata = df_dict.get("Season Metadata")
+    if metadata is not None:
+        return metadata
+    columns = sorted(SEASON_METADATA_KEYS)
+    sources = [df_dict.get(key) for key in SEASON_METADATA_SOURCES]
+    sources = [df[columns] for df in sources if df is not None and SEASON_METADATA_KEYS <= set(df.columns)]
+    return season_metadata(*sources) if sources else None
+
+
+@st.cache_data(show_spinner=False)
+def season_metadata(*sources):
+    """
+    Regular-season weeks, playoff weeks, last week and league size per year, matching
+    data.aggregates' season_metadata table. Each source only adds the years the ones before it
+    don't cover.
+    """
+    games, covered = [], set()
+    for df in sources:
+        games.append(df[~df['year'].isin(covered)])
+        covered |= set(df['year'].unique())
+    games = pd.concat(games, ignore_index=True)
+
+    regular = (games['is_playoffs'] == 0) & (games['is_consolation'] == 0)
+    seasons = games.assign(
+        regular_week=games['week'].where(regular),
+        playoff_week=games['week'].where((games['is_playoffs'] == 1) | (games['is_consolation'] == 1)),
+    ).groupby('year').agg(
+        regular_weeks=('regular_week', 'max'),
+        playoff_weeks=('playoff_week', 'nunique'),
+        league_size=('manager', 'nunique'),
+    )
+    # Seasons still in progress borrow the playoff length of the latest season that has one
+    playoff_weeks = seasons['playoff_weeks'].where(seasons['playoff_weeks'] > 0)
+    seasons['playoff_weeks'] = playoff_weeks.ffill().fillna(0).astype(int)
+    seasons['regular_weeks'] = seasons['regular_weeks'].fillna(0).astype(int)
+    seasons['last_week'] = seasons['regular_weeks'] + seasons['playoff_weeks']
+    return seasons.reset_index()[['year', 'regular_weeks', 'playoff_weeks', 'last_week', 'league_size']]
+
+
+def season_weeks(df, metadata):
+    """
+    Rows of a weekly frame played within their season (through its last playoff week). Seasons
+    the metadata doesn't cover, or every season without metadata, keep every week.
+    """
+    if metadata is None:
+        return df
+    last_week = df['year'].map(metadata.set_index('year')['last_week'])
+    return df[df['week'] <= last_week.fillna(df['week'])]
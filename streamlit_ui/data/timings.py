@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+
+# Timings are always recorded; KMFFL_DIAGNOSTICS=1 also traces peak Python/NumPy memory per call,
+# which slows allocation-heavy code, and KMFFL_TIMINGS_FILE appends every record as JSON lines
+DIAGNOSTICS_ENV = "KMFFL_DIAGNOSTICS"
+TIMINGS_FILE_ENV = "KMFFL_TIMINGS_FILE"
+
+MAX_RECORDS = 5000
+
+_local = threading.local()
+# tracemalloc's peak is process-wide, so one thread at a time owns it, from its outermost traced
+# section until that section ends; the lock only guards handing ownership over
+_trace_lock = threading.Lock()
+_trace_owner: Optional[int] = None
+
+
+def memory_tracing() -> bool:
+    return os.getenv(DIAGNOSTICS_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _claim_tracing() -> Optional[bool]:
+    """
+    True when this thread just took ownership of tracemalloc, False when it already owns it,
+    and None while another thread does.
+    """
+    global _trace_owner
+    with _trace_lock:
+        if _trace_owner is None:
+            _trace_owner = threading.get_ident()
+            return True
+        return False if _trace_owner == threading.get_ident() else None
+
+
+def _release_tracing() -> None:
+    global _trace_owner
+    with _trace_lock:
+        _trace_owner = None
+
+
+def row_count(*values: Any) -> Optional[int]:
+    """
+    Rows across the frames and Arrow tables in `values`; None when there are none.
+    """
+    rows = [len(v) for v in values if isinstance(v, (pd.DataFrame, pa.Table))]
+    return sum(rows) if rows else None
+
+
+def sql_label(sql: str, width: int = 80) -> str:
+    label = " ".join(sql.split())
+    return label if len(label) <= width else label[:width - 1] + "…"
+
+
+class TimingLog:
+    """
+    Recent timing records shared by every session, newest last. With a path every record
+    is also appended to that file as one JSON object per line.
+    """
+
+    def __init__(self, max_records: int = MAX_RECORDS, path: Optional[str] = None):
+        self.path = path
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._records.append(record)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record) + "\n")
+
+    def records(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def to_jsonl(self) -> str:
+        return "".join(json.dumps(r) + "\n" for r in self.records())
+
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per (kind, name): calls, total/mean/max wall time, largest peak memory and row counts.
+        """
+        df = pd.DataFrame(self.records())
+        if df.empty:
+            return df
+        for col in ("rows_in", "rows_out", "peak_mb"):
+            if col not in df.columns:
+                df[col] = None
+        summary = df.groupby(["kind", "name"]).agg(
+            calls=("wall_ms", "size"),
+            total_ms=("wall_ms", "sum"),
+            mean_ms=("wall_ms", "mean"),
+            max_ms=("wall_ms", "max"),
+            peak_mb=("peak_mb", "max"),
+            rows_in=("rows_in", "max"),
+            rows_out=("rows_out", "max"),
+        ).reset_index()
+        return summary.sort_values("total_ms", ascending=False, ignore_index=True)
+
+
+@st.cache_resource
+def get_timing_log() -> TimingLog:
+    return TimingLog(path=os.getenv(TIMINGS_FILE_ENV))
+
+
+@contextmanager
+def timed(kind: str, name: str, rows_in: Optional[int] = None, **fields: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time the enclosed block and log it as ``{kind, name, wall_ms, rows_in, rows_out, peak_mb, ...}``.
+    The record is yielded so the block can fill in ``rows_out`` once it knows it. Nested timers
+    are recorded separately and each one's peak covers its children. Only one thread traces
+    memory at a time: sections in other threads that overlap it get no ``peak_mb``, and the
+    traced peak also counts whatever those threads allocate meanwhile, so it is approximate
+    while sessions overlap.
+    """
+    record: Dict[str, Any] = {"ts": time.time(), "kind": kind, "name": name, "rows_in": rows_in, **fields}
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    claimed = _claim_tracing() if memory_tracing() else None
+    if claimed is not None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        base, outer_peak = tracemalloc.get_traced_memory()
+        # reset_peak wipes the enclosing timer's high-water mark, so carry it on the stack
+        if stack:
+            stack[-1]["_peak"] = max(stack[-1].get("_peak", 0), outer_peak)
+        tracemalloc.reset_peak()
+        record["_base"] = base
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        record["wall_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        stack.pop()
+        base = record.pop("_base", None)
+        peak = record.pop("_peak", 0)
+        if base is not None and tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            record["peak_mb"] = round((peak - base) / (1024 * 1024), 3)
+            if stack:
+                stack[-1]["_peak"] = max(stack[-1].get("_peak", 0), peak)
+        if claimed:
+            _release_tracing()
+        get_timing_log().add(record)
@@ -0,0 +1,54 @@
+import pandas as pd
+import streamlit as st
+
+from streamlit_ui.data.timings import get_timing_log, memory_tracing
+
+# Append ?diagnostics=1 to the app URL to show the panel
+DIAGNOSTICS_PARAM = "diagnostics"
+
+
+def diagnostics_requested() -> bool:
+    return st.query_params.get(DIAGNOSTICS_PARAM, "") not in ("", "0", "false")
+
+
+def display_diagnostics_panel():
+    log = get_timing_log()
+    with st.sidebar.expander("Diagnostics", expanded=True):
+        records = log.records()
+        st.caption(
+            f"{len(records):,} timed calls since start"
+            + (
+                "; tracing peak memory in one session at a time, approximate while sessions overlap"
+                if memory_tracing()
+                else "; set KMFFL_DIAGNOSTICS=1 to trace peak memory"
+            )
+        )
+        summary = log.summary()
+        if summary.empty:
+            st.write("Nothing timed yet.")
+            return
+
+        kinds = sorted(summary["kind"].unique())
+        selected = st.multiselect("Kinds", kinds, default=kinds, key="diagnostics_kinds")
+        st.dataframe(
+            summary[summary["kind"].isin(selected)],
+            hide_index=True,
+            column_config={
+                "total_ms": st.column_config.NumberColumn(format="%.1f"),
+                "mean_ms": st.column_config.NumberColumn(format="%.1f"),
+                "max_ms": st.column_config.NumberColumn(format="%.1f"),
+                "peak_mb": st.column_config.NumberColumn(format="%.2f"),
+            },
+        )
+        st.write("Slowest recent calls")
+        recent = pd.DataFrame(records)
+        st.dataframe(recent.nlargest(20, "wall_ms"), hide_index=True)
+
+        col1, col2 = st.columns(2)
+        col1.download_button(
+            "Export JSONL", log.to_jsonl(), file_name="kmffl_timings.jsonl",
+            mime="application/jsonl", key="diagnostics_export"
+        )
+        if col2.button("Clear", key="diagnostics_clear"):
+            log.clear()
+            st.rerun()
@@ -7,11 +7,13 @@ from .draft_optimizer import display_draft_optimizer
 from .career_draft_stats import display_career_draft
 from .draft_preferences import display_draft_preferences
 from .draft_overviews import display_draft_overview  # Import your new function
+from .season_points import season_points_for
 
 def display_draft_data_overview(df_dict):
     draft_data = df_dict.get("Draft History")
-    player_data = df_dict.get("Player Data")
-    if draft_data is not None and player_data is not None:
+    # Per player-season regular-season points, so the weekly player rows aren't loaded here
+    season_points = season_points_for(df_dict)
+    if draft_data is not None and season_points is not None:
         sub_tab_names = [
             "Draft Summary",
             "Scoring Outcomes",
@@ -26,14 +28,14 @@ def display_draft_data_overview(df_dict):
                 if sub_tab_name == "Draft Summary":
                     display_draft_summary(draft_data)
                 elif sub_tab_name == "Scoring Outcomes":
-                    display_scoring_outcomes(draft_data, player_data)
+                    display_scoring_outcomes(draft_data, season_points)
                 elif sub_tab_name == "Career Draft Stats":
                     career_stats = display_career_draft(draft_data)
                     st.dataframe(career_stats)
                 elif sub_tab_name == "Draft Optimizer":
-                    display_draft_optimizer(draft_data, player_data)
+                    display_draft_optimizer(draft_data, season_points)
                 elif sub_tab_name == "Draft Preferences":
-                    display_draft_preferences(draft_data, player_data)
+                    display_draft_preferences(draft_data, season_points)
                 elif sub_tab_name == "Average Draft Prices":
                     display_draft_overview(draft_data)  # Call your new function
     else:
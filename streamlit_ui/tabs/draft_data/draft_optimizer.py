@@ -1,28 +1,28 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from pulp import LpMaximize, LpProblem, LpVariable, lpSum, value
+import plotly.graph_objects as go
+from pulp import PULP_CBC_CMD, LpAffineExpression, LpMaximize, LpProblem, LpStatus, LpVariable, value
+
+from .lineup_solver import FLEX_POSITIONS, best_lineups, lineup_frontier, marginal_values, top_lineups
+
+BUDGET_CONSTRAINT = "budget"
 
 
 @st.cache_data
-def preprocess_data(draft_history, player_data, start_year, end_year):
+def preprocess_data(draft_history, season_points, start_year, end_year):
     """
-    Optimized preprocessing with vectorized operations.
-    Now uses pre-calculated cost_bucket from the data.
+    PPG per drafted (non-keeper) player season in the year range, looked up in the
+    player-season points index instead of merged from weekly player rows.
+    Uses the pre-calculated cost_bucket from the data.
     """
-    # Create copies to avoid modifying original data
+    # Create a copy to avoid modifying original data
     draft_history = draft_history.copy()
-    player_data = player_data.copy()
 
-    # Convert types once upfront (more efficient than multiple conversions)
-    draft_history['year'] = pd.to_numeric(draft_history['year'], errors='coerce').astype('Int64')
+    # year arrives as int16 from the loader; only the loosely typed draft columns need coercion
     draft_history['cost'] = pd.to_numeric(draft_history['cost'], errors='coerce')
     draft_history['cost_bucket'] = pd.to_numeric(draft_history['cost_bucket'], errors='coerce').astype('Int64')
 
-    player_data['year'] = pd.to_numeric(player_data['year'], errors='coerce').astype('Int64')
-    player_data['points'] = pd.to_numeric(player_data['points'], errors='coerce')
-    player_data['week'] = pd.to_numeric(player_data['week'], errors='coerce')
-
     # Single combined filter operation for draft history
     draft_mask = (
             (draft_history['year'] >= start_year) &
@@ -33,38 +33,29 @@ def preprocess_data(draft_history, player_data, start_year, end_year):
     )
     filtered_draft = draft_history[draft_mask]
 
-    # Single filter for player data
-    player_mask = (
-            (player_data['year'] >= start_year) &
-            (player_data['year'] <= end_year) &
-            (player_data['points'] > 0)  # Filter out 0 points here
+    # Regular-season points over the weeks a player scored, one row per player season
+    season_mask = (
+            (season_points['year'] >= start_year) &
+            (season_points['year'] <= end_year) &
+            (season_points['positive_weeks'] > 0)
     )
-    filtered_player = player_data[player_mask]
+    seasons = season_points.loc[season_mask, ['player', 'year', 'positive_points', 'positive_weeks']]
 
-    # Merge once with only needed columns
     merged = filtered_draft.merge(
-        filtered_player[['player', 'points', 'week', 'year']],
+        seasons,
         left_on=['player_name', 'year'],
-        right_on=['player', 'year'],
-        how='left'
-    )
-
-    # Vectorized week filtering based on year (regular season only)
-    week_mask = (
-            ((merged['year'] < 2021) & (merged['week'] <= 16)) |
-            ((merged['year'] >= 2021) & (merged['week'] <= 17))
+        right_on=['player', 'year']
     )
-    merged = merged[week_mask]
 
     # Single aggregation operation with cost_bucket included
     agg_data = merged.groupby(
         ['player_name', 'year', 'primary_position', 'cost_bucket'],
         dropna=False
-    ).agg({
-        'cost': 'max',
-        'points': 'sum',
-        'week': 'nunique'
-    }).reset_index()
+    ).agg(
+        cost=('cost', 'max'),
+        points=('positive_points', 'first'),
+        week=('positive_weeks', 'first')
+    ).reset_index()
 
     # Vectorized PPG calculation
     agg_data['PPG'] = agg_data['points'] / agg_data['week']
@@ -119,18 +110,18 @@ def calculate_aggregated_buckets(aggregated_data):
     return result.round(2)
 
 
-def display_draft_optimizer(draft_history, player_data):
+def display_draft_optimizer(draft_history, season_points):
     st.header("Draft Optimizer")
 
     # Validate required columns
-    required_player_cols = ['player', 'points', 'week', 'year']
+    required_player_cols = ['player', 'year', 'positive_points', 'positive_weeks']
     required_draft_cols = ['player_name', 'primary_position', 'is_keeper_status', 'cost_bucket']
 
-    missing_player = [col for col in required_player_cols if col not in player_data.columns]
+    missing_player = [col for col in required_player_cols if col not in season_points.columns]
     missing_draft = [col for col in required_draft_cols if col not in draft_history.columns]
 
     if missing_player:
-        st.error(f"Missing columns in player_data: {', '.join(missing_player)}")
+        st.error(f"Missing columns in season_points: {', '.join(missing_player)}")
         return
 
     if missing_draft:
@@ -187,9 +178,14 @@ def display_draft_optimizer(draft_history, player_data):
     with col9:
         num_te = st.number_input("Number of TEs", min_value=0, value=1)
 
-    col10, = st.columns([1])
+    col10, col11 = st.columns([1, 1])
     with col10:
         num_flex = st.number_input("Number of FLEX (WR/RB/TE)", min_value=0, value=1)
+    with col11:
+        num_lineups = st.number_input("Lineups to Show", min_value=1, max_value=20, value=1,
+                                      help="Also list the next-best distinct lineups")
+    show_marginals = st.checkbox("Show marginal value of each bucket",
+                                 help="PPG lost if a bucket is excluded, and the price at which it enters the lineup")
 
     # Price constraints section
     with st.expander("Set Price Constraints for All Positions"):
@@ -249,143 +245,348 @@ def display_draft_optimizer(draft_history, player_data):
         # Global max bid
         max_bid = st.number_input("Max Bid (any player)", min_value=0, max_value=100, value=100, key="max_bid")
 
+    # Budget sweep inputs
+    with st.expander("Budget Sweep"):
+        st.caption("Solve the lineup for a range of budgets and chart total PPG against budget.")
+        col12, col13, col14 = st.columns([1, 1, 1])
+        with col12:
+            sweep_min = st.number_input("Lowest Budget", min_value=0, value=max(budget - 50, 0), key="sweep_min")
+        with col13:
+            sweep_max = st.number_input("Highest Budget", min_value=0, value=budget + 50, key="sweep_max")
+        with col14:
+            sweep_step = st.number_input("Step", min_value=1, value=10, key="sweep_step")
+        sweep = st.button("Sweep Budgets")
+
+    position_constraints = {
+        'QB': qb_constraints,
+        'DEF': def_constraints,
+        'K': k_constraints,
+        'RB': rb_constraints,
+        'WR': wr_constraints,
+        'TE': te_constraints
+    }
+    position_counts = {
+        'QB': num_qb,
+        'RB': num_rb,
+        'WR': num_wr,
+        'TE': num_te,
+        'DEF': num_def,
+        'K': num_k
+    }
+
     # Optimize button
     if st.button("Optimize", type="primary"):
         with st.spinner("Processing data and optimizing lineup..."):
             try:
-                # Preprocess data (cached for performance)
-                aggregated_data = preprocess_data(draft_history, player_data, start_year, end_year)
+                display_data = lineup_candidates(draft_history, season_points, start_year, end_year, max_bid,
+                                                 position_constraints, flex_constraints)
+                if display_data is None:
+                    return
 
-                if len(aggregated_data) == 0:
-                    st.error("No data available after filtering. Try adjusting your year range.")
+                lineups, solver = optimal_lineups(display_data, position_counts, num_flex, budget, num_lineups)
+                if not lineups:
+                    st.error("No lineup found. Try raising the budget or relaxing constraints.")
                     return
+                display_optimal_lineup(display_data[lineups[0]].copy().round(2), budget)
+                if len(lineups) > 1:
+                    display_alternative_lineups(display_data, lineups)
+                if show_marginals:
+                    display_marginal_values(display_data, lineups[0], position_counts, num_flex, budget)
+                st.caption(f"Solved with {solver}.")
 
-                # Apply max bid filter
-                aggregated_data = aggregated_data[aggregated_data['cost'] <= max_bid]
-
-                # Build position constraints dictionary
-                position_constraints = {
-                    'QB': qb_constraints,
-                    'DEF': def_constraints,
-                    'K': k_constraints,
-                    'RB': rb_constraints,
-                    'WR': wr_constraints,
-                    'TE': te_constraints
-                }
-
-                # Apply all position constraints at once (vectorized)
-                aggregated_data = apply_price_constraints_vectorized(aggregated_data, position_constraints)
-
-                # Apply FLEX constraints
-                flex_mask = aggregated_data['primary_position'].isin(['WR', 'RB', 'TE'])
-                for max_cost in flex_constraints:
-                    aggregated_data = aggregated_data[~(flex_mask & (aggregated_data['cost'] > max_cost))]
-
-                if len(aggregated_data) == 0:
-                    st.error("No players available after applying constraints. Try relaxing your constraints.")
+            except Exception as e:
+                st.error(f"An error occurred during optimization: {str(e)}")
+                st.exception(e)
+
+    if sweep:
+        with st.spinner("Solving lineups across budgets..."):
+            try:
+                display_data = lineup_candidates(draft_history, season_points, start_year, end_year, max_bid,
+                                                 position_constraints, flex_constraints)
+                if display_data is None:
                     return
 
-                # Calculate bucket aggregates (uses pre-calculated cost_bucket)
-                avg_ppg_data = calculate_aggregated_buckets(aggregated_data)
-
-                # Prepare data for optimization
-                display_data = avg_ppg_data[['primary_position', 'Average cost', 'Median PPG']].copy()
-
-                costs = display_data['Average cost'].values
-                ppgs = display_data['Median PPG'].values
-
-                # Set up linear programming problem
-                prob = LpProblem("Draft_Optimizer", LpMaximize)
-                x = [LpVariable(f"x{i}", cat="Binary") for i in range(len(costs))]
-
-                # Objective: maximize total PPG
-                prob += lpSum([ppgs[i] * x[i] for i in range(len(ppgs))])
-
-                # Budget constraint
-                prob += lpSum([costs[i] * x[i] for i in range(len(costs))]) <= budget
-
-                # Position-specific constraints
-                position_counts = {
-                    'QB': num_qb,
-                    'RB': num_rb,
-                    'WR': num_wr,
-                    'TE': num_te,
-                    'DEF': num_def,
-                    'K': num_k
-                }
-
-                for position, num in position_counts.items():
-                    pos_mask = display_data['primary_position'].str.startswith(position).astype(int).tolist()
-
-                    if position in ['WR', 'RB', 'TE']:
-                        # Flex-eligible positions: min = num, max = num + flex slots
-                        prob += lpSum([pos_mask[i] * x[i] for i in range(len(pos_mask))]) >= num
-                        prob += lpSum([pos_mask[i] * x[i] for i in range(len(pos_mask))]) <= num + num_flex
-                    else:
-                        # Non-flex positions: exactly num players
-                        prob += lpSum([pos_mask[i] * x[i] for i in range(len(pos_mask))]) >= num
-                        prob += lpSum([pos_mask[i] * x[i] for i in range(len(pos_mask))]) <= num
-
-                # FLEX total constraint: total WR/RB/TE must equal regular slots + FLEX slots
-                total_wr_rb_te = num_wr + num_rb + num_te + num_flex
-                flex_mask_list = display_data['primary_position'].isin(['WR', 'RB', 'TE']).astype(int).tolist()
-                prob += lpSum([flex_mask_list[i] * x[i] for i in range(len(flex_mask_list))]) == total_wr_rb_te
-
-                # Solve the optimization problem
-                prob.solve()
-
-                # Extract results
-                optimal_slots = [bool(value(x[i])) for i in range(len(x))]
-                optimal_draft = display_data[optimal_slots].copy().round(2)
-
-                # Sort by position for better readability
-                position_order = ['QB', 'RB', 'WR', 'TE', 'DEF', 'K']
-                optimal_draft['sort_key'] = optimal_draft['primary_position'].apply(
-                    lambda pos: position_order.index(pos) if pos in position_order else 999
-                )
-                optimal_draft = optimal_draft.sort_values(['sort_key', 'Average cost'], ascending=[True, False])
-                optimal_draft = optimal_draft.drop(columns=['sort_key'])
-
-                # Display results
-                col1, col2 = st.columns([2, 1])
-
-                with col1:
-                    st.subheader("Optimal Lineup")
-                    st.dataframe(optimal_draft, hide_index=True, use_container_width=True)
-
-                with col2:
-                    total_cost = optimal_draft['Average cost'].sum().round(2)
-                    total_ppg = optimal_draft['Median PPG'].sum().round(2)
-                    remaining_budget = (budget - total_cost).round(2)
-
-                    st.subheader("Summary")
-                    st.markdown(f"""
-                    <div style="border:1px solid #ddd; padding: 15px; border-radius: 5px; background-color: #f9f9f9;">
-                        <p style="margin: 5px 0;"><strong>Total Cost:</strong> ${total_cost}</p>
-                        <p style="margin: 5px 0;"><strong>Remaining Budget:</strong> ${remaining_budget}</p>
-                        <p style="margin: 5px 0;"><strong>Total PPG:</strong> {total_ppg}</p>
-                        <p style="margin: 5px 0;"><strong>Players:</strong> {len(optimal_draft)}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    if total_cost > budget:
-                        st.error("⚠️ Total cost exceeds budget. Please adjust constraints.")
-                    elif remaining_budget > 20:
-                        st.warning(
-                            f"💡 You have ${remaining_budget} left. Consider relaxing constraints to use more budget.")
-                    else:
-                        st.success("✅ Optimized lineup within budget!")
-
-                # Position breakdown
-                st.subheader("Position Breakdown")
-                position_summary = optimal_draft.groupby('primary_position').agg({
-                    'Average cost': ['sum', 'mean'],
-                    'Median PPG': ['sum', 'mean'],
-                    'primary_position': 'count'
-                }).round(2)
-                position_summary.columns = ['Total Cost', 'Avg Cost', 'Total PPG', 'Avg PPG', 'Count']
-                st.dataframe(position_summary, use_container_width=True)
+                budgets = tuple(range(int(sweep_min), int(sweep_max) + 1, int(sweep_step)))
+                if not budgets:
+                    st.error("Highest Budget must be at least the Lowest Budget.")
+                    return
+                display_budget_frontier(budget_frontier(display_data, position_counts, num_flex, budgets))
 
             except Exception as e:
-                st.error(f"An error occurred during optimization: {str(e)}")
-                st.exception(e)
\ No newline at end of file
+                st.error(f"An error occurred during the budget sweep: {str(e)}")
+                st.exception(e)
+
+
+def lineup_candidates(draft_history, season_points, start_year, end_year, max_bid, position_constraints,
+                      flex_constraints):
+    """
+    Position/cost-bucket rows the optimizer picks from, after the price constraints.
+    Shows an error and returns None when no rows are left.
+    """
+    # Preprocess data (cached for performance)
+    aggregated_data = preprocess_data(draft_history, season_points, start_year, end_year)
+
+    if len(aggregated_data) == 0:
+        st.error("No data available after filtering. Try adjusting your year range.")
+        return None
+
+    # Apply max bid filter
+    aggregated_data = aggregated_data[aggregated_data['cost'] <= max_bid]
+
+    # Apply all position constraints at once (vectorized)
+    aggregated_data = apply_price_constraints_vectorized(aggregated_data, position_constraints)
+
+    # Apply FLEX constraints
+    flex_mask = aggregated_data['primary_position'].isin(FLEX_POSITIONS)
+    for max_cost in flex_constraints:
+        aggregated_data = aggregated_data[~(flex_mask & (aggregated_data['cost'] > max_cost))]
+
+    if len(aggregated_data) == 0:
+        st.error("No players available after applying constraints. Try relaxing your constraints.")
+        return None
+
+    # Calculate bucket aggregates (uses pre-calculated cost_bucket)
+    avg_ppg_data = calculate_aggregated_buckets(aggregated_data)
+    return avg_ppg_data[['primary_position', 'Average cost', 'Median PPG']].reset_index(drop=True)
+
+
+def build_lineup_model(display_data, position_counts, num_flex, budget):
+    """
+    Binary program picking one row per roster slot: maximize PPG within `budget`.
+    Returns (problem, variables, budget constraint name) so callers can re-solve it at other budgets.
+    """
+    costs = display_data['Average cost'].to_numpy()
+    ppgs = display_data['Median PPG'].to_numpy()
+    positions = display_data['primary_position']
+
+    prob = LpProblem("Draft_Optimizer", LpMaximize)
+    x = [LpVariable(f"x{i}", cat="Binary") for i in range(len(costs))]
+
+    # Objective: maximize total PPG
+    prob += LpAffineExpression(zip(x, ppgs))
+
+    # Budget constraint
+    prob += LpAffineExpression(zip(x, costs)) <= budget, BUDGET_CONSTRAINT
+
+    # Position-specific constraints
+    for position, num in position_counts.items():
+        in_position = LpAffineExpression(
+            (x[i], 1) for i in np.flatnonzero(positions.str.startswith(position).to_numpy())
+        )
+        if position in FLEX_POSITIONS:
+            # Flex-eligible positions: min = num, max = num + flex slots
+            prob += in_position >= num
+            prob += in_position <= num + num_flex
+        else:
+            # Non-flex positions: exactly num players
+            prob += in_position == num
+
+    # FLEX total constraint: total WR/RB/TE must equal regular slots + FLEX slots
+    total_wr_rb_te = sum(position_counts.get(p, 0) for p in FLEX_POSITIONS) + num_flex
+    flex_rows = np.flatnonzero(positions.isin(FLEX_POSITIONS).to_numpy())
+    prob += LpAffineExpression((x[i], 1) for i in flex_rows) == total_wr_rb_te
+
+    return prob, x, BUDGET_CONSTRAINT
+
+
+def solve_lineup(prob, x, budget_name, budget=None, warm_start=None):
+    """
+    Solve the lineup model (at `budget` when given), optionally starting CBC from a previous
+    selection. Returns (selected rows as a boolean array, status name).
+    """
+    if budget is not None:
+        prob.constraints[budget_name].changeRHS(budget)
+    if warm_start is not None:
+        for var, chosen in zip(x, warm_start):
+            var.setInitialValue(int(chosen))
+    prob.solve(PULP_CBC_CMD(msg=False, warmStart=warm_start is not None))
+    selected = np.array([bool(round(value(v) or 0)) for v in x], dtype=bool)
+    return selected, LpStatus[prob.status]
+
+
+def solver_inputs(display_data):
+    return (display_data['Average cost'].to_numpy(), display_data['Median PPG'].to_numpy(),
+            display_data['primary_position'].to_numpy())
+
+
+def optimal_lineups(display_data, position_counts, num_flex, budget, top_k=1):
+    """
+    Up to `top_k` best distinct lineups at `budget` as boolean row masks (best first), and the
+    solver used. Rows the in-process solver can't express go to the PuLP model, re-solved with
+    a no-good cut against each lineup found.
+    """
+    lineups = top_lineups(*solver_inputs(display_data), position_counts, num_flex, budget, top_k)
+    if lineups is not None:
+        return list(lineups.selected), "the in-process solver"
+
+    prob, x, budget_name = build_lineup_model(display_data, position_counts, num_flex, budget)
+    found = []
+    while len(found) < top_k:
+        selected, status = solve_lineup(prob, x, budget_name)
+        if status != "Optimal":
+            break
+        found.append(selected)
+        # Every lineup fills the same number of slots, so this only rules out the one just found
+        prob += LpAffineExpression((x[i], 1) for i in np.flatnonzero(selected)) <= int(selected.sum()) - 1
+    return found, "PuLP/CBC"
+
+
+@st.cache_data(show_spinner=False)
+def marginal_report(display_data, position_counts, num_flex, budget):
+    """
+    Each bucket's value to the best lineup at `budget`, or None when the in-process solver
+    can't express the rows.
+    """
+    marginals = marginal_values(*solver_inputs(display_data), position_counts, num_flex, budget)
+    if marginals is None:
+        return None
+    report = display_data.copy()
+    report['PPG Lost If Excluded'] = marginals.loss
+    report['Break-even Price'] = marginals.break_even
+    report['Price Headroom'] = marginals.break_even - report['Average cost']
+    return report.round(2)
+
+
+def lineup_label(display_data, selected):
+    lineup = display_data[selected].sort_values('Average cost', ascending=False)
+    return ", ".join(f"{pos} ${cost:.0f}" for pos, cost in zip(lineup['primary_position'], lineup['Average cost']))
+
+
+@st.cache_data(show_spinner=False)
+def budget_frontier(display_data, position_counts, num_flex, budgets):
+    """
+    Best total PPG at each budget, read off a single pass of the in-process solver. When it
+    can't express the rows, the PuLP model is built once and re-solved per budget, each solve
+    starting from the previous lineup, which stays feasible as budgets increase.
+    """
+    inputs = solver_inputs(display_data)
+    costs, ppgs, _ = inputs
+    frontier = lineup_frontier(*inputs, position_counts, num_flex, max(budgets))
+    if frontier is None:
+        prob, x, budget_name = build_lineup_model(display_data, position_counts, num_flex, min(budgets))
+
+    rows = []
+    previous = None
+    for budget in sorted(budgets):
+        if frontier is not None:
+            best = best_lineups(frontier, budget)
+            selected, status = (frontier.selected[best[0]], "Optimal") if best else (None, "Infeasible")
+        else:
+            selected, status = solve_lineup(prob, x, budget_name, budget, warm_start=previous)
+        if status != "Optimal":
+            rows.append({'Budget': budget, 'Total Cost': np.nan, 'Total PPG': np.nan, 'Players': 0,
+                         'Status': status, 'Lineup': ""})
+            previous = None
+            continue
+        previous = selected
+        rows.append({
+            'Budget': budget,
+            'Total Cost': round(costs[selected].sum(), 2),
+            'Total PPG': round(ppgs[selected].sum(), 2),
+            'Players': int(selected.sum()),
+            'Status': status,
+            'Lineup': lineup_label(display_data, selected),
+        })
+    return pd.DataFrame(rows)
+
+
+def display_optimal_lineup(optimal_draft, budget):
+    # Sort by position for better readability
+    position_order = ['QB', 'RB', 'WR', 'TE', 'DEF', 'K']
+    optimal_draft['sort_key'] = optimal_draft['primary_position'].apply(
+        lambda pos: position_order.index(pos) if pos in position_order else 999
+    )
+    optimal_draft = optimal_draft.sort_values(['sort_key', 'Average cost'], ascending=[True, False])
+    optimal_draft = optimal_draft.drop(columns=['sort_key'])
+
+    # Display results
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("Optimal Lineup")
+        st.dataframe(optimal_draft, hide_index=True, use_container_width=True)
+
+    with col2:
+        total_cost = optimal_draft['Average cost'].sum().round(2)
+        total_ppg = optimal_draft['Median PPG'].sum().round(2)
+        remaining_budget = (budget - total_cost).round(2)
+
+        st.subheader("Summary")
+        st.markdown(f"""
+        <div style="border:1px solid #ddd; padding: 15px; border-radius: 5px; background-color: #f9f9f9;">
+            <p style="margin: 5px 0;"><strong>Total Cost:</strong> ${total_cost}</p>
+            <p style="margin: 5px 0;"><strong>Remaining Budget:</strong> ${remaining_budget}</p>
+            <p style="margin: 5px 0;"><strong>Total PPG:</strong> {total_ppg}</p>
+            <p style="margin: 5px 0;"><strong>Players:</strong> {len(optimal_draft)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+        if total_cost > budget:
+            st.error("⚠️ Total cost exceeds budget. Please adjust constraints.")
+        elif remaining_budget > 20:
+            st.warning(
+                f"💡 You have ${remaining_budget} left. Consider relaxing constraints to use more budget.")
+        else:
+            st.success("✅ Optimized lineup within budget!")
+
+    # Position breakdown
+    st.subheader("Position Breakdown")
+    position_summary = optimal_draft.groupby('primary_position').agg({
+        'Average cost': ['sum', 'mean'],
+        'Median PPG': ['sum', 'mean'],
+        'primary_position': 'count'
+    }).round(2)
+    position_summary.columns = ['Total Cost', 'Avg Cost', 'Total PPG', 'Avg PPG', 'Count']
+    st.dataframe(position_summary, use_container_width=True)
+
+
+def display_alternative_lineups(display_data, lineups):
+    costs, ppgs, _ = solver_inputs(display_data)
+    best_ppg = ppgs[lineups[0]].sum()
+    alternatives = pd.DataFrame([{
+        'Rank': rank,
+        'Total Cost': round(costs[selected].sum(), 2),
+        'Total PPG': round(ppgs[selected].sum(), 2),
+        'PPG Behind Best': round(best_ppg - ppgs[selected].sum(), 2),
+        'Lineup': lineup_label(display_data, selected),
+    } for rank, selected in enumerate(lineups, start=1)])
+
+    st.subheader("Alternative Lineups")
+    st.dataframe(alternatives, hide_index=True, use_container_width=True)
+
+
+def display_marginal_values(display_data, selected, position_counts, num_flex, budget):
+    report = marginal_report(display_data, position_counts, num_flex, budget)
+    st.subheader("Marginal Value by Bucket")
+    if report is None:
+        st.info("Marginal values aren't available for these positions.")
+        return
+    st.caption(
+        "PPG Lost If Excluded: how much the best lineup drops without the bucket. "
+        "Break-even Price: the highest average cost at which the bucket is still in a best lineup "
+        "(blank when it isn't even for free). Price Headroom: break-even price minus current cost."
+    )
+    report.insert(0, 'In Lineup', selected)
+    report = report.sort_values(['In Lineup', 'Price Headroom'], ascending=[False, False])
+    st.dataframe(report, hide_index=True, use_container_width=True)
+
+
+def display_budget_frontier(frontier):
+    st.subheader("PPG vs Budget")
+    solved = frontier[frontier['Status'] == "Optimal"]
+    if solved.empty:
+        st.error("No feasible lineup at any budget in the sweep. Try raising the budgets or relaxing constraints.")
+        return
+
+    fig = go.Figure(go.Scatter(
+        x=solved['Budget'], y=solved['Total PPG'], mode='lines+markers',
+        customdata=solved[['Total Cost', 'Lineup']],
+        hovertemplate="Budget $%{x}<br>PPG %{y:.2f}<br>Cost $%{customdata[0]:.2f}<br>%{customdata[1]}<extra></extra>",
+    ))
+    fig.update_layout(xaxis_title="Budget", yaxis_title="Total PPG", height=400, margin=dict(t=20))
+    st.plotly_chart(fig, use_container_width=True)
+
+    frontier = frontier.copy()
+    frontier['PPG Gain'] = frontier['Total PPG'].diff().round(2)
+    st.dataframe(frontier[['Budget', 'Total Cost', 'Total PPG', 'PPG Gain', 'Players', 'Status', 'Lineup']],
+                 hide_index=True, use_container_width=True)
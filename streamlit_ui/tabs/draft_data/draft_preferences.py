@@ -10,7 +10,7 @@ def order_positions(df, position_col='yahoo_position', allowed_positions=None):
     df[position_col] = df[position_col].astype(position_order)
     return df.sort_values([position_col])
 
-def display_draft_preferences(draft_data, player_df):
+def display_draft_preferences(draft_data, season_points):
     st.header("Draft Preferences")
 
     draft_data = draft_data.rename(columns={
@@ -22,21 +22,14 @@ def display_draft_preferences(draft_data, player_df):
         'Is Keeper Status': 'is_keeper_status',
         'Pick': 'pick'
     })
-    player_df = player_df.rename(columns={
-        'yahoo_position': 'yahoo_position',
-        'year': 'year',
-        'player': 'player',
-        'points': 'points',
-        'week': 'week',
-        'player_year': 'player_year'
-    })
+    season_points = season_points.copy()
 
     draft_data['year'] = draft_data['year'].astype(str)
     draft_data['manager'] = draft_data['manager'].astype(str)
-    player_df['year'] = player_df['year'].astype(str)
+    season_points['year'] = season_points['year'].astype(str)
 
-    if 'yahoo_position' not in player_df.columns:
-        st.error("The 'yahoo_position' column is missing from player_df.")
+    if 'yahoo_position' not in season_points.columns:
+        st.error("The 'yahoo_position' column is missing from player data.")
         return
 
     allowed_primary_positions = ["QB", "RB", "WR", "TE", "K", "DEF"]
@@ -64,6 +57,15 @@ def display_draft_preferences(draft_data, player_df):
 
         selected_years = [y for y in years if start_year <= y <= end_year]
 
+        def join_season_points(filtered_draft_data):
+            # Regular-season totals per player season; players without regular-season weeks drop out
+            seasons = season_points[season_points['year'].isin(selected_years)] if selected_years else season_points
+            return filtered_draft_data.merge(
+                seasons[['player', 'year', 'points', 'weeks', 'yahoo_position']],
+                left_on=['player_name', 'year'],
+                right_on=['player', 'year']
+            )
+
         if selected_manager == 'League Total':
             st.subheader("League Total Draft Data")
             columns_to_show = ['year', 'manager', 'cost', 'primary_position', 'is_keeper_status']
@@ -85,37 +87,21 @@ def display_draft_preferences(draft_data, player_df):
             def get_drafted_table(filtered_draft_data, table_title):
                 if selected_years:
                     filtered_draft_data = filtered_draft_data[filtered_draft_data['year'].isin(selected_years)]
-                    player_df_filtered = player_df[player_df['year'].isin(selected_years)]
-                else:
-                    player_df_filtered = player_df
 
                 if selected_manager and selected_manager != 'League Average':
                     filtered_draft_data = filtered_draft_data[filtered_draft_data['manager'] == selected_manager]
 
-                right_cols = [c for c in ['player_year', 'player', 'points', 'week', 'year', 'yahoo_position']
-                              if c in player_df_filtered.columns]
-
-                merged_data = filtered_draft_data.merge(
-                    player_df_filtered[right_cols],
-                    left_on=['player_name', 'year'],
-                    right_on=['player', 'year'],
-                    how='left'
-                )
-
-                merged_data = merged_data[
-                    ((merged_data['year'].astype(int) < 2021) & (merged_data['week'] <= 16)) |
-                    ((merged_data['year'].astype(int) >= 2021) & (merged_data['week'] <= 17))
-                ]
+                merged_data = join_season_points(filtered_draft_data)
 
                 aggregated_data = merged_data.groupby(['year', 'player', 'yahoo_position']).agg({
-                    'points': 'sum',
+                    'points': 'first',
                     'cost': 'first',
                     'pick': 'first',
                     'player_name': 'first',
                     'manager': 'first',
-                    'week': pd.Series.nunique
+                    'weeks': 'first'
                 }).reset_index()
-                aggregated_data['season_ppg'] = (aggregated_data['points'] / aggregated_data['week']).round(2)
+                aggregated_data['season_ppg'] = (aggregated_data['points'] / aggregated_data['weeks']).round(2)
 
                 aggregated_data['personal_position_rank'] = (
                     aggregated_data.groupby(['year', 'yahoo_position', 'manager'])['cost']
@@ -163,7 +149,8 @@ def display_draft_preferences(draft_data, player_df):
                 score_cols = ['avg_cost', 'season_ppg', 'times_drafted']
                 avg_data = avg_data[~((avg_data[score_cols].isnull()) | (avg_data[score_cols] == 0)).all(axis=1)]
 
-                avg_data['rank_num'] = avg_data['personal_position_rank'].str.extract(r'(\d+)$').fillna(0).astype(int)
+                rank_digits = avg_data['personal_position_rank'].str.extract(r'(?P<rank>\d+)$', expand=False)
+                avg_data['rank_num'] = pd.to_numeric(rank_digits, errors='coerce').fillna(0).astype(int)
                 avg_data = order_positions(avg_data, position_col='yahoo_position', allowed_positions=allowed_primary_positions)
                 avg_data = avg_data.sort_values(['yahoo_position', 'rank_num'])
 
@@ -177,34 +164,21 @@ def display_draft_preferences(draft_data, player_df):
             def get_kept_table(filtered_draft_data, table_title):
                 if selected_years:
                     filtered_draft_data = filtered_draft_data[filtered_draft_data['year'].isin(selected_years)]
-                    player_df_filtered = player_df[player_df['year'].isin(selected_years)]
-                else:
-                    player_df_filtered = player_df
 
                 if selected_manager and selected_manager != 'League Average':
                     filtered_draft_data = filtered_draft_data[filtered_draft_data['manager'] == selected_manager]
 
-                right_cols = [c for c in ['player_year', 'player', 'points', 'week', 'year', 'yahoo_position']
-                              if c in player_df_filtered.columns]
-
-                merged_data = filtered_draft_data.merge(
-                    player_df_filtered[right_cols],
-                    left_on=['player_name', 'year'],
-                    right_on=['player', 'year'],
-                    how='left'
-                )
-
-                merged_data = merged_data[
-                    ((merged_data['year'].astype(int) < 2021) & (merged_data['week'] <= 16)) |
-                    ((merged_data['year'].astype(int) >= 2021) & (merged_data['week'] <= 17))
-                ]
+                merged_data = join_season_points(filtered_draft_data)
 
-                player_data = merged_data.groupby(['player', 'yahoo_position', 'manager']).agg({
+                # One row per kept season, so points and weeks add up across seasons
+                player_data = merged_data.drop_duplicates(['player', 'year', 'yahoo_position', 'manager']).groupby(
+                    ['player', 'yahoo_position', 'manager']
+                ).agg({
                     'cost': 'first',
                     'points': 'sum',
-                    'week': pd.Series.nunique
+                    'weeks': 'sum'
                 }).reset_index()
-                player_data['season_ppg'] = (player_data['points'] / player_data['week']).round(2)
+                player_data['season_ppg'] = (player_data['points'] / player_data['weeks']).round(2)
 
                 player_data = order_positions(player_data, position_col='yahoo_position', allowed_positions=allowed_primary_positions)
                 player_data = player_data[player_data['cost'] > 0]
@@ -1,15 +1,18 @@
 import streamlit as st
 import pandas as pd
 
-def display_scoring_outcomes(draft_data, player_df):
+def display_scoring_outcomes(draft_data, season_points):
     st.header("Scoring Outcomes")
 
+    # The loaded frames are shared with the other draft tabs
+    draft_data = draft_data.copy()
+    season_points = season_points.copy()
     draft_data['year'] = draft_data['year'].astype(str)
     draft_data['manager'] = draft_data['manager'].astype(str)
-    player_df['year'] = player_df['year'].astype(str)
+    season_points['year'] = season_points['year'].astype(str)
 
-    if 'yahoo_position' not in player_df.columns:
-        st.error("The 'yahoo_position' column is missing from player_df.")
+    if 'yahoo_position' not in season_points.columns:
+        st.error("The 'yahoo_position' column is missing from player data.")
         return
 
     years = sorted(draft_data['year'].unique().tolist())
@@ -17,13 +20,13 @@ def display_scoring_outcomes(draft_data, player_df):
     allowed_primary_positions = ["QB", "RB", "WR", "TE", "DEF", "K"]
     primary_positions = [
         pos for pos in sorted(
-            [p for p in player_df['yahoo_position'].unique().tolist() if pd.notna(p)]
+            [p for p in season_points['yahoo_position'].unique().tolist() if pd.notna(p)]
         ) if pos in allowed_primary_positions
     ]
 
     col1, col2 = st.columns([1, 1])
     with col1:
-        search_players = st.multiselect("Search Player", options=player_df['player'].unique().tolist(), default=[])
+        search_players = st.multiselect("Search Player", options=season_points['player'].unique().tolist(), default=[])
     with col2:
         selected_team_managers = st.multiselect("Select manager", team_managers, default=[])
 
@@ -41,24 +44,19 @@ def display_scoring_outcomes(draft_data, player_df):
 
     if selected_years:
         draft_data = draft_data[draft_data['year'].isin(selected_years)]
-        player_df = player_df[player_df['year'].isin(selected_years)]
+        season_points = season_points[season_points['year'].isin(selected_years)]
     if selected_team_managers:
         draft_data = draft_data[draft_data['manager'].isin(selected_team_managers)]
 
-    # Add ppg_season to merge columns
-    merge_cols = ['player', 'points', 'week', 'year', 'yahoo_position', 'ppg_season']
+    # Regular-season totals per player season; drafted players without any regular-season weeks drop out
+    merge_cols = [c for c in ['player', 'points', 'weeks', 'year', 'yahoo_position', 'ppg_season']
+                  if c in season_points.columns]
     merged_data = draft_data.merge(
-        player_df[merge_cols],
+        season_points[merge_cols],
         left_on=['player_name', 'year'],
-        right_on=['player', 'year'],
-        how='left'
+        right_on=['player', 'year']
     )
 
-    merged_data = merged_data[
-        ((merged_data['year'].astype(int) < 2021) & (merged_data['week'] <= 16)) |
-        ((merged_data['year'].astype(int) >= 2021) & (merged_data['week'] <= 17))
-    ]
-
     if include_drafted and not include_keepers:
         merged_data = merged_data[merged_data['is_keeper_status'] != 1]
     elif not include_drafted and include_keepers:
@@ -73,16 +71,14 @@ def display_scoring_outcomes(draft_data, player_df):
     merged_data['position'] = merged_data['primary_position']
 
     aggregated_data = merged_data.groupby(['year', 'player', 'position']).agg({
-        'points': 'sum',
-        'cost': 'first',
-        'pick': 'first',
-        'manager': 'first',
-        'week': pd.Series.nunique,
-        'ppg_season': 'first'
+        c: 'first' for c in ['points', 'cost', 'pick', 'manager', 'weeks', 'ppg_season'] if c in merged_data.columns
     }).reset_index()
 
-    # Use ppg_season from source data
-    aggregated_data['PPG'] = aggregated_data['ppg_season']
+    # Use ppg_season from source data when the export has it
+    if 'ppg_season' in aggregated_data.columns:
+        aggregated_data['PPG'] = aggregated_data['ppg_season']
+    else:
+        aggregated_data['PPG'] = (aggregated_data['points'] / aggregated_data['weeks']).round(2)
 
     def cost_rank_logic(row, group):
         year = str(row['year'])
@@ -112,7 +108,7 @@ def display_scoring_outcomes(draft_data, player_df):
     aggregated_data.rename(columns={
         'points': 'total_points',
         'player': 'Player',
-        'week': 'unique_weeks',
+        'weeks': 'unique_weeks',
         'cost_rank': 'Cost Rank',
         'total_points_rank': 'Total Points Rank',
         'ppg_rank': 'PPG Rank',
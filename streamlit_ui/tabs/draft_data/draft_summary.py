@@ -4,6 +4,8 @@ import pandas as pd
 def display_draft_summary(draft_data):
     st.header("Draft Summary")
 
+    # The loaded frame is shared with the other draft tabs
+    draft_data = draft_data.copy()
     draft_data['manager'] = draft_data['manager'].astype(str)
     draft_data['year'] = draft_data['year'].astype(str)
     draft_data = draft_data[draft_data['manager'] != "nan"]
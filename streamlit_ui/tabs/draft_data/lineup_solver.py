@@ -0,0 +1,308 @@
+"""
+Exact solver for the draft optimizer's lineup problem that runs in-process instead of
+spawning CBC through PuLP.
+
+The problem is a multiple-choice knapsack: pick (position, cost bucket) rows to fill each
+position's slots plus the FLEX slots within a budget, maximizing total PPG. Each position's
+rows are enumerated by how many of them are picked, then partial lineups are combined
+position by position, keyed by how many FLEX slots they have used. A partial lineup that
+`top_k` others with the same key match or beat on both cost and PPG can't be part of the
+`top_k` best lineups, so only the first `top_k` cost/PPG Pareto fronts are kept at each step.
+That keeps the lists small and the result exact for every budget up to the one solved for.
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+FLEX_POSITIONS = ['WR', 'RB', 'TE']
+# Picks within a position are kept as int64 bitmasks
+MAX_POSITION_ROWS = 62
+# Cost sums are accumulated in a different order than the MILP's; don't let rounding decide feasibility
+COST_TOLERANCE = 1e-6
+
+
+class Lineups(NamedTuple):
+    """Complete lineups: total cost, total PPG and a (lineup x row) selection mask."""
+    cost: np.ndarray
+    ppg: np.ndarray
+    selected: np.ndarray
+
+
+class Marginals(NamedTuple):
+    """
+    Best lineup PPG and, per row, the PPG lost when the row can't be picked (inf when no lineup
+    is possible without it) and the highest price at which it is still part of a best lineup
+    (NaN when it isn't even for free).
+    """
+    best_ppg: float
+    loss: np.ndarray
+    break_even: np.ndarray
+
+
+def _front_mask(cost: np.ndarray, value: np.ndarray, fronts: int) -> np.ndarray:
+    """
+    Points on the first `fronts` Pareto fronts (low cost, high value). Every point further
+    back is matched or beaten on both by at least `fronts` others.
+    """
+    keep = np.zeros(len(cost), dtype=bool)
+    remaining = np.lexsort((-value, cost))
+    for _ in range(fronts):
+        if len(remaining) == 0:
+            break
+        v = value[remaining]
+        best_before = np.maximum.accumulate(np.concatenate(([-np.inf], v[:-1])))
+        on_front = v > best_before
+        keep[remaining[on_front]] = True
+        remaining = remaining[~on_front]
+    return keep
+
+
+def _prune(cost, value, picks, cost_cap, fronts):
+    fits = cost <= cost_cap + COST_TOLERANCE
+    cost, value, picks = cost[fits], value[fits], picks[fits]
+    keep = _front_mask(cost, value, fronts)
+    return cost[keep], value[keep], picks[keep]
+
+
+def _position_subsets(cost: np.ndarray, value: np.ndarray, max_count: int, cost_cap: float,
+                      fronts: int) -> Dict[int, tuple]:
+    """
+    Subsets of one position's rows by size: {size: (cost, value, row bitmask)}.
+    """
+    subsets = {0: (np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.int64))}
+    for i in range(len(cost)):
+        bit = np.int64(1) << i
+        # Largest size first, so row i is added to subsets that don't contain it yet
+        for k in range(min(i, max_count - 1), -1, -1):
+            if k not in subsets:
+                continue
+            c, v, m = subsets[k]
+            added = (c + cost[i], v + value[i], m | bit)
+            if k + 1 in subsets:
+                added = tuple(np.concatenate(pair) for pair in zip(subsets[k + 1], added))
+            subsets[k + 1] = _prune(*added, cost_cap, fronts)
+    return subsets
+
+
+def _position_groups(positions, position_counts, num_flex):
+    """
+    (rows, required count, max count) per position, or None when the rows don't fit this solver.
+    """
+    groups = []
+    for position, count in position_counts.items():
+        rows = np.flatnonzero(positions == position)
+        max_count = count + num_flex if position in FLEX_POSITIONS else count
+        groups.append((rows, count, min(max_count, len(rows))))
+    if sum(len(rows) for rows, _, _ in groups) != len(positions):
+        return None
+    if any(len(rows) > MAX_POSITION_ROWS for rows, _, _ in groups):
+        return None
+    return groups
+
+
+def _combine(groups, costs, ppgs, num_flex, budget, fronts, keep=None, reserve=True):
+    """
+    Combine the positions in order. Returns the partial lineups after each position, as
+    {FLEX slots used: (cost, ppg, one bitmask column per position combined)}.
+    `keep(step, used, cost, ppg)` can drop partial lineups that can't finish well enough;
+    `reserve` drops those that leave too little budget to fill the remaining positions.
+    """
+    # Cheapest way to fill the required slots of the positions not yet combined
+    required = [np.sort(costs[rows])[:count].sum() if reserve else 0.0 for rows, count, _ in groups]
+    still_required = np.cumsum(required[::-1])[::-1].tolist()[1:] + [0.0]
+
+    steps = []
+    partial = {0: (np.zeros(1), np.zeros(1), np.zeros((1, 0), dtype=np.int64))}
+    for step, ((rows, count, max_count), rest) in enumerate(zip(groups, still_required)):
+        cost_cap = budget - rest
+        subsets = _position_subsets(costs[rows], ppgs[rows], max_count, cost_cap, fronts)
+        combined = {}
+        for used, (c, v, m) in partial.items():
+            for k in range(count, max_count + 1):
+                if k not in subsets or used + k - count > num_flex:
+                    continue
+                sc, sv, sm = subsets[k]
+                pair_cost = (c[:, None] + sc[None, :]).ravel()
+                fits = np.flatnonzero(pair_cost <= cost_cap + COST_TOLERANCE)
+                left, right = np.divmod(fits, len(sc))
+                pieces = (pair_cost[fits], v[left] + sv[right], np.column_stack([m[left], sm[right]]))
+                if keep is not None:
+                    kept = keep(step, used + k - count, pieces[0], pieces[1])
+                    pieces = tuple(piece[kept] for piece in pieces)
+                combined.setdefault(used + k - count, []).append(pieces)
+        partial = {
+            used: _prune(*(np.concatenate(parts) for parts in zip(*pieces)), cost_cap, fronts)
+            for used, pieces in combined.items()
+        }
+        # A key whose every partial lineup was pruned can't be completed; later steps and the
+        # best-PPG curves expect at least one
+        partial = {used: arrays for used, arrays in partial.items() if len(arrays[0])}
+        steps.append(partial)
+    return steps
+
+
+def _best_curves(partial):
+    """
+    {FLEX slots used: (cost ascending, best PPG at that cost or less)} of partial lineups.
+    """
+    curves = {}
+    for used, (c, v, _) in partial.items():
+        order = np.argsort(c)
+        curves[used] = (c[order], np.maximum.accumulate(v[order]))
+    return curves
+
+
+def _lineups(groups, partial, num_flex, n_rows) -> Lineups:
+    if num_flex not in partial:
+        return Lineups(np.zeros(0), np.zeros(0), np.zeros((0, n_rows), dtype=bool))
+    cost, ppg, picks = partial[num_flex]
+    selected = np.zeros((len(cost), n_rows), dtype=bool)
+    for column, (rows, _, _) in enumerate(groups):
+        for bit, row in enumerate(rows):
+            selected[:, row] = (picks[:, column] >> bit) & 1
+    return Lineups(cost, ppg, selected)
+
+
+def lineup_frontier(costs: Sequence[float], ppgs: Sequence[float], positions: Sequence[str],
+                    position_counts: Dict[str, int], num_flex: int, budget: float) -> Optional[Lineups]:
+    """
+    The best lineup at every budget up to `budget`: complete lineups on the cost/PPG Pareto front.
+
+    Returns None when the rows don't fit this solver: a position without a slot count, or
+    more than MAX_POSITION_ROWS rows for one position. Callers fall back to the MILP then.
+    """
+    costs = np.asarray(costs, dtype=float)
+    ppgs = np.asarray(ppgs, dtype=float)
+    groups = _position_groups(np.asarray(positions, dtype=object), position_counts, num_flex)
+    if groups is None:
+        return None
+    if any(len(rows) < count for rows, count, _ in groups):
+        return _lineups(groups, {}, num_flex, len(costs))
+    return _lineups(groups, _combine(groups, costs, ppgs, num_flex, budget, 1)[-1], num_flex, len(costs))
+
+
+def top_lineups(costs: Sequence[float], ppgs: Sequence[float], positions: Sequence[str],
+                position_counts: Dict[str, int], num_flex: int, budget: float,
+                top_k: int) -> Optional[Lineups]:
+    """
+    The `top_k` best distinct lineups within `budget`, best first (fewer when fewer exist).
+
+    A first pass over the positions in reverse gives the best PPG the remaining positions
+    can add for any leftover budget; the top-k pass drops partial lineups that can't reach
+    the k-th best lineup on that pass's frontier. Returns None like lineup_frontier.
+    """
+    costs = np.asarray(costs, dtype=float)
+    ppgs = np.asarray(ppgs, dtype=float)
+    groups = _position_groups(np.asarray(positions, dtype=object), position_counts, num_flex)
+    if groups is None:
+        return None
+    if any(len(rows) < count for rows, count, _ in groups):
+        return _lineups(groups, {}, num_flex, len(costs))
+
+    suffixes = _combine(groups[::-1], costs, ppgs, num_flex, budget, 1)
+    frontier = _lineups(groups[::-1], suffixes[-1], num_flex, len(costs))
+    reachable = np.sort(frontier.ppg[frontier.cost <= budget + COST_TOLERANCE])[::-1]
+    if len(reachable) == 0:
+        return frontier
+    threshold = reachable[top_k - 1] if len(reachable) >= top_k else -np.inf
+
+    # Best PPG the positions after `step` add with a given leftover budget and FLEX slots left
+    best_rest = [_best_curves(suffixes[len(groups) - 2 - step]) for step in range(len(groups) - 1)]
+
+    def keep(step, used, cost, ppg):
+        if step == len(groups) - 1:
+            rest = np.where(used == num_flex, 0.0, -np.inf)
+        elif num_flex - used not in best_rest[step]:
+            return np.zeros(len(cost), dtype=bool)
+        else:
+            rest_cost, rest_ppg = best_rest[step][num_flex - used]
+            at = np.searchsorted(rest_cost, budget - cost + COST_TOLERANCE, side="right") - 1
+            rest = np.where(at >= 0, rest_ppg[np.maximum(at, 0)], -np.inf)
+        return ppg + rest >= threshold - COST_TOLERANCE
+
+    lineups = _lineups(groups, _combine(groups, costs, ppgs, num_flex, budget, top_k, keep)[-1],
+                       num_flex, len(costs))
+    best = best_lineups(lineups, budget, top_k)
+    return Lineups(lineups.cost[best], lineups.ppg[best], lineups.selected[best])
+
+
+def best_lineups(lineups: Lineups, budget: float, top_k: int = 1) -> List[int]:
+    """
+    Indices of the `top_k` highest-PPG lineups within `budget`, best first (cheaper first on ties).
+    """
+    within = np.flatnonzero(lineups.cost <= budget + COST_TOLERANCE)
+    order = np.lexsort((lineups.cost[within], -lineups.ppg[within]))
+    return within[order[:top_k]].tolist()
+
+
+def _pairs(cost, ppg, subset):
+    sc, sv, _ = subset
+    return (cost[:, None] + sc[None, :]).ravel(), (ppg[:, None] + sv[None, :]).ravel()
+
+
+def marginal_values(costs: Sequence[float], ppgs: Sequence[float], positions: Sequence[str],
+                    position_counts: Dict[str, int], num_flex: int, budget: float) -> Optional[Marginals]:
+    """
+    What each row is worth to the best lineup at `budget`, without a re-solve per row.
+
+    One pass over the positions in order and one in reverse give the best partial lineups
+    before and after every position. For each row, only its own position's picks are
+    re-enumerated without it; joined with those passes they give the best lineup that leaves
+    the row out, and the cheapest way to complete a lineup around the row that matches it.
+    Returns None like lineup_frontier.
+    """
+    costs = np.asarray(costs, dtype=float)
+    ppgs = np.asarray(ppgs, dtype=float)
+    groups = _position_groups(np.asarray(positions, dtype=object), position_counts, num_flex)
+    if groups is None:
+        return None
+    loss = np.zeros(len(costs))
+    break_even = np.full(len(costs), np.nan)
+    if any(len(rows) < count for rows, count, _ in groups):
+        return Marginals(np.nan, loss, break_even)
+
+    # The break-even price can be below a row's cost, so no partial lineup is dropped for
+    # leaving too little budget at the row's current price
+    start = {0: (np.zeros(1), np.zeros(1), np.zeros((1, 0), dtype=np.int64))}
+    before = [start] + _combine(groups, costs, ppgs, num_flex, budget, 1, reserve=False)[:-1]
+    suffixes = _combine(groups[::-1], costs, ppgs, num_flex, budget, 1, reserve=False)
+    after = [_best_curves(suffixes[len(groups) - 2 - g]) for g in range(len(groups) - 1)] + [_best_curves(start)]
+
+    full = suffixes[-1].get(num_flex)
+    within = full[1][full[0] <= budget + COST_TOLERANCE] if full is not None else []
+    if len(within) == 0:
+        return Marginals(np.nan, loss, break_even)
+    best_ppg = within.max()
+
+    for g, (rows, count, max_count) in enumerate(groups):
+        for j, row in enumerate(rows):
+            others = np.delete(rows, j)
+            subsets = _position_subsets(costs[others], ppgs[others], max_count, budget, 1)
+            combos = [
+                (c, v, k, after[g][num_flex - used - (k - count)])
+                for used, (c, v, _) in before[g].items()
+                for k in range(count, max_count + 1)
+                if num_flex - used - (k - count) in after[g]
+            ]
+            # Best lineup that leaves the row out
+            best_without = -np.inf
+            for c, v, k, (rest_cost, rest_ppg) in combos:
+                if k in subsets:
+                    pc, pv = _pairs(c, v, subsets[k])
+                    at = np.searchsorted(rest_cost, budget - pc + COST_TOLERANCE, side="right") - 1
+                    ok = at >= 0
+                    if ok.any():
+                        best_without = max(best_without, (pv[ok] + rest_ppg[at[ok]]).max())
+            # Cheapest other picks that, with the row in, match the best lineup without it
+            cheapest_rest = np.inf
+            for c, v, k, (rest_cost, rest_ppg) in combos:
+                if k >= 1 and k - 1 in subsets:
+                    pc, pv = _pairs(c, v, subsets[k - 1])
+                    at = np.searchsorted(rest_ppg, best_without - ppgs[row] - pv - COST_TOLERANCE, side="left")
+                    ok = at < len(rest_ppg)
+                    if ok.any():
+                        cheapest_rest = min(cheapest_rest, (pc[ok] + rest_cost[at[ok]]).min())
+            loss[row] = best_ppg - best_without
+            if budget - cheapest_rest >= 0:
+                break_even[row] = budget - cheapest_rest
+    return Marginals(best_ppg, loss, break_even)
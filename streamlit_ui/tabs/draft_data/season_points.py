@@ -0,0 +1,39 @@
+import pandas as pd
+import streamlit as st
+
+from streamlit_ui.data.aggregates import SEASON_POINTS_FIRST
+from streamlit_ui.data.season_metadata import season_metadata_for, season_weeks
+
+
+def season_points_for(df_dict):
+    """
+    The "Player Season Points" index, built from the weekly player rows when the materialized
+    table isn't available. None without player data.
+    """
+    season_points = df_dict.get("Player Season Points")
+    if season_points is not None:
+        return season_points
+    player_data = df_dict.get("Player Data")
+    return None if player_data is None else player_season_points(player_data, season_metadata_for(df_dict))
+
+
+@st.cache_data(show_spinner=False)
+def player_season_points(player_df, metadata=None):
+    """
+    Points and weeks within the season per player and year, matching data.aggregates'
+    player_season_points table.
+    """
+    firsts = [c for c in SEASON_POINTS_FIRST if c in player_df.columns]
+    df = player_df.loc[player_df['player'].notna(), ['player', 'year', 'week', 'points'] + firsts]
+    df = season_weeks(df, metadata).sort_values('week')
+    points = pd.to_numeric(df['points'], errors='coerce')
+    positive = points > 0
+
+    df = df.assign(points=points, positive_points=points.where(positive), positive_week=df['week'].where(positive))
+    return df.groupby(['player', 'year'], sort=False).agg(
+        points=('points', 'sum'),
+        weeks=('week', 'nunique'),
+        positive_points=('positive_points', 'sum'),
+        positive_weeks=('positive_week', 'nunique'),
+        **{c: (c, 'first') for c in firsts}
+    ).reset_index()
@@ -1,7 +1,7 @@
 import streamlit as st
-import duckdb
 import pandas as pd
 import altair as alt
+from streamlit_ui.data.query_service import duckdb_filter
 
 class AllTimeScoringStatsViewer:
     def __init__(self, df):
@@ -20,9 +20,6 @@ class AllTimeScoringStatsViewer:
                 st.write("No valid data available for plotting after filtering year.")
                 return
             self.df['year'] = self.df['year'].astype(int)
-            con = duckdb.connect()
-            con.register('matchups', self.df)
-
             min_year = int(self.df['year'].min())
             max_year = int(self.df['year'].max())
             col_year1, col_year2 = st.columns(2)
@@ -55,13 +52,14 @@ class AllTimeScoringStatsViewer:
                 show_consolation = st.checkbox("Consolation", value=False, key=f"{prefix}_consolation")
 
             # Build WHERE clause for DuckDB
-            where_clauses = [f"year >= {start_year} AND year <= {end_year}"]
+            where_clauses = ["year >= ? AND year <= ?"]
+            params = [int(start_year), int(end_year)]
             if selected_managers:
-                managers_str = ",".join([f"'{m}'" for m in selected_managers])
-                where_clauses.append(f"manager IN ({managers_str})")
+                where_clauses.append("list_contains(?, manager)")
+                params.append(list(selected_managers))
             if selected_seeds:
-                seeds_str = ",".join([f"'{s}'" for s in selected_seeds])
-                where_clauses.append(f"final_playoff_seed IN ({seeds_str})")
+                where_clauses.append("list_contains(?, final_playoff_seed)")
+                params.append([float(s) for s in selected_seeds])
             season_types = []
             if show_regular:
                 season_types.append("(is_playoffs = 0 AND is_consolation = 0)")
@@ -74,7 +72,7 @@ class AllTimeScoringStatsViewer:
             where_sql = " AND ".join(where_clauses)
 
             query = f"SELECT * FROM matchups WHERE {where_sql} ORDER BY manager, year, manager_week"
-            df_filtered = con.execute(query).df()
+            df_filtered = duckdb_filter(self.df, query, params, name='matchups')
             if df_filtered.empty:
                 st.write("No valid data available for plotting after filtering.")
                 return
@@ -1,6 +1,6 @@
-import duckdb
 import pandas as pd
 import streamlit as st
+from streamlit_ui.data.query_service import get_query_service
 
 class H2HViewer:
     def __init__(self, filtered_data, matchup_data):
@@ -14,25 +14,14 @@ class H2HViewer:
             raise KeyError("The required column 'matchup_name' is missing in filtered_data.")
 
     def display(self, prefix):
-        # Normalize types
-        self.filtered_data['year'] = pd.to_numeric(self.filtered_data['year'], errors='coerce').fillna(0).astype(int)
-        self.matchup_data['year']  = pd.to_numeric(self.matchup_data['year'],  errors='coerce').fillna(0).astype(int)
-
-        self.filtered_data['week'] = pd.to_numeric(self.filtered_data['week'], errors='coerce')
-        self.matchup_data['week']  = pd.to_numeric(self.matchup_data['week'],  errors='coerce')
-
         # Optional: unify team_name if matchup_data has 'team' instead
         mcols = {c.lower(): c for c in self.matchup_data.columns}
         if 'team_name' not in mcols and 'team' in mcols:
             self.matchup_data = self.matchup_data.rename(columns={mcols['team']: 'team_name'})
 
         # DuckDB connection
-        con = duckdb.connect()
-        con.register('filtered', self.filtered_data)
-        con.register('matchup', self.matchup_data)
-
         # Join on keys, but take team_1 / team_2 from filtered (source of truth here)
-        merged_data = con.execute("""
+        merged_data = get_query_service().query("""
             SELECT
                 f.*,
                 f.team_1 AS team_1,
@@ -58,8 +47,9 @@ class H2HViewer:
             position_order = ['QB', 'RB', 'WR', 'TE', 'W/R/T', 'K', 'DEF']
             bench_ir_positions = ['BN', 'IR']
 
+            service = get_query_service()
+
             def prepare_team_duckdb(df, manager, team_col, player_col, points_col, fantasy_pos_col, headshot_col, positions):
-                con.register('team_df', df)
                 pos_order_map = {pos: i for i, pos in enumerate(positions)}
                 pos_order_case = "CASE " + " ".join([f"WHEN {fantasy_pos_col}='{pos}' THEN {i}" for pos, i in pos_order_map.items()]) + " ELSE 999 END"
                 query = f"""
@@ -68,14 +58,14 @@ class H2HViewer:
                         {fantasy_pos_col},
                         {player_col},
                         {points_col},
-                        COALESCE(NULLIF({headshot_col}, ''), '{default_image_url}') AS {headshot_col},
+                        COALESCE(NULLIF({headshot_col}, ''), ?) AS {headshot_col},
                         ROW_NUMBER() OVER (PARTITION BY {fantasy_pos_col} ORDER BY {points_col} DESC) - 1 AS slot
                     FROM team_df
-                    WHERE manager = '{manager}'
-                      AND {fantasy_pos_col} IN ({','.join([f"'{p}'" for p in positions])})
+                    WHERE manager = ?
+                      AND list_contains(?, {fantasy_pos_col})
                     ORDER BY {pos_order_case}, {points_col} DESC
                 """
-                return con.execute(query).df()
+                return service.query(query, [default_image_url, manager, list(positions)], team_df=df)
 
             # Main positions
             team_1_main = prepare_team_duckdb(
@@ -85,9 +75,7 @@ class H2HViewer:
                 merged_data, team_2, 'team_2', 'player', 'points', 'fantasy_position', 'headshot_url', position_order
             ).rename(columns={'player': 'player_2', 'points': 'points_2', 'headshot_url': 'headshot_url_2'})
 
-            con.register('team_1_main', team_1_main)
-            con.register('team_2_main', team_2_main)
-            main_df = con.execute("""
+            main_df = service.query("""
                 SELECT
                     t1.*,
                     t2.player_2, t2.points_2, t2.headshot_url_2, t2.team_2
@@ -95,7 +83,7 @@ class H2HViewer:
                 FULL OUTER JOIN team_2_main t2
                   ON t1.fantasy_position = t2.fantasy_position
                  AND t1.slot = t2.slot
-            """).df()
+            """, team_1_main=team_1_main, team_2_main=team_2_main)
 
             main_df['points_1'] = main_df['points_1'].fillna(0).round(2)
             main_df['points_2'] = main_df['points_2'].fillna(0).round(2)
@@ -129,9 +117,7 @@ class H2HViewer:
                 merged_data, team_2, 'team_2', 'player', 'points', 'fantasy_position', 'headshot_url', bench_ir_positions
             ).rename(columns={'player': 'player_2', 'points': 'points_2', 'headshot_url': 'headshot_url_2'})
 
-            con.register('team_1_bench', team_1_bench)
-            con.register('team_2_bench', team_2_bench)
-            bench_ir_df = con.execute("""
+            bench_ir_df = service.query("""
                 SELECT
                     t1.*,
                     t2.player_2, t2.points_2, t2.headshot_url_2, t2.team_2
@@ -139,7 +125,7 @@ class H2HViewer:
                 FULL OUTER JOIN team_2_bench t2
                   ON t1.fantasy_position = t2.fantasy_position
                  AND t1.slot = t2.slot
-            """).df()
+            """, team_1_bench=team_1_bench, team_2_bench=team_2_bench)
 
             bench_ir_df['points_1'] = bench_ir_df['points_1'].fillna(0).round(2)
             bench_ir_df['points_2'] = bench_ir_df['points_2'].fillna(0).round(2)
@@ -218,47 +204,37 @@ class H2HViewer:
 
 
 def filter_h2h_data(player_data, year, week, matchup_name):
-    con = duckdb.connect()
-    con.register('player_data', player_data)
-    query = f"""
+    query = """
         SELECT *
         FROM player_data
-        WHERE year = {int(year)}
-          AND week = {int(week)}
-          AND matchup_name = '{matchup_name.replace("'", "''")}'
+        WHERE year = ?
+          AND week = ?
+          AND matchup_name = ?
     """
-    return con.execute(query).df()
+    return get_query_service().query(query, [int(year), int(week), str(matchup_name)], player_data=player_data)
 
 
 def display_head_to_head(df_dict):
-    player_data = df_dict.get("Player Data")
+    # Only the picker columns load up front; the chosen season is read on its own below
+    week_keys = df_dict.frame("Player Data", ["year", "week"])
     matchup_data = df_dict.get("Matchup Data")
-    if player_data is None or matchup_data is None:
+    if week_keys is None or matchup_data is None:
         st.write("Player Data or Matchup Data not found.")
         return
 
     key_prefix = "h2h_head_to_head_"
 
-    player_data = player_data.copy()
-    matchup_data = matchup_data.copy()
-    player_data['year'] = pd.to_numeric(player_data['year'], errors='coerce')
-    player_data['week'] = pd.to_numeric(player_data['week'], errors='coerce')
-    matchup_data['year'] = pd.to_numeric(matchup_data['year'], errors='coerce')
-    matchup_data['week'] = pd.to_numeric(matchup_data['week'], errors='coerce')
-
-    con = duckdb.connect()
-    con.register('player_data', player_data)
-    con.register('matchup_data', matchup_data)
-    pd_pairs = con.execute("""
+    service = get_query_service()
+    pd_pairs = service.query("""
         SELECT DISTINCT year, week
         FROM player_data
         WHERE year IS NOT NULL AND week IS NOT NULL
-    """).df()
-    md_pairs = con.execute("""
+    """, player_data=week_keys)
+    md_pairs = service.query("""
         SELECT DISTINCT year, week
         FROM matchup_data
         WHERE year IS NOT NULL AND week IS NOT NULL
-    """).df()
+    """, matchup_data=matchup_data)
     avail_pairs = pd.merge(pd_pairs, md_pairs, on=['year', 'week'], how='inner') \
                     .drop_duplicates().sort_values(['year', 'week'])
 
@@ -298,6 +274,8 @@ def display_head_to_head(df_dict):
                 placeholder="No weeks",
             )
 
+    player_data = df_dict.frame("Player Data", years=[selected_year])
+
     with col3:
         if selected_year and selected_week is not None:
             matchups = player_data[
@@ -15,7 +15,7 @@ def display_homepage_overview(df_dict):
                 display_champions(df_dict)
             elif sub_tab_name == "Season Standings":
                 # Pass only the needed DataFrame
-                display_season_standings(df_dict["Matchup Data"])
+                display_season_standings(df_dict["Matchup Data"], season_df=df_dict.get("Manager Seasons"))
             elif sub_tab_name == "Schedules":
                 display_schedules(df_dict)
             elif sub_tab_name == "Head-to-Head":
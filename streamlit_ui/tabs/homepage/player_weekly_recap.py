@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 import re
 import html
 import pandas as pd
@@ -47,7 +47,7 @@ AWARD_CSS = """
 """
 
 def _get_player_df(df_dict: Optional[Dict[Any, Any]]) -> Optional[pd.DataFrame]:
-    if not isinstance(df_dict, dict):
+    if not isinstance(df_dict, Mapping):
         return None
     obj = df_dict.get("Player Data")
     if obj is None:
@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional, List, Tuple
+from collections import ChainMap
+from typing import Any, Dict, Mapping, Optional, List, Tuple
 from datetime import datetime
 import re
 
@@ -24,7 +25,7 @@ def _as_dataframe(obj: Any) -> Optional[pd.DataFrame]:
 
 
 def _get_matchup_df(df_dict: Optional[Dict[Any, Any]]) -> Optional[pd.DataFrame]:
-    if not isinstance(df_dict, dict):
+    if not isinstance(df_dict, Mapping):
         return None
     if "Matchup Data" in df_dict:
         return _as_dataframe(df_dict["Matchup Data"])
@@ -85,7 +86,7 @@ def _manager_options(df: Optional[pd.DataFrame]) -> List[str]:
 
 # ----- New helpers for Player Data two-week (current + prior cumulative) slice -----
 def _get_player_df(df_dict: Optional[Dict[Any, Any]]) -> Optional[pd.DataFrame]:
-    if not isinstance(df_dict, dict):
+    if not isinstance(df_dict, Mapping):
         return None
     if "Player Data" in df_dict:
         return _as_dataframe(df_dict["Player Data"])
@@ -240,8 +241,7 @@ def display_recap_overview(df_dict: Optional[Dict[Any, Any]] = None) -> None:
             # Provide contextual info if needed later
             st.session_state["player_prev_cum_week"] = prev_cum
             st.session_state["player_cur_cum_week"] = cur_cum
-            df_dict_player = dict(df_dict or {})
-            df_dict_player["Player Data"] = two_week_df
+            df_dict_player = ChainMap({"Player Data": two_week_df}, df_dict or {})
         else:
             df_dict_player = df_dict
     else:
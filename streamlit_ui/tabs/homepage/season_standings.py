@@ -1,13 +1,55 @@
 import streamlit as st
 import pandas as pd
+from streamlit_ui.data.aggregates import NO_CONSOLATION
+
+# Materialized manager-season columns the standings are built from
+SEASON_COLUMNS = [
+    'game_types', 'manager', 'year', 'games', 'wins', 'team_points', 'opponent_points', 'team_points total',
+    'opponent_points total', 'is_playoffs', 'quarterfinal', 'semifinal', 'championship', 'champion',
+    'team_name', 'playoff_seed_to_date', 'sacko'
+]
 
 class SeasonStandingsViewer:
-    def __init__(self, df):
+    def __init__(self, df, season_df=None):
         self.df = df
+        # Manager-season rows from data.aggregates; the weekly rows are aggregated when they are missing
+        if season_df is not None and all(col in season_df.columns for col in SEASON_COLUMNS):
+            season_df = season_df[season_df['game_types'] == NO_CONSOLATION]
+        else:
+            season_df = None
+        self.season_df = season_df
+
+    def aggregate_seasons(self, per_game):
+        """
+        Per manager and year from the materialized rows, as the weekly aggregation below builds it.
+        """
+        seasons = self.season_df
+        games = seasons['games']
+        aggregated_df = seasons[['manager', 'year', 'team_name', 'playoff_seed_to_date', 'sacko']].copy()
+        if per_game:
+            aggregated_df['team_points'] = seasons['team_points']
+            aggregated_df['opponent_points'] = seasons['opponent_points']
+            aggregated_df['win'] = seasons['wins'] / games
+            aggregated_df['loss'] = 1 - aggregated_df['win']
+        else:
+            aggregated_df['team_points'] = seasons['team_points total']
+            aggregated_df['opponent_points'] = seasons['opponent_points total']
+            aggregated_df['win'] = seasons['wins']
+            aggregated_df['loss'] = games - seasons['wins']
+        for col in ['is_playoffs', 'quarterfinal', 'semifinal', 'championship', 'champion']:
+            aggregated_df[col] = seasons[col] / games if per_game else seasons[col]
+        return aggregated_df.reset_index(drop=True)
 
     def display(self, prefix=""):
         st.header("Season Standings")
         df = self.df
+        if self.season_df is not None:
+            aggregation_type = st.toggle("Per Game", value=False, key=f"{prefix}_aggregation_type")
+            aggregated_df = self.aggregate_seasons(aggregation_type)
+            years_with_champion = set(aggregated_df.loc[aggregated_df['champion'] > 0, 'year'].astype(str))
+            self.display_standings(aggregated_df, aggregation_type, years_with_champion, prefix)
+            return
+
         if 'is_consolation' in df.columns:
             df = df[df['is_consolation'] != 1].copy()
 
@@ -45,58 +87,61 @@ class SeasonStandingsViewer:
             aggregated_df = df.groupby(['manager', 'year']).agg(agg_dict).reset_index()
             aggregated_df = pd.merge(aggregated_df, sacko_df, on=['manager', 'year'], how='left')
 
-            if aggregation_type:
-                columns_to_round_2 = ['team_points', 'opponent_points']
-                aggregated_df[columns_to_round_2] = aggregated_df[columns_to_round_2].round(2)
-                aggregated_df['win'] = aggregated_df['win'].round(3)
-                aggregated_df['loss'] = aggregated_df['loss'].round(3)
-
-            aggregated_df['year'] = aggregated_df['year'].astype(str)
-
             years_with_champion = set(df[df['champion'] == 1]['year'].astype(str).unique())
-            all_years = set(aggregated_df['year'].unique())
-            in_progress_years = all_years - years_with_champion
-
-            def get_final_result(row):
-                if row['year'] in in_progress_years:
-                    return "Season in Progress"
-                if row.get('sacko', False):
-                    return "Sacko"
-                if row.get('champion', 0) > 0:
-                    return "Champion"
-                if row.get('championship', 0) > 0:
-                    return "Lost in Championship"
-                if row.get('semifinal', 0) > 0:
-                    return "Lost in Semifinals"
-                if row.get('quarterfinal', 0) > 0:
-                    return "Lost in Quarterfinals"
-                if row.get('is_playoffs', 0) > 0:
-                    return "Missed Playoffs"
+            self.display_standings(aggregated_df, aggregation_type, years_with_champion, prefix)
+
+    def display_standings(self, aggregated_df, aggregation_type, years_with_champion, prefix):
+        if aggregation_type:
+            columns_to_round_2 = ['team_points', 'opponent_points']
+            aggregated_df[columns_to_round_2] = aggregated_df[columns_to_round_2].round(2)
+            aggregated_df['win'] = aggregated_df['win'].round(3)
+            aggregated_df['loss'] = aggregated_df['loss'].round(3)
+
+        aggregated_df['year'] = aggregated_df['year'].astype(str)
+
+        all_years = set(aggregated_df['year'].unique())
+        in_progress_years = all_years - years_with_champion
+
+        def get_final_result(row):
+            if row['year'] in in_progress_years:
+                return "Season in Progress"
+            if row.get('sacko', False):
+                return "Sacko"
+            if row.get('champion', 0) > 0:
+                return "Champion"
+            if row.get('championship', 0) > 0:
+                return "Lost in Championship"
+            if row.get('semifinal', 0) > 0:
+                return "Lost in Semifinals"
+            if row.get('quarterfinal', 0) > 0:
+                return "Lost in Quarterfinals"
+            if row.get('is_playoffs', 0) > 0:
                 return "Missed Playoffs"
-
-            aggregated_df['Final Result'] = aggregated_df.apply(get_final_result, axis=1)
-
-            display_columns = ['playoff_seed_to_date', 'manager', 'team_name', 'year', 'win', 'loss', 'team_points', 'opponent_points', 'Final Result']
-
-            display_df = aggregated_df[display_columns]
-            display_df = display_df.rename(columns={
-                'playoff_seed_to_date': 'Seed',
-                'manager': 'Manager',
-                'team_name': 'Team',
-                'year': 'Year',
-                'win': 'W',
-                'loss': 'L',
-                'team_points': 'PF',
-                'opponent_points': 'PA'
-            })
-
-            years = sorted(display_df['Year'].unique())
-            selected_year = st.selectbox("Select Year", years, index=len(years)-1, key=f"{prefix}_year")
-            filtered_df = display_df[display_df['Year'] == selected_year]
-            if 'Seed' in filtered_df.columns:
-                filtered_df = filtered_df.sort_values('Seed', ascending=True)
-            st.dataframe(filtered_df, use_container_width=True, hide_index=True)
-
-def display_season_standings(df, prefix=""):
-    viewer = SeasonStandingsViewer(df)
+            return "Missed Playoffs"
+
+        aggregated_df['Final Result'] = aggregated_df.apply(get_final_result, axis=1)
+
+        display_columns = ['playoff_seed_to_date', 'manager', 'team_name', 'year', 'win', 'loss', 'team_points', 'opponent_points', 'Final Result']
+
+        display_df = aggregated_df[display_columns]
+        display_df = display_df.rename(columns={
+            'playoff_seed_to_date': 'Seed',
+            'manager': 'Manager',
+            'team_name': 'Team',
+            'year': 'Year',
+            'win': 'W',
+            'loss': 'L',
+            'team_points': 'PF',
+            'opponent_points': 'PA'
+        })
+
+        years = sorted(display_df['Year'].unique())
+        selected_year = st.selectbox("Select Year", years, index=len(years)-1, key=f"{prefix}_year")
+        filtered_df = display_df[display_df['Year'] == selected_year]
+        if 'Seed' in filtered_df.columns:
+            filtered_df = filtered_df.sort_values('Seed', ascending=True)
+        st.dataframe(filtered_df, use_container_width=True, hide_index=True)
+
+def display_season_standings(df, prefix="", season_df=None):
+    viewer = SeasonStandingsViewer(df, season_df)
     viewer.display(prefix)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 from datetime import datetime
 import re
 
@@ -20,7 +20,7 @@ def _as_dataframe(obj: Any) -> Optional[pd.DataFrame]:
 
 
 def _get_matchup_df(df_dict: Optional[Dict[Any, Any]]) -> Optional[pd.DataFrame]:
-    if not isinstance(df_dict, dict):
+    if not isinstance(df_dict, Mapping):
         return None
     if "Matchup Data" in df_dict:
         return _as_dataframe(df_dict["Matchup Data"])
@@ -492,7 +492,7 @@ def display_weekly_recap(df_dict: Optional[Dict[Any, Any]] = None) -> None:
     # Bottom: raw data browser
     st.divider()
     st.caption("Data ↓")
-    if not isinstance(df_dict, dict) or not df_dict:
+    if not isinstance(df_dict, Mapping) or not df_dict:
         st.info("No dataset available.")
         return
     dfs: Dict[str, pd.DataFrame] = {}
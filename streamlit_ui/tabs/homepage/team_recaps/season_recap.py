@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 import re
 
 import pandas as pd
@@ -19,7 +19,7 @@ def _as_dataframe(obj: Any) -> Optional[pd.DataFrame]:
 
 
 def _get_matchup_df(df_dict: Optional[Dict[Any, Any]]) -> Optional[pd.DataFrame]:
-    if not isinstance(df_dict, dict):
+    if not isinstance(df_dict, Mapping):
         return None
     if "Matchup Data" in df_dict:
         return _as_dataframe(df_dict["Matchup Data"])
@@ -15,11 +15,6 @@ def display_injury_overview(df_dict):
         missing_injury = required_columns - set(injury_data.columns)
         missing_player = required_columns - set(player_data.columns)
         if not missing_injury and not missing_player:
-            for col in ['year', 'week']:
-                if col in injury_data.columns:
-                    injury_data[col] = pd.to_numeric(injury_data[col], errors='coerce')
-                if col in player_data.columns:
-                    player_data[col] = pd.to_numeric(player_data[col], errors='coerce')
             injury_data['player'] = injury_data['player'].astype(str)
             player_data['player'] = player_data['player'].astype(str)
             merged_data = pd.merge(injury_data, player_data, on=['player', 'week', 'year'], how='inner')
@@ -1,6 +1,15 @@
 import streamlit as st
-import duckdb
 import pandas as pd
+from streamlit_ui.data.query_service import get_query_service
+
+# Player Data columns this tab reads; the loader projects the parquet scan to these
+KEEPER_COLUMNS = {
+    "Player Data": [
+        'player', 'manager', 'year', 'week', 'yahoo_position', 'team', 'nfl_team', 'Is Keeper Status',
+        'is_keeper_status', 'kept_next_year', 'keeper_price', 'avg_points_this_year', 'avg_points_next_year',
+        'avg_cost_next_year', 'cost', 'faab_bid', 'total_points_next_year',
+    ],
+}
 
 class KeeperDataViewer:
     def __init__(self, keeper_data):
@@ -10,13 +19,12 @@ class KeeperDataViewer:
         df = self.keeper_data.copy()
         df['year'] = df['year'].astype(str)
         df['manager'] = df['manager'].astype(str)
-        df = df.rename(columns={
-            'Is Keeper Status': 'is_keeper_status',
-            'team': 'nfl_team'
-        })
+        # Legacy names only fill in for a missing current column; both present would register twice
+        legacy = {'Is Keeper Status': 'is_keeper_status', 'team': 'nfl_team'}
+        df = df.drop(columns=[old for old, new in legacy.items() if old in df.columns and new in df.columns])
+        df = df.rename(columns=legacy)
 
-        con = duckdb.connect()
-        con.register('keepers', df)
+        service = get_query_service()
 
         # Filter to only the largest week in each manager/year
         query = """
@@ -30,7 +38,7 @@ class KeeperDataViewer:
                   WHERE k2.manager = keepers.manager AND k2.year = keepers.year
               )
         """
-        df_filtered = con.execute(query).df()
+        df_filtered = service.query(query, keepers=df)
 
         managers = ["All"] + sorted(df_filtered['manager'].unique().tolist())
         years = ["All"] + sorted(df_filtered['year'].unique().tolist())
@@ -46,16 +54,17 @@ class KeeperDataViewer:
 
         if go_button:
             where_clauses = []
+            params = []
             if selected_managers and "All" not in selected_managers:
-                managers_str = ",".join([f"'{m}'" for m in selected_managers])
-                where_clauses.append(f"manager IN ({managers_str})")
+                where_clauses.append("list_contains(?, manager)")
+                params.append(list(selected_managers))
             if selected_years and "All" not in selected_years:
-                years_str = ",".join([f"'{y}'" for y in selected_years])
-                where_clauses.append(f"year IN ({years_str})")
+                where_clauses.append("list_contains(?, year)")
+                params.append(list(selected_years))
             where_sql = " AND ".join(where_clauses)
             if where_sql:
                 query = f"SELECT * FROM df_filtered WHERE {where_sql}"
-                result_df = con.execute(query).df()
+                result_df = service.query(query, params, df_filtered=df_filtered)
             else:
                 result_df = df_filtered
 
@@ -1,15 +1,8 @@
 import streamlit as st
 import pandas as pd
-import duckdb
-import re
 from .matchups.weekly.weekly_matchup_overview import WeeklyMatchupDataViewer
-
-def duckdb_filter(df, sql):
-    con = duckdb.connect()
-    con.register('df', df)
-    result = con.execute(sql).fetchdf()
-    con.close()
-    return result
+from streamlit_ui.data.query_service import duckdb_filter
+from .schedule_matrix import TENSOR_COLUMNS, build_score_tensor, record_table, schedule_swap_records
 
 class EveryonesScheduleViewer(WeeklyMatchupDataViewer):
     def __init__(self, matchup_data_df, player_data_df):
@@ -32,7 +25,8 @@ class EveryonesScheduleViewer(WeeklyMatchupDataViewer):
             include_postseason = st.checkbox("Include Postseason", value=False, key="include_postseason")
 
         # DuckDB filtering
-        year_clause = "" if selected_year == "All" else f"year={int(selected_year)}"
+        year_clause = "" if selected_year == "All" else "year = ?"
+        params = [] if selected_year == "All" else [int(selected_year)]
         season_clauses = []
         if include_regular_season:
             season_clauses.append("(is_playoffs=0 AND is_consolation=0)")
@@ -41,35 +35,13 @@ class EveryonesScheduleViewer(WeeklyMatchupDataViewer):
         where_clauses = " AND ".join(filter(None, [year_clause]))
         if season_clauses:
             where_clauses += (" AND " if where_clauses else "") + "(" + " OR ".join(season_clauses) + ")"
-        sql = f"SELECT * FROM df" + (f" WHERE {where_clauses}" if where_clauses else "")
-        filtered_df = duckdb_filter(self.df, sql)
-
-        # Extract opponent names from columns
-        win_cols = [c for c in filtered_df.columns if re.match(r"w_vs_(.+)_sched", c)]
-        opponent_names = [re.match(r"w_vs_(.+)_sched", c).group(1) for c in win_cols]
-
-        # Filter out opponents where both win and loss columns sum to zero
-        valid_opponents = []
-        for opponent in opponent_names:
-            w_col = f"w_vs_{opponent}_sched"
-            l_col = f"l_vs_{opponent}_sched"
-            if w_col in filtered_df.columns and l_col in filtered_df.columns:
-                if filtered_df[w_col].sum() + filtered_df[l_col].sum() > 0:
-                    valid_opponents.append(opponent)
-
-        result_df = pd.DataFrame(columns=['manager'] + [f"{opponent.title()}'s" for opponent in valid_opponents])
-        result_df['manager'] = filtered_df['manager'].unique()
-
-        for manager in result_df['manager']:
-            manager_rows = filtered_df[filtered_df['manager'] == manager]
-            for opponent in valid_opponents:
-                w_col = f"w_vs_{opponent}_sched"
-                l_col = f"l_vs_{opponent}_sched"
-                wins = manager_rows[w_col].sum() if w_col in manager_rows else 0
-                losses = manager_rows[l_col].sum() if l_col in manager_rows else 0
-                result_df.loc[result_df['manager'] == manager, f"{opponent.title()}'s"] = f"{int(wins)}-{int(losses)}"
+        sql = f"SELECT {', '.join(TENSOR_COLUMNS)} FROM df" + (f" WHERE {where_clauses}" if where_clauses else "")
+        filtered_df = duckdb_filter(self.df, sql, params)
 
-        result_df = result_df.sort_values(by='manager').reset_index(drop=True)
+        # Records come from the score tensor rather than per-opponent columns
+        managers, scores, opponents = build_score_tensor(filtered_df)
+        wins, losses = schedule_swap_records(scores, opponents)
+        result_df = record_table(managers, wins, losses, "{}'s")
 
         def highlight_matching_cells(val, manager, column):
             color = 'yellow' if manager.lower() in column.lower() else ''
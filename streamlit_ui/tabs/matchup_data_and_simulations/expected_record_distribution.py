@@ -0,0 +1,45 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+
+def weekly_win_probabilities(season_df):
+    """
+    (manager x week) chance of beating a randomly drawn opponent: teams_beat_this_week / (league_size - 1).
+    Weeks a manager did not play are NaN.
+    """
+    league_size = season_df.groupby('week')['manager'].transform('nunique')
+    prob = season_df['teams_beat_this_week'] / (league_size - 1).where(league_size > 1)
+    table = prob.groupby([season_df['manager'], season_df['week']]).first().unstack('week')
+    return table.index.to_numpy(), table.columns.to_numpy(), table.to_numpy(dtype=float)
+
+
+def poisson_binomial(probs):
+    """
+    Exact win-count distribution for independent games, one row of probabilities per manager.
+    Returns (managers x games + 1); NaN entries are skipped as unplayed weeks.
+    """
+    num_managers, num_games = probs.shape
+    dist = np.zeros((num_managers, num_games + 1))
+    dist[:, 0] = 1.0
+    for g in range(num_games):
+        p = probs[:, g:g + 1]
+        played = ~np.isnan(p)
+        p = np.where(played, p, 0.0)
+        shifted = np.zeros_like(dist)
+        shifted[:, 1:] = dist[:, :-1]
+        dist = np.where(played, dist * (1 - p) + shifted * p, dist)
+    return dist
+
+
+@st.cache_data(show_spinner=False)
+def expected_record_distribution(season_df, week):
+    """
+    Percentage chance of each record through `week` for one season, against a random schedule.
+    season_df needs manager, week and teams_beat_this_week; columns are labelled "W-L".
+    """
+    season_df = season_df[season_df['week'] <= week]
+    managers, _, probs = weekly_win_probabilities(season_df)
+    dist = poisson_binomial(probs) * 100
+    columns = [f"{k}-{week - k}" for k in range(dist.shape[1])]
+    return pd.DataFrame(dist, index=pd.Index(managers, name='manager'), columns=columns)
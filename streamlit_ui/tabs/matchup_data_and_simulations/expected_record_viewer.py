@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from .matchups.weekly.weekly_matchup_overview import WeeklyMatchupDataViewer
+from .expected_record_distribution import expected_record_distribution
 
 def _select_week(base_df):
     if base_df.empty or base_df['year'].dropna().empty:
@@ -45,22 +46,13 @@ def _render_expected_record(base_df, year, week):
     if week_slice.empty:
         st.info("No rows for selected year/week.")
         return
-    shuffle_cols = [
-        c for c in week_slice.columns
-        if c.startswith("shuffle_") and c.endswith("_win") and int(c.split('_')[1]) <= week
-    ]
-    if not shuffle_cols:
-        st.info("No shuffle win cols.")
+    if 'teams_beat_this_week' not in base_df.columns:
+        st.info("No teams_beat_this_week column.")
         return
-    shuffle_cols = sorted(shuffle_cols, key=lambda x: int(x.split('_')[1]))
-    needed = ['manager', 'wins_to_date', 'losses_to_date'] + shuffle_cols
-    needed = [c for c in needed if c in week_slice.columns]
-    df = (week_slice[needed]
-          .drop_duplicates(subset=['manager'])
-          .set_index('manager')
-          .sort_index())
-    rename_map = {c: f"{int(c.split('_')[1])}-{week - int(c.split('_')[1])}" for c in shuffle_cols}
-    df = df.rename(columns=rename_map)
+    season_df = base_df.loc[base_df['year'] == year, ['manager', 'week', 'teams_beat_this_week']]
+    df = expected_record_distribution(season_df, week)
+    record_cols = [c for c in ['manager', 'wins_to_date', 'losses_to_date'] if c in week_slice.columns]
+    df = df.join(week_slice[record_cols].drop_duplicates(subset=['manager']).set_index('manager'))
     if {'wins_to_date', 'losses_to_date'}.issubset(df.columns):
         df['Actual Record'] = df['wins_to_date'].astype(int).astype(str) + '-' + df['losses_to_date'].astype(int).astype(str)
         df = df.drop(columns=['wins_to_date', 'losses_to_date'])
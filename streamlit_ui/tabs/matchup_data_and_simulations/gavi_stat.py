@@ -0,0 +1,18 @@
+import pandas as pd
+import streamlit as st
+
+GAVI_COLUMNS = ['manager', 'year', 'week', 'win', 'loss', 'is_playoffs', 'is_consolation']
+
+
+@st.cache_data(show_spinner=False)
+def compute_xwins(matchup_df, beat_column='teams_beat_this_week'):
+    """
+    Row-wise xWins/xLosses/delta from `beat_column`, with league size counted per season.
+    Pass only GAVI_COLUMNS plus `beat_column` so the cache key stays cheap to hash.
+    """
+    df = matchup_df.copy()
+    league_size = df.groupby('year')['manager'].transform('nunique')
+    df['xWins'] = df[beat_column] / (league_size - 1).where(league_size > 1)
+    df['xLosses'] = (df['win'] + df['loss']) - df['xWins']
+    df['delta'] = df['win'] - df['xWins']
+    return df
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from .matchups.weekly.weekly_matchup_overview import WeeklyMatchupDataViewer
+from .gavi_stat import GAVI_COLUMNS, compute_xwins
 
 class GaviStatViewer(WeeklyMatchupDataViewer):
     def __init__(self, matchup_data_df, player_data_df):
@@ -23,14 +24,8 @@ class GaviStatViewer(WeeklyMatchupDataViewer):
         # Add aggregate toggle
         aggregate_toggle = st.toggle("Aggregate All Years", value=False, key="gavi_stat_aggregate_toggle")
 
-        # Calculate xWins, xLosses, and delta for each manager and year
-        def calculate_xwins_xlosses(df):
-            df['xWins'] = df['teams_beat_this_week'] / 9
-            df['xLosses'] = (df['win'] + df['loss']) - df['xWins']
-            df['delta'] = df['win'] - df['xWins']
-            return df
-
-        self.df = self.df.groupby(['manager', 'year']).apply(calculate_xwins_xlosses).reset_index(drop=True)
+        # xWins/xLosses/delta are computed once per data version and reused across reruns
+        self.df = compute_xwins(self.df[GAVI_COLUMNS + ['teams_beat_this_week']], 'teams_beat_this_week')
 
         # Filter data based on selected manager and year
         if selected_manager != "All":
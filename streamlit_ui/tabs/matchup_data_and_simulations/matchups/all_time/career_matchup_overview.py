@@ -1,13 +1,17 @@
 import streamlit as st
 import pandas as pd
+from streamlit_ui.data.aggregates import game_selection
 from .career_optimal_lineups import display_career_optimal_lineup
 from .career_head_to_head_overview import CareerHeadToHeadViewer
 from .career_team_ratings import CareerTeamRatingsViewer
 
 class CareerMatchupOverviewViewer:
-    def __init__(self, df, player_df):
+    def __init__(self, df, player_df, manager_seasons=None, manager_careers=None):
         self.df = df
         self.player_df = player_df
+        # Materialized manager-season / manager-career rows (see data.aggregates)
+        self.manager_seasons = manager_seasons
+        self.manager_careers = manager_careers
 
     def filter_data(self, df, regular_season, playoffs, consolation, selected_managers, selected_opponents, selected_years):
         filtered_df = df.copy()
@@ -28,6 +32,26 @@ class CareerMatchupOverviewViewer:
             filtered_df = filtered_df[filtered_df['year'].isin(selected_years)]
         return filtered_df
 
+    def team_rating_rows(self, regular_season, playoffs, consolation, selected_managers, selected_opponents, selected_years):
+        """
+        (season_df, career_df) for the filters from the materialized tables; (None, None) when an
+        opponent filter needs the weekly rows, and career_df is None when only some years are picked.
+        """
+        if self.manager_seasons is None or selected_opponents:
+            return None, None
+        games = game_selection(regular_season, playoffs, consolation)
+        seasons = self.manager_seasons[self.manager_seasons['game_types'] == games]
+        if selected_managers:
+            seasons = seasons[seasons['manager'].isin(selected_managers)]
+        if selected_years:
+            return seasons[seasons['year'].isin(selected_years)], None
+        if self.manager_careers is None:
+            return seasons, None
+        careers = self.manager_careers[self.manager_careers['game_types'] == games]
+        if selected_managers:
+            careers = careers[careers['manager'].isin(selected_managers)]
+        return seasons, careers
+
     def display(self, prefix=""):
         if self.df is not None:
             # Dropdown filters for manager, opponent, and year
@@ -74,7 +98,10 @@ class CareerMatchupOverviewViewer:
                     elif tab_name == "Optimal Stats":
                         display_career_optimal_lineup(self.player_df, filtered_df)
                     elif tab_name == "Team Ratings":
-                        viewer = CareerTeamRatingsViewer(filtered_df)
+                        season_df, career_df = self.team_rating_rows(
+                            regular_season, playoffs, consolation, selected_managers, selected_opponents, selected_years
+                        )
+                        viewer = CareerTeamRatingsViewer(filtered_df, season_df, career_df)
                         viewer.display(prefix=f"{prefix}_{tab_name.lower().replace(' ', '_')}")
                     elif tab_name == "Head-to-Head":
                         head_to_head_viewer = CareerHeadToHeadViewer(filtered_df)
@@ -1,12 +1,9 @@
 import pandas as pd
 import streamlit as st
-import duckdb
+from streamlit_ui.data.query_service import get_query_service
 
 def display_career_optimal_lineup(player_df, matchup_data, prefix=""):
     # Use DuckDB for memory-efficient merge
-    con = duckdb.connect()
-    con.register('player_data', player_df)
-    con.register('matchup_data', matchup_data)
 
     # Only select necessary columns to reduce memory usage
     merge_query = """
@@ -21,7 +18,7 @@ def display_career_optimal_lineup(player_df, matchup_data, prefix=""):
     WHERE m.manager IS NOT NULL
     """
 
-    filtered_df = con.execute(merge_query).df()
+    filtered_df = get_query_service().query(merge_query, player_data=player_df, matchup_data=matchup_data)
 
     # Create a new column that sums the points when optimal_player is 1
     filtered_df['optimal_points_sum'] = filtered_df[filtered_df['optimal_player'] == 1].groupby(['manager', 'week', 'year'])['points'].transform('sum')
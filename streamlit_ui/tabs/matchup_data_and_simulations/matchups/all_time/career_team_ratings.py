@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List, Callable
+from typing import Callable, Dict, List, Optional
 import pandas as pd
 import streamlit as st
 
@@ -13,12 +13,12 @@ class CareerTeamRatingsViewer:
       * Sum across seasons: wins_vs_shuffle_wins, seed_vs_shuffle_seed
       * Average across seasons: Final Playoff Seed
     - Hides `week`, `year`, and `opponent` from display.
+    - `season_df` / `career_df` are the materialized manager-season / manager-career rows for the
+      same games; when given, the weekly rows are not re-aggregated.
     """
 
-    def __init__(self, df: pd.DataFrame) -> None:
-        # Deduplicate same-named columns
-        self.base_df = df.loc[:, ~df.columns.duplicated()].copy()
-
+    def __init__(self, df: pd.DataFrame, season_df: Optional[pd.DataFrame] = None,
+                 career_df: Optional[pd.DataFrame] = None) -> None:
         # Coerce numerics
         self.numeric_cols: List[str] = [
             "team_points", "win", "loss", "opponent_points",
@@ -31,9 +31,6 @@ class CareerTeamRatingsViewer:
             "seed_vs_shuffle_seed", "power_rating", "power rating",
             "week", "year",
         ]
-        for c in self.numeric_cols:
-            if c in self.base_df.columns:
-                self.base_df[c] = pd.to_numeric(self.base_df[c], errors="coerce")
 
         # Columns not to show at career level
         self.hidden_cols: List[str] = ["Opponent Week", "OpponentYear", "week", "opponent", "year"]
@@ -55,8 +52,17 @@ class CareerTeamRatingsViewer:
         ]
 
         # Build career aggregation
-        season_df = self._aggregate_by_season(self.base_df)
-        self.agg_df = self._aggregate_career(season_df)
+        if career_df is not None:
+            self.agg_df = career_df
+        elif season_df is not None:
+            self.agg_df = self._aggregate_career(season_df)
+        else:
+            # Deduplicate same-named columns
+            self.base_df = df.loc[:, ~df.columns.duplicated()].copy()
+            for c in self.numeric_cols:
+                if c in self.base_df.columns:
+                    self.base_df[c] = pd.to_numeric(self.base_df[c], errors="coerce")
+            self.agg_df = self._aggregate_career(self._aggregate_by_season(self.base_df))
 
     @staticmethod
     def _last_non_null(s: pd.Series):
@@ -21,7 +21,9 @@ def display_matchup_overview(df_dict, prefix=""):
                     matchup_data_viewer = SeasonMatchupOverviewViewer(matchup_data, player_data)
                     matchup_data_viewer.display(prefix=f"{prefix}_season_matchup_data")
                 elif sub_tab_name == "Career":
-                    career_matchup_viewer = CareerMatchupOverviewViewer(matchup_data, player_data)
+                    career_matchup_viewer = CareerMatchupOverviewViewer(
+                        matchup_data, player_data, df_dict.get("Manager Seasons"), df_dict.get("Manager Careers")
+                    )
                     career_matchup_viewer.display(prefix=f"{prefix}_career_matchup_data")
             else:
                 st.error(f"{sub_tab_name} Matchup Data or Player Data not found.")
\ No newline at end of file
@@ -1,6 +1,6 @@
 import pandas as pd
 import streamlit as st
-import duckdb
+from streamlit_ui.data.query_service import get_query_service
 
 def display_season_optimal_lineup(player_df, filtered_matchup_data, unfiltered_matchup_data):
     if 'manager' not in filtered_matchup_data.columns:
@@ -8,9 +8,6 @@ def display_season_optimal_lineup(player_df, filtered_matchup_data, unfiltered_m
         return
 
     # Use DuckDB for memory-efficient merge
-    con = duckdb.connect()
-    con.register('player_data', player_df)
-    con.register('matchup_data', filtered_matchup_data)
 
     # Only select necessary columns to reduce memory usage
     merge_query = """
@@ -25,7 +22,7 @@ def display_season_optimal_lineup(player_df, filtered_matchup_data, unfiltered_m
     WHERE m.manager IS NOT NULL
     """
 
-    merged_df = con.execute(merge_query).df()
+    merged_df = get_query_service().query(merge_query, player_data=player_df, matchup_data=filtered_matchup_data)
 
     # Rest of the processing remains the same
     merged_df['optimal_points_sum'] = merged_df[merged_df['optimal_player'] == 1].groupby(['manager', 'week', 'year'])[
@@ -1,6 +1,6 @@
-import duckdb
 import pandas as pd
 import streamlit as st
+from streamlit_ui.data.query_service import get_query_service
 
 def display_weekly_optimal_lineup(matchup_df: pd.DataFrame, player_df: pd.DataFrame):
     need_p = {"manager","week","year","points","optimal_player"}
@@ -12,11 +12,7 @@ def display_weekly_optimal_lineup(matchup_df: pd.DataFrame, player_df: pd.DataFr
     if miss_m:
         st.error(f"Matchup data missing: {sorted(miss_m)}"); return
 
-    con = duckdb.connect(database=":memory:")
-    con.register("p", player_df)
-    con.register("m", matchup_df)
-
-    res = con.execute("""
+    res = get_query_service().query("""
         WITH optimal AS (
             SELECT
                 manager,
@@ -73,8 +69,7 @@ def display_weekly_optimal_lineup(matchup_df: pd.DataFrame, player_df: pd.DataFr
         LEFT JOIN opp o2
           ON o2.manager = j.opponent AND o2.week = j.week AND o2.year = j.year
         ORDER BY j.year, j.week, j.manager
-    """).df()
-    con.close()
+    """, p=player_df, m=matchup_df)
 
     # Pretty columns
     res["Year"] = res["year"].astype("Int64").astype(str)
@@ -1,16 +1,15 @@
 import streamlit as st
-import duckdb
+from streamlit_ui.data.query_service import duckdb_filter
+from .playoff_odds_simulation import fit_scoring_distributions, simulate_playoff_odds
+from .shuffle_scores_and_schedules.simulation_cache import get_simulation_cache
 
 class PlayoffOddsViewer:
-    def __init__(self, matchup_data_df):
+    def __init__(self, matchup_data_df, schedule_data_df=None):
         self.df = matchup_data_df.copy()
+        self.schedule_df = schedule_data_df
 
-    def duckdb_query(self, sql):
-        con = duckdb.connect()
-        con.register('df', self.df)
-        result = con.execute(sql).fetchdf()
-        con.close()
-        return result
+    def duckdb_query(self, sql, params=None):
+        return duckdb_filter(self.df, sql, params)
 
     def display(self):
         st.subheader("Playoff Odds Monte Carlo Simulation")
@@ -23,34 +22,50 @@ class PlayoffOddsViewer:
         sim_mode = st.radio("Simulation Start", ["Start from Today", "Start from Specific Date"])
         if sim_mode == "Start from Today":
             season = max_season
-            sql_weeks = f"SELECT DISTINCT week FROM df WHERE year = {season}"
-            all_weeks = sorted(self.duckdb_query(sql_weeks)["week"].tolist())
+            sql_weeks = "SELECT DISTINCT week FROM df WHERE year = ?"
+            all_weeks = sorted(self.duckdb_query(sql_weeks, [int(season)])["week"].tolist())
             week = max(all_weeks)
             go_clicked = st.button("Go", key="go_today")
         else:
             cols = st.columns([2, 2, 1])
             season = cols[0].selectbox("Select Season", seasons, index=len(seasons) - 1)
-            sql_weeks = f"SELECT DISTINCT week FROM df WHERE year = {season}"
-            all_weeks = sorted(self.duckdb_query(sql_weeks)["week"].tolist())
+            sql_weeks = "SELECT DISTINCT week FROM df WHERE year = ?"
+            all_weeks = sorted(self.duckdb_query(sql_weeks, [int(season)])["week"].tolist())
             week = cols[1].selectbox("Select Week", all_weeks, index=len(all_weeks) - 1)
             go_clicked = cols[2].button("Go", key="go_specific")
 
-        # Filter regular season and week using DuckDB
-        sql_odds = f"""
-            SELECT *
-            FROM df
-            WHERE year = {season}
-              AND is_playoffs = 0
-              AND week = {week}
-        """
-        odds = self.duckdb_query(sql_odds)
+        sim_cols = st.columns([2, 1])
+        simulations = sim_cols[0].number_input(
+            "Simulations", min_value=1000, max_value=500000, value=50000, step=10000,
+            key="playoff_odds_simulations"
+        )
+        seed = sim_cols[1].number_input(
+            "Random Seed", min_value=0, value=None, step=1, placeholder="Random",
+            help="Leave empty for a fresh random run; set a seed to repeat a run exactly",
+            key="playoff_odds_seed"
+        )
 
-        odds_cols = [
-            "avg_seed", "manager", "p_playoffs", "p_bye", "exp_final_wins",
-            "exp_final_pf", "p_semis", "p_final", "p_champ"
-        ]
-        odds_table = odds[odds_cols].sort_values("avg_seed", ascending=True).reset_index(drop=True)
+        # Scoring assumptions default to fits from team_points history and can be edited before simulating
+        history = self.duckdb_query("SELECT * FROM df WHERE year <= ?", [int(season)])
+        distributions = fit_scoring_distributions(history, int(season), int(week))
+        with st.expander("Scoring Assumptions"):
+            distributions = st.data_editor(
+                distributions.rename(columns={"manager": "Manager", "mean": "Mean", "std": "Std Dev"}).round(2),
+                hide_index=True, disabled=["Manager"], key=f"playoff_odds_assumptions_{season}_{week}"
+            ).rename(columns={"Manager": "manager", "Mean": "mean", "Std Dev": "std"})
 
         if go_clicked:
+            inputs = [history[["year", "week", "manager", "opponent", "team_points", "win", "is_playoffs",
+                               "is_consolation", "team_made_playoffs", "team_got_bye"]], distributions]
+            if self.schedule_df is not None:
+                inputs.append(self.schedule_df[["year", "week", "manager", "opponent", "is_playoffs", "is_consolation"]])
+            odds_table = get_simulation_cache().get_or_compute(
+                "playoff_odds",
+                lambda: simulate_playoff_odds(
+                    history, int(season), int(week), int(simulations),
+                    schedule_df=self.schedule_df, distributions=distributions, seed=seed
+                ),
+                inputs, (int(season), int(week), int(simulations)), seed
+            )
             st.subheader("Simulation Odds")
-            st.dataframe(odds_table, hide_index=True)
\ No newline at end of file
+            st.dataframe(odds_table, hide_index=True)
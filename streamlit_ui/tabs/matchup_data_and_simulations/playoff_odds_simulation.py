@@ -0,0 +1,217 @@
+import pandas as pd
+import numpy as np
+
+# Seasons simulated per vectorized block; bounds peak memory for large runs
+BLOCK_SIZE = 10000
+
+# Games of prior history that weigh as much as the current season's average
+PRIOR_GAMES = 4
+
+ODDS_COLUMNS = [
+    "avg_seed", "manager", "p_playoffs", "p_bye", "exp_final_wins",
+    "exp_final_pf", "p_semis", "p_final", "p_champ"
+]
+
+
+def season_format(matchup_df, season, schedule_df=None):
+    """
+    Regular-season length, playoff teams and byes for a season.
+    Seasons still in progress borrow the playoff format of the latest finished season.
+    """
+    source = schedule_df if schedule_df is not None and (schedule_df['year'] == season).any() else matchup_df
+    season_rows = source[source['year'] == season]
+    regular = season_rows[(season_rows['is_playoffs'] == 0) & (season_rows['is_consolation'] == 0)]
+    regular_weeks = int(regular['week'].max())
+
+    finished = matchup_df.drop_duplicates(['year', 'manager'])
+    finished = finished[finished['team_made_playoffs'].fillna(0) > 0]
+    formats = finished.groupby('year').agg(
+        playoff_teams=('team_made_playoffs', 'size'),
+        byes=('team_got_bye', lambda s: int((s.fillna(0) > 0).sum())),
+    )
+    if season in formats.index:
+        row = formats.loc[season]
+    elif (formats.index < season).any():
+        row = formats[formats.index < season].iloc[-1]
+    else:
+        row = formats.iloc[-1] if len(formats) else pd.Series({'playoff_teams': 6, 'byes': 2})
+    return regular_weeks, int(row['playoff_teams']), int(row['byes'])
+
+
+def fit_scoring_distributions(matchup_df, season, week):
+    """
+    Per-manager normal scoring model from team_points through (season, week).
+    The mean blends the current season with the manager's history; the spread is the
+    manager's historical standard deviation, falling back to the league's.
+    """
+    games = matchup_df[matchup_df['is_consolation'] == 0]
+    games = games[(games['year'] < season) | ((games['year'] == season) & (games['week'] <= week))]
+    current = games[games['year'] == season]
+
+    history = games.groupby('manager')['team_points'].agg(['mean', 'std'])
+    season_stats = current.groupby('manager')['team_points'].agg(['mean', 'size'])
+
+    managers = pd.Index(sorted(matchup_df.loc[matchup_df['year'] == season, 'manager'].unique()))
+    league_mean = games['team_points'].mean()
+    league_std = games['team_points'].std()
+
+    prior_mean = history['mean'].reindex(managers).fillna(league_mean)
+    season_mean = season_stats['mean'].reindex(managers).fillna(prior_mean)
+    season_games = season_stats['size'].reindex(managers).fillna(0)
+    mean = (season_mean * season_games + prior_mean * PRIOR_GAMES) / (season_games + PRIOR_GAMES)
+    std = history['std'].reindex(managers).fillna(league_std)
+    return pd.DataFrame({'manager': managers, 'mean': mean.to_numpy(), 'std': std.to_numpy()})
+
+
+def standings_to_date(matchup_df, season, week, managers):
+    games = matchup_df[
+        (matchup_df['year'] == season) & (matchup_df['week'] <= week)
+        & (matchup_df['is_playoffs'] == 0) & (matchup_df['is_consolation'] == 0)
+    ]
+    totals = games.groupby('manager').agg(wins=('win', 'sum'), points=('team_points', 'sum'))
+    totals = totals.reindex(managers).fillna(0)
+    return totals['wins'].to_numpy(dtype=float), totals['points'].to_numpy(dtype=float)
+
+
+def remaining_games(matchup_df, season, week, regular_weeks, managers, schedule_df=None):
+    """
+    Regular-season games after `week` as (home, away) manager index arrays, one entry per game.
+    """
+    source = schedule_df if schedule_df is not None and (schedule_df['year'] == season).any() else matchup_df
+    games = source[
+        (source['year'] == season) & (source['week'] > week) & (source['week'] <= regular_weeks)
+        & (source['is_playoffs'] == 0) & (source['is_consolation'] == 0)
+    ]
+    home = managers.get_indexer(games['manager'])
+    away = managers.get_indexer(games['opponent'])
+    keep = (home >= 0) & (away >= 0) & (home < away)
+    return home[keep], away[keep]
+
+
+def seed_order(wins, points, rng):
+    """
+    Manager indices ordered by seed for every simulation: wins, then points for, then a coin flip.
+    """
+    return np.lexsort((rng.random(wins.shape), -points, -wins), axis=1)
+
+
+def play_bracket(seeded, means, stds, num_playoff_teams, num_byes, rng):
+    """
+    Single-elimination bracket, reseeded each round so the best seed meets the worst.
+    Returns boolean (iterations x managers) arrays for reaching the semis, the final and winning it.
+    """
+    iterations, num_managers = seeded.shape
+    rows = np.arange(iterations)[:, None]
+    reached = {}
+
+    alive = seeded[:, :num_playoff_teams]
+    alive_seed = np.broadcast_to(np.arange(num_playoff_teams), alive.shape)
+    byes = num_byes
+    while alive.shape[1] > 1:
+        for size in (4, 2):
+            if alive.shape[1] == size:
+                mask = np.zeros((iterations, num_managers), dtype=bool)
+                mask[rows, alive] = True
+                reached[size] = mask
+
+        playing, playing_seed = alive[:, byes:], alive_seed[:, byes:]
+        half = playing.shape[1] // 2
+        high, low = playing[:, :half], playing[:, ::-1][:, :half]
+        high_score = rng.normal(means[high], stds[high])
+        low_score = rng.normal(means[low], stds[low])
+        high_wins = high_score >= low_score
+        winners = np.where(high_wins, high, low)
+        winner_seed = np.where(high_wins, playing_seed[:, :half], playing_seed[:, ::-1][:, :half])
+
+        # An odd field leaves its middle seed idle for the round
+        idle = playing[:, half:playing.shape[1] - half]
+        idle_seed = playing_seed[:, half:playing.shape[1] - half]
+        alive = np.hstack([alive[:, :byes], idle, winners])
+        alive_seed = np.hstack([alive_seed[:, :byes], idle_seed, winner_seed])
+        order = np.argsort(alive_seed, axis=1, kind='stable')
+        alive = np.take_along_axis(alive, order, axis=1)
+        alive_seed = np.take_along_axis(alive_seed, order, axis=1)
+        byes = 0
+
+    champion = np.zeros((iterations, num_managers), dtype=bool)
+    champion[rows, alive] = True
+    semis = reached.get(4, reached.get(2, champion))
+    final = reached.get(2, champion)
+    return semis, final, champion
+
+
+def simulate_playoff_odds(matchup_df, season, week, iterations=50000, schedule_df=None,
+                          distributions=None, seed=None):
+    """
+    Monte Carlo playoff odds for `season` as of the end of `week`.
+    Remaining regular-season games come from the schedule, scores are drawn from the per-manager
+    distributions (fitted from team_points unless given) and the playoff bracket is played out.
+    Returns one row per manager with ODDS_COLUMNS; probabilities are percentages.
+    """
+    rng = np.random.default_rng(seed)
+    regular_weeks, num_playoff_teams, num_byes = season_format(matchup_df, season, schedule_df)
+    week = min(week, regular_weeks)
+
+    if distributions is None:
+        distributions = fit_scoring_distributions(matchup_df, season, week)
+    managers = pd.Index(distributions['manager'])
+    means = distributions['mean'].to_numpy(dtype=float)
+    stds = distributions['std'].fillna(0).clip(lower=0).to_numpy(dtype=float)
+    num_managers = len(managers)
+    num_playoff_teams = min(num_playoff_teams, num_managers)
+    num_byes = min(num_byes, num_playoff_teams)
+
+    base_wins, base_points = standings_to_date(matchup_df, season, week, managers)
+    home, away = remaining_games(matchup_df, season, week, regular_weeks, managers, schedule_df)
+
+    # Game-to-manager incidence matrices turn per-game results into season totals with one matmul
+    home_matrix = np.zeros((len(home), num_managers))
+    home_matrix[np.arange(len(home)), home] = 1
+    away_matrix = np.zeros((len(away), num_managers))
+    away_matrix[np.arange(len(away)), away] = 1
+
+    seed_sum = np.zeros(num_managers)
+    wins_sum = np.zeros(num_managers)
+    points_sum = np.zeros(num_managers)
+    playoffs = np.zeros(num_managers)
+    bye = np.zeros(num_managers)
+    semis = np.zeros(num_managers)
+    final = np.zeros(num_managers)
+    champ = np.zeros(num_managers)
+
+    remaining = iterations
+    while remaining > 0:
+        block = min(BLOCK_SIZE, remaining)
+        home_score = rng.normal(means[home], stds[home], (block, len(home)))
+        away_score = rng.normal(means[away], stds[away], (block, len(away)))
+        home_won = (home_score > away_score).astype(float)
+        wins = base_wins + home_won @ home_matrix + (1 - home_won) @ away_matrix
+        points = base_points + home_score @ home_matrix + away_score @ away_matrix
+
+        seeded = seed_order(wins, points, rng)
+        seeds = np.empty_like(seeded)
+        np.put_along_axis(seeds, seeded, np.arange(1, num_managers + 1)[None, :], axis=1)
+
+        made_semis, made_final, won = play_bracket(seeded, means, stds, num_playoff_teams, num_byes, rng)
+        seed_sum += seeds.sum(axis=0)
+        wins_sum += wins.sum(axis=0)
+        points_sum += points.sum(axis=0)
+        playoffs += (seeds <= num_playoff_teams).sum(axis=0)
+        bye += (seeds <= num_byes).sum(axis=0)
+        semis += made_semis.sum(axis=0)
+        final += made_final.sum(axis=0)
+        champ += won.sum(axis=0)
+        remaining -= block
+
+    odds = pd.DataFrame({
+        'avg_seed': seed_sum / iterations,
+        'manager': managers,
+        'p_playoffs': playoffs / iterations * 100,
+        'p_bye': bye / iterations * 100,
+        'exp_final_wins': wins_sum / iterations,
+        'exp_final_pf': points_sum / iterations,
+        'p_semis': semis / iterations * 100,
+        'p_final': final / iterations * 100,
+        'p_champ': champ / iterations * 100,
+    })
+    return odds[ODDS_COLUMNS].round(2).sort_values('avg_seed').reset_index(drop=True)
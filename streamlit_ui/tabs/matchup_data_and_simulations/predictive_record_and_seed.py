@@ -1,14 +1,7 @@
 import re
 import pandas as pd
 import streamlit as st
-import duckdb
-
-def duckdb_filter(df, sql):
-    con = duckdb.connect()
-    con.register('base_df', df)
-    result = con.execute(sql).fetchdf()
-    con.close()
-    return result
+from streamlit_ui.data.query_service import duckdb_filter
 
 def _pred_select_week(base_df: pd.DataFrame):
     mode = st.radio("Selection Mode", ["Today's Date", "Specific Week"],
@@ -36,7 +29,9 @@ def _pred_select_week(base_df: pd.DataFrame):
 def _pred_render_expected_record(base_df: pd.DataFrame, year: int, week: int):
     week_slice = duckdb_filter(
         base_df,
-        f"SELECT * FROM base_df WHERE year={year} AND week={week}"
+        "SELECT * FROM base_df WHERE year = ? AND week = ?",
+        [year, week],
+        name="base_df"
     )
     if week_slice.empty:
         st.info("No rows for selected year/week.")
@@ -79,7 +74,9 @@ def _pred_render_expected_record(base_df: pd.DataFrame, year: int, week: int):
 def _pred_render_expected_seed(base_df: pd.DataFrame, year: int, week: int):
     week_df = duckdb_filter(
         base_df,
-        f"SELECT * FROM base_df WHERE year={year} AND week={week}"
+        "SELECT * FROM base_df WHERE year = ? AND week = ?",
+        [year, week],
+        name="base_df"
     )
     if week_df.empty:
         st.info("No rows for selected year/week.")
@@ -149,7 +146,8 @@ def display_predicted_record_and_seed(matchup_data_df: pd.DataFrame):
         return
     base_df = duckdb_filter(
         matchup_data_df,
-        "SELECT * FROM base_df WHERE is_playoffs=0 AND is_consolation=0"
+        "SELECT * FROM base_df WHERE is_playoffs=0 AND is_consolation=0",
+        name="base_df"
     )
     if base_df.empty:
         st.write("No regular season data available")
@@ -0,0 +1,66 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+TENSOR_COLUMNS = ['year', 'week', 'manager', 'opponent', 'team_points']
+
+
+@st.cache_data(show_spinner=False)
+def build_score_tensor(df):
+    """
+    Scores and opponents laid out as (season-week, manager) matrices.
+    Returns (managers, scores, opponents): scores is NaN and opponents -1 where a manager did not play.
+    Pass only TENSOR_COLUMNS so the cache key stays cheap to hash.
+    """
+    managers = pd.Index(sorted(df['manager'].dropna().unique()))
+    keys, rows = np.unique(df[['year', 'week']].to_numpy(dtype=np.int64), axis=0, return_inverse=True)
+    rows = rows.ravel()
+    cols = managers.get_indexer(df['manager'])
+
+    scores = np.full((len(keys), len(managers)), np.nan)
+    opponents = np.full((len(keys), len(managers)), -1, dtype=np.int64)
+    scores[rows, cols] = df['team_points'].to_numpy(dtype=float)
+    opponents[rows, cols] = managers.get_indexer(df['opponent'])
+    return managers.to_numpy(), scores, opponents
+
+
+def _opponent_scores(scores, opponents):
+    gathered = np.take_along_axis(scores, np.where(opponents >= 0, opponents, 0), axis=1)
+    return np.where(opponents >= 0, gathered, np.nan)
+
+
+def schedule_swap_records(scores, opponents):
+    """
+    Record of every manager a playing every manager b's schedule, as (wins, losses) matrices [a, b].
+    Weeks where b's opponent is a are skipped, since a cannot play itself.
+    """
+    opp_scores = _opponent_scores(scores, opponents)
+    own = scores[:, :, None]
+    theirs = opp_scores[:, None, :]
+    playable = opponents[:, None, :] != np.arange(scores.shape[1])[None, :, None]
+    wins = ((own > theirs) & playable).sum(axis=0)
+    losses = ((own < theirs) & playable).sum(axis=0)
+    return wins, losses
+
+
+def head_to_head_records(scores, opponents):
+    """
+    Actual record of every manager a against every manager b, as (wins, losses) matrices [a, b].
+    """
+    own = scores[:, :, None]
+    theirs = scores[:, None, :]
+    met = opponents[:, :, None] == np.arange(scores.shape[1])[None, None, :]
+    wins = ((own > theirs) & met).sum(axis=0)
+    losses = ((own < theirs) & met).sum(axis=0)
+    return wins, losses
+
+
+def record_table(managers, wins, losses, column_format="{}"):
+    """
+    Manager-by-manager "W-L" table; columns with no games at all are dropped.
+    """
+    records = np.char.add(np.char.add(wins.astype(str), "-"), losses.astype(str))
+    result_df = pd.DataFrame(records, columns=[column_format.format(m) for m in managers])
+    result_df = result_df.loc[:, (wins + losses).sum(axis=0) > 0]
+    result_df.insert(0, 'manager', managers)
+    return result_df
@@ -1,58 +1,135 @@
 import pandas as pd
 import numpy as np
-import duckdb
+from .simulation_runner import run_simulation_blocks
 
-def duckdb_filter(df, sql):
-    con = duckdb.connect()
-    con.register('df', df)
-    result = con.execute(sql).fetchdf()
-    con.close()
-    return result
+# Iterations simulated per vectorized block; bounds peak memory for large runs
+BLOCK_SIZE = 5000
 
-def shuffle_schedule(df):
-    # Get unique managers and weeks using DuckDB
-    managers = duckdb_filter(df, "SELECT DISTINCT manager FROM df")['manager'].values
-    weeks = duckdb_filter(df, "SELECT DISTINCT week FROM df")['week'].values
 
-    num_managers = len(managers)
-    schedule = []
+def build_score_matrix(df):
+    """
+    Pivot team_points into a (week x manager) matrix for one season.
+    Missing games are NaN and never count as a win or a loss.
+    """
+    pivot = df.groupby(['week', 'manager'])['team_points'].first().unstack('manager')
+    return pivot.index.to_numpy(), pivot.columns.to_numpy(), pivot.to_numpy(dtype=float)
 
-    np.random.shuffle(managers)
 
-    for _ in weeks:
-        round_robin = []
-        for i in range(num_managers // 2):
-            round_robin.append((managers[i], managers[num_managers - 1 - i]))
-        managers = np.roll(managers, 1)
-        schedule.append(round_robin)
+def round_robin_table(num_teams):
+    """
+    Circle-method round robin for an even number of teams.
+    Returns an array of shape (num_teams - 1, num_teams) holding the opponent slot of each slot per round.
+    """
+    slots = np.arange(num_teams)
+    table = np.empty((num_teams - 1, num_teams), dtype=np.int64)
+    for r in range(num_teams - 1):
+        order = np.concatenate(([0], np.roll(slots[1:], r)))
+        home, away = order[:num_teams // 2], order[::-1][:num_teams // 2]
+        table[r, home] = away
+        table[r, away] = home
+    return table
 
-    np.random.shuffle(weeks)
 
-    final_schedule = []
-    for week, matchups in zip(weeks, schedule):
-        for match in matchups:
-            final_schedule.append((week, match[0], match[1]))
+def random_schedules(num_managers, num_weeks, iterations, rng):
+    """
+    Draw random round-robin schedules as index arrays.
+    Returns opponents of shape (iterations, num_weeks, num_slots), where num_slots pads odd
+    leagues with a bye slot (index num_managers).
+    """
+    num_slots = num_managers + (num_managers % 2)
+    table = round_robin_table(num_slots)
 
+    # Random assignment of managers to round-robin slots
+    manager_at_slot = np.argsort(rng.random((iterations, num_slots)), axis=1)
+    slot_of_manager = np.argsort(manager_at_slot, axis=1)
+
+    # Cycle through the rounds when the season is longer than one round robin, in random week order
+    base_rounds = np.resize(np.arange(num_slots - 1), num_weeks)
+    rounds = base_rounds[np.argsort(rng.random((iterations, num_weeks)), axis=1)]
+
+    opponent_slot = table[rounds[:, :, None], slot_of_manager[:, None, :]]
+    return manager_at_slot[np.arange(iterations)[:, None, None], opponent_slot]
+
+
+def simulate_season(scores, iterations=1, rng=None):
+    """
+    Play one season's (week x manager) score matrix against random schedules.
+    Returns (wins, losses), each of shape (iterations, num_weeks, num_managers) as booleans.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    num_weeks, num_managers = scores.shape
+    if num_managers % 2:
+        scores = np.hstack([scores, np.full((num_weeks, 1), np.nan)])
+
+    opponents = random_schedules(num_managers, num_weeks, iterations, rng)[:, :, :num_managers]
+    own = scores[None, :, :num_managers]
+    opp = scores[np.arange(num_weeks)[None, :, None], opponents]
+    return own > opp, own < opp
+
+
+def win_histogram_block(arrays, iterations, rng):
+    """
+    Win-total counts for one block of random schedules, shape (num_managers, num_weeks + 1).
+    """
+    scores = arrays['scores']
+    num_weeks, num_managers = scores.shape
+    wins, _ = simulate_season(scores, iterations, rng)
+    totals = wins.sum(axis=1)
+    offsets = np.arange(num_managers) * (num_weeks + 1)
+    hist = np.bincount((totals + offsets).ravel(), minlength=num_managers * (num_weeks + 1))
+    return (hist.reshape(num_managers, num_weeks + 1),)
+
+
+def simulate_win_distribution(df, iterations=10000, seed=None, parallel=None):
+    """
+    Monte Carlo distribution of regular-season wins under random schedules.
+    Returns one row per (year, manager) with the percentage of simulations ending on each win total.
+    Seasons and iteration blocks are spread over the simulation runner's process pool.
+    """
+    seasons = []
+    for year, season_df in df.groupby('year'):
+        weeks, managers, scores = build_score_matrix(season_df)
+        if len(managers) >= 2:
+            seasons.append((year, managers, scores))
+    if not seasons:
+        return pd.DataFrame(columns=['year', 'manager', 'Avg Wins'])
+
+    results = run_simulation_blocks(
+        win_histogram_block, [{'scores': scores} for _, _, scores in seasons], iterations, BLOCK_SIZE,
+        seed=seed, work_per_iteration=sum(scores.size for _, _, scores in seasons), parallel=parallel
+    )
+
+    frames = []
+    for (year, managers, scores), (hist,) in zip(seasons, results):
+        num_weeks = scores.shape[0]
+        pct = hist / iterations * 100
+        result = pd.DataFrame(pct, columns=[str(k) for k in range(num_weeks + 1)])
+        result.insert(0, 'manager', managers)
+        result.insert(0, 'year', year)
+        result['Avg Wins'] = (hist * np.arange(num_weeks + 1)).sum(axis=1) / iterations
+        frames.append(result)
+    return pd.concat(frames, ignore_index=True)
+
+
+def shuffle_schedule(df, rng=None):
+    """
+    Single random schedule per season; adds per-game Sim_Wins/Sim_Losses to df.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    df = df.copy()
     df['Sim_Wins'] = 0
     df['Sim_Losses'] = 0
 
-    con = duckdb.connect()
-    con.register('df', df)
-
-    for week, manager1, manager2 in final_schedule:
-        # Get team points for both managers for the week using DuckDB
-        sql1 = f"SELECT team_points FROM df WHERE manager='{manager1}' AND week={week}"
-        sql2 = f"SELECT team_points FROM df WHERE manager='{manager2}' AND week={week}"
-        team1_points = con.execute(sql1).fetchdf()['team_points'].values
-        team2_points = con.execute(sql2).fetchdf()['team_points'].values
-
-        if len(team1_points) > 0 and len(team2_points) > 0:
-            if team1_points[0] > team2_points[0]:
-                df.loc[(df['manager'] == manager1) & (df['week'] == week), 'Sim_Wins'] += 1
-                df.loc[(df['manager'] == manager2) & (df['week'] == week), 'Sim_Losses'] += 1
-            elif team1_points[0] < team2_points[0]:
-                df.loc[(df['manager'] == manager1) & (df['week'] == week), 'Sim_Losses'] += 1
-                df.loc[(df['manager'] == manager2) & (df['week'] == week), 'Sim_Wins'] += 1
-
-    con.close()
-    return df
\ No newline at end of file
+    for year, season_df in df.groupby('year'):
+        weeks, managers, scores = build_score_matrix(season_df)
+        if len(managers) < 2:
+            continue
+        wins, losses = simulate_season(scores, 1, rng)
+
+        # Map each row back to its (week, manager) cell
+        week_idx = pd.Index(weeks).get_indexer(season_df['week'])
+        manager_idx = pd.Index(managers).get_indexer(season_df['manager'])
+        df.loc[season_df.index, 'Sim_Wins'] = wins[0, week_idx, manager_idx].astype(int)
+        df.loc[season_df.index, 'Sim_Losses'] = losses[0, week_idx, manager_idx].astype(int)
+
+    return df
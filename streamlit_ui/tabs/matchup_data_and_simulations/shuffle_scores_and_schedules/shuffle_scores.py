@@ -1,19 +1,15 @@
 import pandas as pd
 import numpy as np
-import duckdb
-
-def duckdb_filter(df, sql):
-    con = duckdb.connect()
-    con.register('df', df)
-    result = con.execute(sql).fetchdf()
-    con.close()
-    return result
+from streamlit_ui.data.query_service import duckdb_filter
+from .simulation_runner import run_simulation_blocks
 
 def calculate_std_dev(df, selected_year, show_regular_season, show_postseason):
     # Build DuckDB WHERE clause
     where = []
+    params = []
     if selected_year != "All Years":
-        where.append(f"year = '{selected_year}'")
+        where.append("year = ?")
+        params.append(int(selected_year))
     if not show_regular_season:
         where.append("is_playoffs = TRUE")
     if not show_postseason:
@@ -25,39 +21,167 @@ def calculate_std_dev(df, selected_year, show_regular_season, show_postseason):
         {f'WHERE {where_clause}' if where_clause else ''}
         GROUP BY manager
     """
-    return duckdb_filter(df, sql)
+    return duckdb_filter(df, sql, params)
 
-def tweak_scores(df, std_dev_df):
-    df = df.merge(std_dev_df, on='manager', how='left')
-    df['tweaked_team_points'] = df.apply(
-        lambda row: row['team_points'] + np.random.uniform(-1/3, 1/3) * row['StdDev_TeamPoints'], axis=1
+NOISE_MODELS = ["Uniform", "Normal", "Empirical Residual"]
+
+# Iterations simulated per vectorized block; bounds peak memory on all-years runs
+BLOCK_SIZE = 1000
+
+def opponent_row_index(df):
+    """
+    Positional index of each row's opponent row (same year and week), or -1 when missing.
+    """
+    keys = df[['year', 'week', 'manager']].reset_index(drop=True)
+    keys['_row'] = np.arange(len(keys))
+    keys = keys.drop_duplicates(subset=['year', 'week', 'manager'])
+    lookup = df[['year', 'week', 'opponent']].reset_index(drop=True).merge(
+        keys.rename(columns={'manager': 'opponent'}), on=['year', 'week', 'opponent'], how='left'
     )
-    df['Sim_Wins'] = 0
-    df['Sim_Losses'] = 0
-    for index, row in df.iterrows():
-        opponent_week = df[(df['manager'] == row['opponent']) & (df['week'] == row['week'])]
-        if not opponent_week.empty:
-            opponent_points = opponent_week.iloc[0]['team_points']
-            if row['tweaked_team_points'] > opponent_points:
-                df.at[index, 'Sim_Wins'] = 1
-            elif row['tweaked_team_points'] < opponent_points:
-                df.at[index, 'Sim_Losses'] = 1
+    return lookup['_row'].fillna(-1).astype(np.int64).to_numpy()
+
+def noise_inputs(df, std_dev_df):
+    """
+    Per-row arrays the noise models sample from: the manager's standard deviation, and a
+    residual pool sorted by manager with each row's offset and count into it.
+    """
+    std = df[['manager']].merge(std_dev_df, on='manager', how='left')['StdDev_TeamPoints']
+    points = df['team_points'].to_numpy(dtype=float)
+    codes, managers = pd.factorize(df['manager'])
+    means = pd.Series(points).groupby(codes).transform('mean').to_numpy()
+    counts = np.bincount(codes, minlength=len(managers))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return {
+        'std': std.fillna(0).to_numpy(dtype=float),
+        'residuals': np.nan_to_num(points - means)[np.argsort(codes, kind='stable')],
+        'residual_start': starts[codes],
+        'residual_count': counts[codes],
+    }
+
+def sample_noise(arrays, iterations, noise_model="Uniform", noise_scale=1/3, rng=None):
+    """
+    (iterations x games) matrix of score adjustments.
+    Uniform and Normal scale each manager's standard deviation; Empirical Residual
+    resamples the manager's own deviations from their mean score.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    num_games = len(arrays['std'])
+    if noise_model == "Empirical Residual":
+        picks = arrays['residual_start'] + (
+            rng.random((iterations, num_games)) * arrays['residual_count']
+        ).astype(np.int64)
+        return noise_scale * arrays['residuals'][picks]
+    if noise_model == "Normal":
+        unit = rng.standard_normal((iterations, num_games))
+    else:
+        unit = rng.uniform(-1, 1, (iterations, num_games))
+    return unit * noise_scale * arrays['std']
+
+def draw_noise(df, std_dev_df, iterations, noise_model="Uniform", noise_scale=1/3, rng=None):
+    return sample_noise(noise_inputs(df, std_dev_df), iterations, noise_model, noise_scale, rng)
+
+def play_tweaked_games(points, opponent_rows, noise):
+    """
+    Score every game for every iteration at once.
+    Returns (tweaked points, wins, losses), each shaped like noise.
+    """
+    tweaked = points[None, :] + noise
+    has_opponent = opponent_rows >= 0
+    opponent_tweaked = np.where(has_opponent[None, :], tweaked[:, np.where(has_opponent, opponent_rows, 0)], np.nan)
+    return tweaked, tweaked > opponent_tweaked, tweaked < opponent_tweaked
+
+def tweak_scores(df, std_dev_df, noise_model="Uniform", rng=None):
+    df = df.merge(std_dev_df, on='manager', how='left')
+    points = df['team_points'].to_numpy(dtype=float)
+    noise = draw_noise(df, std_dev_df, 1, noise_model, rng=rng)
+    tweaked, wins, losses = play_tweaked_games(points, opponent_row_index(df), noise)
+    df['tweaked_team_points'] = tweaked[0]
+    df['Sim_Wins'] = wins[0].astype(int)
+    df['Sim_Losses'] = losses[0].astype(int)
     return df
 
+def tweak_histogram_block(arrays, iterations, rng, noise_model, max_games, max_seeds):
+    """
+    Win-total and seed counts per (year, manager) group for one block of tweaked seasons.
+    """
+    noise = sample_noise(arrays, iterations, noise_model, rng=rng)
+    tweaked, wins, _ = play_tweaked_games(arrays['points'], arrays['opponent_rows'], noise)
+    order, starts, year_codes = arrays['order'], arrays['starts'], arrays['year_codes']
+    group_wins = np.add.reduceat(wins[:, order], starts, axis=1)
+    group_points = np.add.reduceat(np.nan_to_num(tweaked[:, order]), starts, axis=1)
+
+    num_groups = len(starts)
+    win_hist = np.bincount(
+        (group_wins + np.arange(num_groups) * (max_games + 1)).ravel(), minlength=num_groups * (max_games + 1)
+    ).reshape(num_groups, max_games + 1)
+
+    # Seed within each season: most wins first, tweaked points as the tiebreaker
+    seed_hist = np.zeros((num_groups, max_seeds), dtype=np.int64)
+    for y in range(year_codes.max() + 1):
+        cols = np.flatnonzero(year_codes == y)
+        ranking = np.lexsort((-group_points[:, cols], -group_wins[:, cols]), axis=1)
+        seeds = np.empty_like(ranking)
+        np.put_along_axis(seeds, ranking, np.arange(len(cols))[None, :], axis=1)
+        seed_hist[cols] += np.bincount(
+            (seeds + np.arange(len(cols)) * max_seeds).ravel(), minlength=len(cols) * max_seeds
+        ).reshape(len(cols), max_seeds)
+    return win_hist, seed_hist
+
+def simulate_tweaked_seasons(df, std_dev_df, iterations=1000, noise_model="Uniform", seed=None, parallel=None):
+    """
+    Batched score-tweak simulation.
+    Returns (win_distribution, seed_distribution): per (year, manager) percentage of
+    simulations ending on each win total and on each playoff seed.
+    """
+    df = df.reset_index(drop=True)
+    if df.empty:
+        return pd.DataFrame(columns=['year', 'manager', 'Avg Wins']), pd.DataFrame(columns=['year', 'manager', 'Avg Seed'])
+
+    # Rows grouped by (year, manager) so per-season totals are a single reduceat
+    group_keys = df[['year', 'manager']].drop_duplicates().sort_values(['year', 'manager']).reset_index(drop=True)
+    group_codes = df[['year', 'manager']].merge(
+        group_keys.reset_index(), on=['year', 'manager'], how='left'
+    )['index'].to_numpy()
+    order = np.argsort(group_codes, kind='stable')
+    year_codes, _ = pd.factorize(group_keys['year'])
+    arrays = {
+        'points': df['team_points'].to_numpy(dtype=float),
+        'opponent_rows': opponent_row_index(df),
+        'order': order,
+        'starts': np.searchsorted(group_codes[order], np.arange(len(group_keys))),
+        'year_codes': year_codes,
+        **noise_inputs(df, std_dev_df),
+    }
+    max_games = int(np.bincount(group_codes).max())
+    max_seeds = int(np.bincount(year_codes).max())
+
+    [(win_hist, seed_hist)] = run_simulation_blocks(
+        tweak_histogram_block, [arrays], iterations, BLOCK_SIZE, seed=seed, work_per_iteration=len(df),
+        params={'noise_model': noise_model, 'max_games': max_games, 'max_seeds': max_seeds}, parallel=parallel
+    )
+
+    win_distribution = group_keys.copy()
+    for k in range(max_games + 1):
+        win_distribution[str(k)] = win_hist[:, k] / iterations * 100
+    win_distribution['Avg Wins'] = (win_hist * np.arange(max_games + 1)).sum(axis=1) / iterations
+
+    seed_distribution = group_keys.copy()
+    for k in range(max_seeds):
+        seed_distribution[str(k + 1)] = seed_hist[:, k] / iterations * 100
+    seed_distribution['Avg Seed'] = (seed_hist * np.arange(1, max_seeds + 1)).sum(axis=1) / iterations
+    return win_distribution, seed_distribution
+
 def calculate_playoff_seed(df):
     # Use DuckDB for aggregation and sorting
-    con = duckdb.connect()
-    con.register('df', df)
-    agg_df = con.execute("""
+    agg_df = duckdb_filter(df, """
         SELECT manager,
                SUM(Sim_Wins) AS Sim_Wins,
                SUM(tweaked_team_points) AS Total_Tweaked_Points
         FROM df
         GROUP BY manager
         ORDER BY Sim_Wins DESC, Total_Tweaked_Points DESC
-    """).fetchdf()
+    """)
     agg_df['Sim_Playoff_Seed'] = range(1, len(agg_df) + 1)
-    con.close()
     df = df.merge(agg_df[['manager', 'Sim_Playoff_Seed']], on='manager', how='left')
     return df
 
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def data_fingerprint(*frames):
+    """
+    Content hash of the frames a simulation reads; row order and column names count, the index does not.
+    """
+    digest = hashlib.sha256()
+    for frame in frames:
+        digest.update(repr(list(frame.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _result_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (tuple, list)):
+        return sum(_result_size(v) for v in value)
+    return len(pickle.dumps(value))
+
+
+class SimulationCache:
+    """
+    Simulation results shared by every session, keyed on (name, data fingerprint, params, seed).
+
+    Entries are evicted least-recently-used once their estimated size passes max_bytes. With a
+    disk_dir results are also pickled there, so they survive restarts and evictions.
+    Unseeded runs are never cached since repeating them is supposed to give new draws.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, disk_dir=None):
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(name, frames, params, seed):
+        raw = repr((name, data_fingerprint(*frames), tuple(params), seed))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+        if self.disk_dir is not None:
+            path = self.disk_dir / f"{key}.pkl"
+            if path.exists():
+                try:
+                    with open(path, "rb") as f:
+                        value = pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    return None
+                self._remember(key, value)
+                return value
+        return None
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.disk_dir is not None:
+            path = self.disk_dir / f"{key}.pkl"
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+
+    def _remember(self, key, value):
+        size = _result_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def get_or_compute(self, name, compute, frames, params, seed):
+        if seed is None:
+            return compute()
+        key = self.key(name, frames, params, seed)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+
+@st.cache_resource
+def get_simulation_cache():
+    max_mb = int(os.getenv("KMFFL_SIM_CACHE_MB", DEFAULT_MAX_BYTES // (1024 * 1024)))
+    return SimulationCache(max_bytes=max_mb * 1024 * 1024, disk_dir=os.getenv("KMFFL_SIM_CACHE_DIR"))
@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import streamlit as st
+
+# Below this many simulated games a job runs in-process; pool overhead would dominate
+PARALLEL_MIN_WORK = 2_000_000
+
+
+@st.cache_resource
+def get_process_pool():
+    # Spawned workers, since forking a threaded Streamlit server is unsafe
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _share(arrays):
+    """
+    Copy arrays into shared memory blocks.
+    Returns (blocks, specs); specs are what a worker needs to attach to them.
+    """
+    blocks, specs = [], {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        specs[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, specs
+
+
+def _run_shared_block(block_fn, specs, iterations, seed_seq, params):
+    blocks = {name: shared_memory.SharedMemory(name=spec[0]) for name, spec in specs.items()}
+    try:
+        arrays = {
+            name: np.ndarray(shape, np.dtype(dtype), buffer=blocks[name].buf)
+            for name, (_, shape, dtype) in specs.items()
+        }
+        result = block_fn(arrays, iterations, np.random.default_rng(seed_seq), **params)
+        # Results must not reference shared buffers once they are closed
+        return tuple(np.array(r, copy=True) for r in result)
+    finally:
+        for block in blocks.values():
+            block.close()
+
+
+def _block_sizes(iterations, block_size):
+    sizes = [block_size] * (iterations // block_size)
+    if iterations % block_size:
+        sizes.append(iterations % block_size)
+    return sizes
+
+
+def run_simulation_blocks(block_fn, jobs, iterations, block_size, seed=None, work_per_iteration=1,
+                          params=None, parallel=None):
+    """
+    Run `block_fn(arrays, iterations, rng, **params)` over every job in iteration blocks and
+    sum the returned arrays per job.
+
+    jobs is a list of {name: ndarray} dicts (e.g. one score matrix per season). In parallel mode
+    each job's arrays are placed in shared memory once and blocks fan out across the process
+    pool. Every block draws from its own child of `seed`, so results do not depend on whether
+    or how the work was split.
+    """
+    params = params or {}
+    sizes = _block_sizes(iterations, block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(jobs) * len(sizes))
+    tasks = [(j, size, seeds[j * len(sizes) + b]) for j in range(len(jobs)) for b, size in enumerate(sizes)]
+
+    if parallel is None:
+        parallel = (os.cpu_count() or 1) > 1 and iterations * work_per_iteration >= PARALLEL_MIN_WORK
+    if parallel and len(tasks) > 1:
+        return _run_parallel(block_fn, jobs, tasks, params)
+
+    results = [None] * len(jobs)
+    for j, size, seed_seq in tasks:
+        out = block_fn(jobs[j], size, np.random.default_rng(seed_seq), **params)
+        results[j] = out if results[j] is None else tuple(a + b for a, b in zip(results[j], out))
+    return results
+
+
+def _run_parallel(block_fn, jobs, tasks, params):
+    shared = [_share(arrays) for arrays in jobs]
+    try:
+        pool = get_process_pool()
+        futures = [
+            (j, pool.submit(_run_shared_block, block_fn, shared[j][1], size, seed_seq, params))
+            for j, size, seed_seq in tasks
+        ]
+        results = [None] * len(jobs)
+        for j, future in futures:
+            out = future.result()
+            results[j] = out if results[j] is None else tuple(a + b for a, b in zip(results[j], out))
+        return results
+    finally:
+        for blocks, _ in shared:
+            for block in blocks:
+                block.close()
+                block.unlink()
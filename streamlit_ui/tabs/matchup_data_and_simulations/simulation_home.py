@@ -1,5 +1,4 @@
 import streamlit as st
-import duckdb
 from .gavi_stat_viewer import GaviStatViewer
 from .opponent_gavi_stat_viewer import OpponentGaviStatViewer
 from .everyones_schedule_viewer import EveryonesScheduleViewer
@@ -8,17 +7,30 @@ from .tweak_scoring_viewer import TweakScoringViewer
 from .playoff_odds import PlayoffOddsViewer
 from .expected_record_viewer import display_expected_record_and_seed
 from .predictive_record_and_seed import display_predicted_record_and_seed  # NEW IMPORT
+from streamlit_ui.data.query_service import get_query_service
+
+# Columns the simulation views read; the loader projects the parquet scans to these
+SIMULATION_COLUMNS = {
+    "Matchup Data": [
+        'year', 'week', 'manager', 'opponent', 'team_points', 'win', 'loss', 'is_playoffs', 'is_consolation',
+        'teams_beat_this_week', 'opponent_teams_beat_this_week', 'wins_to_date', 'losses_to_date',
+        'playoff_seed_to_date', 'Playoff Seed to Date', 'team_made_playoffs', 'team_got_bye',
+        'shuffle_*_seed', 'x*_win', 'x*_seed',
+    ],
+    "Player Data": ['player', 'manager', 'year', 'week'],
+    "Schedules": ['year', 'week', 'manager', 'opponent', 'is_playoffs', 'is_consolation'],
+}
 
 class SimulationDataViewer:
-    def __init__(self, matchup_data_df, player_data_df):
+    def __init__(self, matchup_data_df, player_data_df, schedule_data_df=None):
         self.matchup_data_df = matchup_data_df
         self.player_data_df = player_data_df
-        self.con = duckdb.connect()
-        self.con.register('matchup_data', self.matchup_data_df)
-        self.con.register('player_data', self.player_data_df)
+        self.schedule_data_df = schedule_data_df
 
-    def query(self, sql):
-        return self.con.execute(sql).fetchdf()
+    def query(self, sql, params=None):
+        return get_query_service().query(
+            sql, params, matchup_data=self.matchup_data_df, player_data=self.player_data_df
+        )
 
     def display(self):
         if self.matchup_data_df is None:
@@ -65,9 +77,9 @@ class SimulationDataViewer:
             )
 
             if predictive_choice == "Playoff Odds":
-                PlayoffOddsViewer(self.matchup_data_df).display()
+                PlayoffOddsViewer(self.matchup_data_df, self.schedule_data_df).display()
             elif predictive_choice == "Predicted Record + Seed":
                 display_predicted_record_and_seed(self.matchup_data_df)
 
-def display_simulations_viewer(matchup_data_df, player_data_df):
-    SimulationDataViewer(matchup_data_df, player_data_df).display()
\ No newline at end of file
+def display_simulations_viewer(matchup_data_df, player_data_df, schedule_data_df=None):
+    SimulationDataViewer(matchup_data_df, player_data_df, schedule_data_df).display()
\ No newline at end of file
@@ -1,16 +1,12 @@
 import streamlit as st
-import duckdb
 import numpy as np
 from .matchups.weekly.weekly_matchup_overview import WeeklyMatchupDataViewer
-from .shuffle_scores_and_schedules.shuffle_scores import calculate_std_dev, tweak_scores, calculate_playoff_seed
-from .shuffle_scores_and_schedules.shuffle_schedule import shuffle_schedule
-
-def duckdb_filter(df, sql):
-    con = duckdb.connect()
-    con.register('df', df)
-    result = con.execute(sql).fetchdf()
-    con.close()
-    return result
+from .shuffle_scores_and_schedules.shuffle_scores import (
+    NOISE_MODELS, calculate_std_dev, tweak_scores, calculate_playoff_seed, simulate_tweaked_seasons
+)
+from .shuffle_scores_and_schedules.shuffle_schedule import shuffle_schedule, simulate_win_distribution
+from .shuffle_scores_and_schedules.simulation_cache import get_simulation_cache
+from streamlit_ui.data.query_service import duckdb_filter
 
 class TweakScoringViewer(WeeklyMatchupDataViewer):
     def __init__(self, matchup_data_df, player_data_df):
@@ -19,11 +15,24 @@ class TweakScoringViewer(WeeklyMatchupDataViewer):
 
     def display(self):
         if self.df is not None:
-            col1, col2 = st.columns([1, 3])
+            col1, col2, col_noise, col_seed = st.columns([1, 2, 1, 1])
             with col1:
                 years = ["All Years"] + sorted(self.df['year'].unique().tolist())
                 default_year = max(self.df['year'].unique().tolist())
                 selected_year = st.selectbox("Select Year", years, index=years.index(default_year))
+            with col2:
+                iterations = st.number_input(
+                    "Simulations", min_value=1, max_value=100000, value=10000, step=1000,
+                    key="simulation_iterations_input"
+                )
+            with col_noise:
+                noise_model = st.selectbox("Score Noise", NOISE_MODELS, key="tweak_noise_model_select")
+            with col_seed:
+                seed = st.number_input(
+                    "Random Seed", min_value=0, value=None, step=1, placeholder="Random",
+                    help="Leave empty for a fresh random run; set a seed to repeat a run exactly",
+                    key="simulation_seed_input"
+                )
 
             col3, col4 = st.columns([1, 1])
             with col3:
@@ -40,8 +49,10 @@ class TweakScoringViewer(WeeklyMatchupDataViewer):
             if st.button("Simulate"):
                 # DuckDB filtering
                 where = []
+                params = []
                 if selected_year != "All Years":
-                    where.append(f"year = '{selected_year}'")
+                    where.append("year = ?")
+                    params.append(int(selected_year))
                 if show_regular_season and show_postseason:
                     where.append("((is_playoffs = 0 AND is_consolation = 0) OR is_playoffs = 1)")
                 elif show_regular_season:
@@ -50,17 +61,34 @@ class TweakScoringViewer(WeeklyMatchupDataViewer):
                     where.append("is_playoffs = 1")
                 where_clause = " AND ".join(where)
                 sql = f"SELECT * FROM df" + (f" WHERE {where_clause}" if where_clause else "")
-                filtered_df = duckdb_filter(self.df, sql)
+                filtered_df = duckdb_filter(self.df, sql, params)
+
+                # Identical requests from any session are served from the shared simulation cache
+                cache = get_simulation_cache()
+                rng = np.random.default_rng(seed)
+                sim_inputs = filtered_df[['year', 'week', 'manager', 'opponent', 'team_points']]
 
+                win_distribution = None
                 if shuffle_schedule_flag:
-                    filtered_df = shuffle_schedule(filtered_df)
+                    win_distribution = cache.get_or_compute(
+                        "schedule_win_distribution",
+                        lambda: simulate_win_distribution(filtered_df, int(iterations), seed=seed),
+                        [sim_inputs], (int(iterations),), seed
+                    )
+                    filtered_df = shuffle_schedule(filtered_df, rng)
 
                 if 'tweaked_team_points' not in filtered_df.columns:
                     filtered_df['tweaked_team_points'] = filtered_df['team_points']
 
+                tweak_wins = tweak_seeds = None
                 if tweak_scores_flag:
                     std_dev_df = calculate_std_dev(filtered_df, selected_year, show_regular_season, show_postseason)
-                    filtered_df = tweak_scores(filtered_df, std_dev_df)
+                    tweak_wins, tweak_seeds = cache.get_or_compute(
+                        "tweak_distributions",
+                        lambda: simulate_tweaked_seasons(filtered_df, std_dev_df, int(iterations), noise_model, seed=seed),
+                        [sim_inputs, std_dev_df], (int(iterations), noise_model), seed
+                    )
+                    filtered_df = tweak_scores(filtered_df, std_dev_df, noise_model, rng)
 
                 if 'Sim_Wins' not in filtered_df.columns:
                     filtered_df['Sim_Wins'] = 0
@@ -73,8 +101,6 @@ class TweakScoringViewer(WeeklyMatchupDataViewer):
                     filtered_df['Sim_Playoff_Seed'] = np.nan
 
                 # DuckDB aggregation for playoff_seed_to_date at largest week
-                con = duckdb.connect()
-                con.register('filtered_df', filtered_df)
                 agg_sql = """
                     WITH latest_week AS (
                         SELECT 
@@ -105,8 +131,7 @@ class TweakScoringViewer(WeeklyMatchupDataViewer):
                     ON f.year = s.year AND f.manager = s.manager
                     GROUP BY f.year, f.manager, s.playoff_seed_to_date
                 """
-                aggregated_df = con.execute(agg_sql).fetchdf()
-                con.close()
+                aggregated_df = duckdb_filter(filtered_df, agg_sql, name='filtered_df')
 
                 aggregated_df['year'] = aggregated_df['year'].astype(str)
                 aggregated_df = aggregated_df.sort_values(by=['Seed'])
@@ -124,4 +149,34 @@ class TweakScoringViewer(WeeklyMatchupDataViewer):
                 with col1:
                     st.dataframe(aggregated_df[data_columns], hide_index=True)
                 with col2:
-                    st.dataframe(sim_aggregated_df[sim_columns], hide_index=True)
\ No newline at end of file
+                    st.dataframe(sim_aggregated_df[sim_columns], hide_index=True)
+
+                if win_distribution is not None:
+                    self.display_distribution(
+                        win_distribution, f"Win Distribution Across {int(iterations):,} Random Schedules",
+                        'Avg Wins', selected_year
+                    )
+                if tweak_wins is not None:
+                    self.display_distribution(
+                        tweak_wins, f"Win Distribution Across {int(iterations):,} Tweaked Seasons",
+                        'Avg Wins', selected_year
+                    )
+                    self.display_distribution(
+                        tweak_seeds, f"Seed Distribution Across {int(iterations):,} Tweaked Seasons",
+                        'Avg Seed', selected_year
+                    )
+
+    def display_distribution(self, distribution, title, avg_column, selected_year):
+        if distribution.empty:
+            return
+        st.subheader(title)
+        distribution = distribution.copy()
+        distribution['year'] = distribution['year'].astype(str)
+        if selected_year != "All Years":
+            distribution = distribution.drop(columns=['year'])
+        distribution = distribution.sort_values(avg_column, ascending=avg_column == 'Avg Seed')
+        pct_cols = [c for c in distribution.columns if c.isdigit()]
+        styled = (distribution.style
+                  .format({**{c: '{:.1f}%' for c in pct_cols}, avg_column: '{:.2f}'}, na_rep="")
+                  .background_gradient(cmap='RdYlGn', subset=pct_cols, axis=1))
+        st.dataframe(styled, hide_index=True)
@@ -1,14 +1,7 @@
 import streamlit as st
 import pandas as pd
-import duckdb
-import re
-
-def duckdb_filter(df, sql):
-    con = duckdb.connect()
-    con.register('df', df)
-    result = con.execute(sql).fetchdf()
-    con.close()
-    return result
+from streamlit_ui.data.query_service import duckdb_filter
+from .schedule_matrix import TENSOR_COLUMNS, build_score_tensor, record_table, head_to_head_records
 
 class VsOneOpponentViewer:
     def __init__(self, df):
@@ -31,7 +24,8 @@ class VsOneOpponentViewer:
             include_postseason = st.checkbox("Include Postseason", value=False, key="include_postseason")
 
         # DuckDB filtering
-        year_clause = "" if selected_year == "All" else f"year={int(selected_year)}"
+        year_clause = "" if selected_year == "All" else "year = ?"
+        params = [] if selected_year == "All" else [int(selected_year)]
         season_clauses = []
         if include_regular_season:
             season_clauses.append("(is_playoffs=0 AND is_consolation=0)")
@@ -40,39 +34,13 @@ class VsOneOpponentViewer:
         where_clauses = " AND ".join(filter(None, [year_clause]))
         if season_clauses:
             where_clauses += (" AND " if where_clauses else "") + "(" + " OR ".join(season_clauses) + ")"
-        sql = f"SELECT * FROM df" + (f" WHERE {where_clauses}" if where_clauses else "")
-        filtered_df = duckdb_filter(self.df, sql)
-
-        # Find all opponent suffixes (no _sched)
-        win_cols = [c for c in filtered_df.columns if c.startswith("w_vs_") and not c.endswith("_sched")]
-        loss_cols = [c for c in filtered_df.columns if c.startswith("l_vs_") and not c.endswith("_sched")]
-        suffixes = set([c[5:] for c in win_cols]) & set([c[5:] for c in loss_cols])
-
-        # Only keep suffixes where sum of both columns > 0
-        valid_opponents = []
-        for suffix in suffixes:
-            w_col = f"w_vs_{suffix}"
-            l_col = f"l_vs_{suffix}"
-            if w_col in filtered_df.columns and l_col in filtered_df.columns:
-                if filtered_df[w_col].sum() + filtered_df[l_col].sum() > 0:
-                    valid_opponents.append(suffix)
-
-        valid_opponents = sorted(valid_opponents)  # <-- Sort alphabetically
-
-        managers = filtered_df['manager'].unique().tolist()
-        result_df = pd.DataFrame(columns=['manager'] + [f"{opponent.title()}" for opponent in valid_opponents])
-        result_df['manager'] = managers
-
-        for manager in managers:
-            manager_rows = filtered_df[filtered_df['manager'] == manager]
-            for opponent in valid_opponents:
-                w_col = f"w_vs_{opponent}"
-                l_col = f"l_vs_{opponent}"
-                wins = manager_rows[w_col].sum() if w_col in manager_rows else 0
-                losses = manager_rows[l_col].sum() if l_col in manager_rows else 0
-                result_df.loc[result_df['manager'] == manager, f"{opponent.title()}"] = f"{int(wins)}-{int(losses)}"
+        sql = f"SELECT {', '.join(TENSOR_COLUMNS)} FROM df" + (f" WHERE {where_clauses}" if where_clauses else "")
+        filtered_df = duckdb_filter(self.df, sql, params)
 
-        result_df = result_df.sort_values(by='manager').reset_index(drop=True)
+        # Records come from the score tensor rather than per-opponent columns
+        managers, scores, opponents = build_score_tensor(filtered_df)
+        wins, losses = head_to_head_records(scores, opponents)
+        result_df = record_table(managers, wins, losses)
 
         def highlight_diagonal(val, manager, column):
             if manager.lower() in column.lower():
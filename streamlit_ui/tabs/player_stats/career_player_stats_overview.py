@@ -1,13 +1,16 @@
 import pandas as pd
 import streamlit as st
-from .career_player_subprocesses.career_player_basic_stats import get_basic_stats
+from .career_player_subprocesses.career_player_basic_stats import get_basic_stats, get_basic_stats_from_totals
 from .career_player_subprocesses.career_player_advanced_stats import get_advanced_stats
 from .career_player_subprocesses.career_player_matchup_stats import CombinedMatchupStatsViewer
 
 class StreamlitCareerPlayerDataViewer:
-    def __init__(self, player_data, matchup_data):
+    def __init__(self, player_data, matchup_data, player_seasons=None, player_careers=None):
         self.player_data = player_data
         self.matchup_data = matchup_data
+        # Materialized player-season / player-career totals (see data.aggregates)
+        self.player_seasons = player_seasons
+        self.player_careers = player_careers
 
     def get_unique_values(self, column, filters):
         filtered_data = self.apply_filters(filters)
@@ -25,6 +28,25 @@ class StreamlitCareerPlayerDataViewer:
                 filtered_data = filtered_data[filtered_data[column].isin(values)]
         return filtered_data
 
+    def player_totals(self, filters, started):
+        """
+        Materialized totals narrowed to `filters`, or None when a filter (NFL team, opponent, or a
+        hand-picked fantasy_position) needs the weekly rows. `started` is the Started toggle.
+        """
+        if self.player_careers is None or started is None:
+            return None
+        if filters.get("nfl_team") or filters.get("opponent_team"):
+            return None
+        totals = self.player_seasons if filters.get("year") else self.player_careers
+        if totals is None:
+            return None
+        if started:
+            totals = totals[totals['started']]
+        for column in ["player", "manager", "nfl_position", "year"]:
+            if filters.get(column):
+                totals = totals[totals[column].isin(filters[column])]
+        return totals
+
     def determine_position(self, filtered_data):
         unique_positions = filtered_data['nfl_position'].unique()
         if len(unique_positions) == 1:
@@ -102,21 +124,27 @@ class StreamlitCareerPlayerDataViewer:
             selected_filters["opponent_team"] = opponent_team_values
             selected_filters["year"] = year_values
 
-            return selected_filters, show_per_game
+            # Started without hand-picked positions is what the materialized totals are split by
+            started = None if fantasy_position_values else show_started
+            return selected_filters, show_per_game, started
 
         with tabs[0]:
             st.header("Basic Stats")
-            filters, show_per_game = display_filters(tab_index=0, tab_name="BasicStats")
+            filters, show_per_game, started = display_filters(tab_index=0, tab_name="BasicStats")
             filtered_data = self.apply_filters(filters)
             position = self.determine_position(filtered_data)
-            basic_stats_df = get_basic_stats(filtered_data, position)
+            totals = self.player_totals(filters, started)
+            if totals is not None:
+                basic_stats_df = get_basic_stats_from_totals(totals, position)
+            else:
+                basic_stats_df = get_basic_stats(filtered_data, position)
             if show_per_game:
                 basic_stats_df = self.calculate_per_game_stats(basic_stats_df, filtered_data)
             st.dataframe(basic_stats_df, hide_index=True)
 
         with tabs[1]:
             st.header("Advanced Stats")
-            filters, show_per_game = display_filters(tab_index=1, tab_name="AdvancedStats")
+            filters, show_per_game, _ = display_filters(tab_index=1, tab_name="AdvancedStats")
             filtered_data = self.apply_filters(filters)
             position = self.determine_position(filtered_data)
             advanced_stats_df = get_advanced_stats(filtered_data, position)
@@ -127,7 +155,7 @@ class StreamlitCareerPlayerDataViewer:
         with tabs[2]:
             st.header("Matchup Stats")
             tab_index = 2
-            filters, show_per_game = display_filters(tab_index=tab_index, tab_name="MatchupStats")
+            filters, show_per_game, _ = display_filters(tab_index=tab_index, tab_name="MatchupStats")
             filtered_data = self.apply_filters(filters)
             if 'managerweek' in filtered_data.columns and 'ManagerWeek' in self.matchup_data.columns:
                 merged_data = pd.merge(filtered_data, self.matchup_data[['ManagerWeek']], left_on='managerweek',
@@ -1,6 +1,6 @@
 import pandas as pd
 
-def get_basic_stats(player_data, position):
+def basic_stat_columns(position):
     if position in ['QB']:
         columns = ['player', 'nfl_team', 'owner', 'points', 'nfl_position', 'Pass Yds', 'Pass TD', 'Int', 'Rush Yds', 'Rush TD']
     elif position in ['RB', 'W/R/T']:
@@ -13,6 +13,10 @@ def get_basic_stats(player_data, position):
         columns = ['player', 'nfl_team', 'owner', 'points', 'nfl_position', 'Def Yds Allow', 'Fum Rec', 'Pts Allow', 'defensive_td', 'Safe', 'Defensive Interceptions', 'Eligible_Defensive_Points_Allowed', '3 and Outs', '4 Dwn Stops', 'Sack', 'combined tfl and sacks']
     else:
         columns = ['player', 'nfl_team', 'owner', 'points', 'nfl_position']
+    return columns
+
+def get_basic_stats(player_data, position):
+    columns = basic_stat_columns(position)
 
     # Filter out columns that do not exist in the player_data
     existing_columns = [col for col in columns if col in player_data.columns]
@@ -34,4 +38,27 @@ def get_basic_stats(player_data, position):
     # Reset index without inserting existing columns
     aggregated_data = aggregated_data.reset_index()
 
-    return aggregated_data
\ No newline at end of file
+    return aggregated_data
+
+def get_basic_stats_from_totals(totals, position):
+    """
+    get_basic_stats from materialized player-season or player-career totals (see data.aggregates):
+    sums add up, FG% is re-weighted by the weeks behind it, and nfl_team/owner come from the
+    earliest week.
+    """
+    columns = basic_stat_columns(position)
+    existing_columns = [col for col in columns if col in totals.columns]
+    first_columns = [col for col in ['nfl_team', 'owner'] if col in existing_columns]
+    sum_columns = [col for col in existing_columns if col not in first_columns + ['player', 'nfl_position']]
+    if 'FG%' in sum_columns:
+        sum_columns.append('FG% weeks')
+
+    aggregated_data = totals.groupby(['player', 'nfl_position'])[sum_columns].sum()
+    for col in first_columns:
+        earliest = totals.dropna(subset=[col]).sort_values(f'{col} seen').groupby(['player', 'nfl_position'])[col].first()
+        aggregated_data[col] = earliest
+    if 'FG%' in sum_columns:
+        aggregated_data['FG%'] = aggregated_data['FG%'] / aggregated_data.pop('FG% weeks')
+
+    aggregated_data = aggregated_data.reset_index()
+    return aggregated_data[['player', 'nfl_position'] + [col for col in existing_columns if col not in ['player', 'nfl_position']]]
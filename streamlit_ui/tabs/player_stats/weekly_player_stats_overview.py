@@ -12,13 +12,6 @@ class StreamlitWeeklyPlayerDataViewer:
         self.player_data = player_data.copy()
         self.matchup_data = matchup_data.copy()
 
-        # Normalize types we commonly filter on
-        for col in ["year", "week"]:
-            if col in self.player_data.columns:
-                self.player_data[col] = pd.to_numeric(self.player_data[col], errors="coerce")
-            if col in self.matchup_data.columns:
-                self.matchup_data[col] = pd.to_numeric(self.matchup_data[col], errors="coerce")
-
     def get_unique_values(self, column, filters=None):
         if filters:
             filtered_data = self.apply_filters(filters)
@@ -1,6 +1,6 @@
-import duckdb
 import pandas as pd
 import streamlit as st
+from streamlit_ui.data.query_service import get_query_service
 
 
 class H2HViewer:
@@ -16,12 +16,6 @@ class H2HViewer:
         self.filtered_data = filtered_data.copy()
         self.matchup_data = matchup_data.copy()
 
-        # Normalize types
-        for frame in (self.filtered_data, self.matchup_data):
-            for col in ["year", "week"]:
-                if col in frame.columns:
-                    frame[col] = pd.to_numeric(frame[col], errors="coerce")
-
         # Optional rename if matchup_data uses 'team' instead of 'team_name'
         mcols = {c.lower(): c for c in self.matchup_data.columns}
         if "team_name" not in self.matchup_data.columns and "team" in mcols:
@@ -125,11 +119,7 @@ class H2HViewer:
             return
 
         # Join to matchup_data on keys
-        con = duckdb.connect()
-        con.register("filtered", f)
-        con.register("matchup", self.matchup_data)
-
-        merged = con.execute("""
+        merged = get_query_service().query("""
             SELECT
                 f.*,
                 f.team_1 AS team_1,
@@ -140,8 +130,7 @@ class H2HViewer:
              AND f.opponent = m.opponent
              AND f.week     = m.week
              AND f.year     = m.year
-        """).df()
-        con.close()
+        """, filtered=f, matchup=self.matchup_data)
 
         required_cols = ["team_1", "team_2", "player", "points", "fantasy_position", "manager", "headshot_url"]
         missing = [c for c in required_cols if c not in merged.columns]
@@ -0,0 +1,50 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Dict, Sequence
+
+import streamlit as st
+
+from streamlit_ui.data.timings import timed
+
+# Tab name -> module holding its viewer. Modules (and the plotly/altair/pulp they pull in) are
+# imported the first time their tab is opened instead of before the first frame renders
+TAB_MODULES: Dict[str, str] = {
+    "Home": "streamlit_ui.tabs.homepage.homepage_overview",
+    "Managers": "streamlit_ui.tabs.matchup_data_and_simulations.matchups.matchup_overview",
+    "Weekly": "streamlit_ui.tabs.player_stats.weekly_player_stats_overview",
+    "Season": "streamlit_ui.tabs.player_stats.season_player_stats_overview",
+    "Career": "streamlit_ui.tabs.player_stats.career_player_stats_overview",
+    "Injuries": "streamlit_ui.tabs.injury_data.injury_overview",
+    "Draft": "streamlit_ui.tabs.draft_data.draft_data_overview",
+    "Transactions": "streamlit_ui.tabs.transactions.transactions_adds_drops_trades_overview",
+    "Simulations": "streamlit_ui.tabs.matchup_data_and_simulations.simulation_home",
+    "Graphs": "streamlit_ui.tabs.graphs.graphs_overview",
+    "Keeper": "streamlit_ui.tabs.keepers.keepers_home",
+    "Team Names": "streamlit_ui.tabs.team_names.team_names",
+}
+
+
+def tab_module(name: str) -> ModuleType:
+    module_name = TAB_MODULES[name]
+    module = sys.modules.get(module_name)
+    if module is None:
+        with timed("import", module_name):
+            module = importlib.import_module(module_name)
+    return module
+
+
+def lazy_tabs(names: Sequence[str], key: str) -> list:
+    """
+    st.tabs that reruns on selection, so only the open tab's body needs to run.
+    Streamlit releases without lazy tabs get plain tabs, which all count as open.
+    """
+    try:
+        return list(st.tabs(names, key=key, on_change="rerun"))
+    except TypeError:
+        return list(st.tabs(names))
+
+
+def tab_is_open(tab) -> bool:
+    # `open` is None when the tabs don't track selection, and missing on older releases
+    return getattr(tab, "open", None) is not False
@@ -4,7 +4,7 @@ from .weekly_add_drop import display_weekly_add_drop
 from .season_add_drop import display_season_add_drop
 from .career_add_drop import display_career_add_drop
 
-def display_add_drop(transaction_df, player_df, injury_df):
+def display_add_drop(transaction_df, player_df, injury_df, season_metadata=None):
     # Create specific tabs for Add/Drop
     sub_tab_names = ["Weekly", "Season", "Career"]
     sub_tabs = st.tabs(sub_tab_names)
@@ -22,11 +22,11 @@ def display_add_drop(transaction_df, player_df, injury_df):
                     'added_position_search': 'added_position_search_add_drop',
                     'dropped_position_search': 'dropped_position_search_add_drop'
                 }
-                display_weekly_add_drop(transaction_df, player_df, add_drop_keys)
+                display_weekly_add_drop(transaction_df, player_df, add_drop_keys, season_metadata=season_metadata)
             elif sub_tab_name == "Season":
-                display_season_add_drop(transaction_df, player_df)
+                display_season_add_drop(transaction_df, player_df, season_metadata=season_metadata)
             elif sub_tab_name == "Career":
-                display_career_add_drop(transaction_df, player_df)
+                display_career_add_drop(transaction_df, player_df, season_metadata=season_metadata)
             else:
                 # Placeholder for Career data
                 st.write(f"{sub_tab_name} Add/Drop data will be displayed here.")
\ No newline at end of file
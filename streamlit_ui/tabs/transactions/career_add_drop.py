@@ -2,9 +2,9 @@ import pandas as pd
 import streamlit as st
 from .season_add_drop import display_season_add_drop
 
-def display_career_add_drop(transaction_df, player_df):
+def display_career_add_drop(transaction_df, player_df, season_metadata=None):
     # Get the season aggregated DataFrame
-    season_aggregated_df = display_season_add_drop(transaction_df, player_df, return_df=True)
+    season_aggregated_df = display_season_add_drop(transaction_df, player_df, return_df=True, season_metadata=season_metadata)
 
     # Group by manager and aggregate the necessary columns for career view
     career_aggregated_df = season_aggregated_df.groupby(['manager']).agg({
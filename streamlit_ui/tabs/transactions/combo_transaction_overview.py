@@ -4,11 +4,12 @@ from ..transactions.weekly_combo_transactions import display_weekly_combo_transa
 from ..transactions.season_combo_transactions import display_season_all_transactions
 
 class AllTransactionOverview:
-    def __init__(self, transaction_df, player_df, injury_df, draft_history_df):
+    def __init__(self, transaction_df, player_df, injury_df, draft_history_df, season_metadata=None):
         self.transaction_df = transaction_df
         self.player_df = player_df
         self.injury_df = injury_df
         self.draft_history_df = draft_history_df
+        self.season_metadata = season_metadata
         self.trade_summary_df = self.load_trade_summary_df()
         self.weekly_add_drop_df = self.load_weekly_add_drop_df()
 
@@ -28,11 +29,11 @@ class AllTransactionOverview:
 
         with tab1:
             # Display weekly combo transactions
-            display_weekly_combo_transactions(self.transaction_df, self.player_df, self.draft_history_df)
+            display_weekly_combo_transactions(self.transaction_df, self.player_df, self.draft_history_df, self.season_metadata)
 
         with tab2:
             # Display season combo transactions
-            display_season_all_transactions(self.transaction_df, self.player_df, self.draft_history_df)
+            display_season_all_transactions(self.transaction_df, self.player_df, self.draft_history_df, self.season_metadata)
 
         with tab3:
             # Placeholder for career view
@@ -0,0 +1,11 @@
+from streamlit_ui.data.season_metadata import season_weeks
+
+
+def season_end_points(player_df, season_metadata, player_col='player'):
+    """
+    rolling_point_total at each player's last week of the season, indexed by (player, year).
+    """
+    in_season = season_weeks(player_df, season_metadata)
+    last_week = in_season.groupby([player_col, 'year'])['week'].idxmax()
+    return in_season.loc[last_week].set_index([player_col, 'year'])['rolling_point_total']
+
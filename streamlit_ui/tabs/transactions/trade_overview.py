@@ -5,7 +5,7 @@ from .trade_by_trade_summary_data import display_trade_by_trade_summary_data
 from .season_trade_data import display_season_trade_data
 from .career_trade_data import display_career_trade_data
 
-def display_trades(transaction_df, player_df, injury_df, draft_history_df):
+def display_trades(transaction_df, player_df, injury_df, draft_history_df, season_metadata=None):
     # Create specific tabs for Trades
     sub_tab_names = ["Traded Player Data", "Trade Summaries", "Season", "Career"]
     sub_tabs = st.tabs(sub_tab_names)
@@ -14,9 +14,9 @@ def display_trades(transaction_df, player_df, injury_df, draft_history_df):
         with sub_tabs[i]:
             st.subheader(sub_tab_name)
             if sub_tab_name == "Traded Player Data":
-                display_traded_player_data(transaction_df, player_df, draft_history_df)
+                display_traded_player_data(transaction_df, player_df, draft_history_df, season_metadata)
             elif sub_tab_name == "Trade Summaries":
-                display_trade_by_trade_summary_data(transaction_df, player_df, draft_history_df)
+                display_trade_by_trade_summary_data(transaction_df, player_df, draft_history_df, season_metadata)
             elif sub_tab_name == "Season":
                 display_season_trade_data(transaction_df, player_df, draft_history_df)
             elif sub_tab_name == "Career":
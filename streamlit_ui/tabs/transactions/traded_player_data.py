@@ -1,7 +1,8 @@
 import pandas as pd
 import streamlit as st
+from .season_end_points import season_end_points
 
-def display_traded_player_data(transaction_df, player_df, draft_history_df):
+def display_traded_player_data(transaction_df, player_df, draft_history_df, season_metadata=None):
     # Remove duplicate player_name columns if present
     if 'player_name' in player_df.columns and 'player' in player_df.columns:
         player_df = player_df.drop(columns=['player_name'])
@@ -47,14 +48,9 @@ def display_traded_player_data(transaction_df, player_df, draft_history_df):
     merged_df['Rank_on_Transaction_Date'] = merged_df['Rank_on_Transaction_Date'].fillna(0).astype(int)
     merged_df['Rank_on_Transaction_Date'] = merged_df['yahoo_position'] + merged_df['Rank_on_Transaction_Date'].astype(str)
 
-    max_week_up_to_16 = player_df[(player_df['week'] <= 16) & (player_df['year'] <= 2020)].groupby(['player_name', 'year'])['week'].idxmax()
-    max_week_up_to_17 = player_df[(player_df['week'] <= 17) & (player_df['year'] >= 2021)].groupby(['player_name', 'year'])['week'].idxmax()
-    points_max_week_up_to_16 = player_df.loc[max_week_up_to_16].set_index(['player_name', 'year'])['rolling_point_total']
-    points_max_week_up_to_17 = player_df.loc[max_week_up_to_17].set_index(['player_name', 'year'])['rolling_point_total']
-
-    merged_df['points_week_max'] = merged_df.apply(
-        lambda row: points_max_week_up_to_16.get((row['player_name'], row['year']), 0) if row['year'] <= 2020 else points_max_week_up_to_17.get((row['player_name'], row['year']), 0),
-        axis=1
+    season_end = season_end_points(player_df, season_metadata, player_col='player_name')
+    merged_df['points_week_max'] = (
+        merged_df.set_index(['player_name', 'year']).index.map(season_end).fillna(0).values
     )
 
     merged_df['points_week_max'] -= merged_df['points_transaction_week']
@@ -63,9 +59,10 @@ def display_traded_player_data(transaction_df, player_df, draft_history_df):
     merged_df['Rest_of_year_Rank'] = merged_df['Rest_of_year_Rank'].fillna(0).astype(int)
     merged_df['Rest_of_year_Rank'] = merged_df['yahoo_position'] + merged_df['Rest_of_year_Rank'].astype(str)
 
-    merged_df['Rank_on_Transaction_Date_Int'] = merged_df['Rank_on_Transaction_Date'].str.extract(r'(\d+)').fillna(
-        0).astype(int)
-    merged_df['Rest_of_year_Rank_Int'] = merged_df['Rest_of_year_Rank'].str.extract(r'(\d+)').fillna(0).astype(int)
+    # Named group and to_numeric, so the Arrow-backed strings from the loader extract too
+    for rank in ['Rank_on_Transaction_Date', 'Rest_of_year_Rank']:
+        digits = merged_df[rank].str.extract(r'(?P<rank>\d+)', expand=False)
+        merged_df[f'{rank}_Int'] = pd.to_numeric(digits, errors='coerce').fillna(0).astype(int)
     merged_df['Change_in_Rank'] = merged_df['Rank_on_Transaction_Date_Int'] - merged_df['Rest_of_year_Rank_Int']
 
     merged_df.rename(columns={
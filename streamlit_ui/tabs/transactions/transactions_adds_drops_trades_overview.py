@@ -5,11 +5,13 @@ from . import add_drop_overview
 from . import combo_transaction_overview
 
 class AllTransactionsViewer:
-    def __init__(self, transaction_df, player_df, injury_df, draft_history_df):
+    def __init__(self, transaction_df, player_df, injury_df, draft_history_df, season_metadata=None):
         self.transaction_df = transaction_df
         self.player_df = player_df
         self.injury_df = injury_df
         self.draft_history_df = draft_history_df
+        # Season lengths per year, bounding the rest-of-season points
+        self.season_metadata = season_metadata
 
     def display(self):
         # Create main tabs
@@ -17,10 +19,10 @@ class AllTransactionsViewer:
         tabs = st.tabs(tab_names)
 
         with tabs[0]:
-            add_drop_overview.display_add_drop(self.transaction_df, self.player_df, self.injury_df)
+            add_drop_overview.display_add_drop(self.transaction_df, self.player_df, self.injury_df, self.season_metadata)
 
         with tabs[1]:
-            trade_overview.display_trades(self.transaction_df, self.player_df, self.injury_df, self.draft_history_df)
+            trade_overview.display_trades(self.transaction_df, self.player_df, self.injury_df, self.draft_history_df, self.season_metadata)
 
         with tabs[2]:
-            combo_transaction_overview.AllTransactionOverview(self.transaction_df, self.player_df, self.injury_df, self.draft_history_df).display()
\ No newline at end of file
+            combo_transaction_overview.AllTransactionOverview(self.transaction_df, self.player_df, self.injury_df, self.draft_history_df, self.season_metadata).display()
\ No newline at end of file
@@ -1,7 +1,8 @@
 import pandas as pd
 import streamlit as st
+from .season_end_points import season_end_points
 
-def display_weekly_combo_transactions(transaction_df, player_df, draft_history_df):
+def display_weekly_combo_transactions(transaction_df, player_df, draft_history_df, season_metadata=None):
     def merge_and_calculate_points(transaction_df, player_df, columns):
         merged_df = pd.merge(
             transaction_df[columns['transaction']],
@@ -17,22 +18,9 @@ def display_weekly_combo_transactions(transaction_df, player_df, draft_history_d
             .map(points_transaction_week).fillna(0).values
         )
 
-        max_week_up_to_16 = (
-            player_df[(player_df['week'] <= 16) & (player_df['year'] <= 2020)]
-            .groupby(['player', 'year'])['week'].idxmax()
-        )
-        max_week_up_to_17 = (
-            player_df[(player_df['week'] <= 17) & (player_df['year'] >= 2021)]
-            .groupby(['player', 'year'])['week'].idxmax()
-        )
-        points_max_week_up_to_16 = player_df.loc[max_week_up_to_16].set_index(['player', 'year'])['rolling_point_total']
-        points_max_week_up_to_17 = player_df.loc[max_week_up_to_17].set_index(['player', 'year'])['rolling_point_total']
-
-        merged_df['points_week_max'] = merged_df.apply(
-            lambda row: points_max_week_up_to_16.get((row['player_name'], row['year']), 0)
-            if row['year'] <= 2020 else
-            points_max_week_up_to_17.get((row['player_name'], row['year']), 0),
-            axis=1
+        season_end = season_end_points(player_df, season_metadata)
+        merged_df['points_week_max'] = (
+            merged_df.set_index(['player_name', 'year']).index.map(season_end).fillna(0).values
         )
 
         merged_df['points_week_max'] -= merged_df['points_transaction_week']
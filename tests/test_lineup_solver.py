@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from streamlit_ui.tabs.draft_data.lineup_solver import FLEX_POSITIONS, lineup_frontier, marginal_values, top_lineups
+
+SLOTS = {'QB': 1, 'RB': 1, 'WR': 2, 'TE': 1, 'K': 1}
+NUM_FLEX = 1
+
+
+def brute_force(costs, ppgs, positions, slots=SLOTS, num_flex=NUM_FLEX):
+    """
+    Every valid lineup by enumerating all row subsets: (cost, ppg, selection mask).
+    """
+    n = len(costs)
+    selected = ((np.arange(1 << n)[:, None] >> np.arange(n)) & 1).astype(bool)
+    valid = np.ones(len(selected), dtype=bool)
+    extra = np.zeros(len(selected), dtype=int)
+    for position, count in slots.items():
+        picked = selected[:, positions == position].sum(axis=1)
+        valid &= picked >= count if position in FLEX_POSITIONS else picked == count
+        extra += picked - count
+    selected = selected[valid & (extra == num_flex)]
+    return selected @ costs, selected @ ppgs, selected
+
+
+def random_instance(seed, n=12):
+    rng = np.random.default_rng(seed)
+    # Enough rows to fill every slot and the FLEX, then random positions
+    positions = [p for p, count in SLOTS.items() for _ in range(count)] + FLEX_POSITIONS[:NUM_FLEX]
+    positions += list(rng.choice(list(SLOTS), n - len(positions)))
+    rng.shuffle(positions)
+    costs = np.round(rng.uniform(1, 60, n), 2)
+    ppgs = np.round(rng.uniform(2, 25, n), 2)
+    # Budgets from just below the cheapest lineup to a little above it, where pruning bites hardest
+    cheapest = brute_force(costs, ppgs, np.array(positions, dtype=object))[0].min()
+    budget = round(cheapest + rng.uniform(-2, 15), 2)
+    return costs, ppgs, np.array(positions, dtype=object), budget
+
+
+def best_ppgs(costs, ppgs, positions, budget, top_k):
+    cost, ppg, _ = brute_force(costs, ppgs, positions)
+    return np.sort(ppg[cost <= budget + 1e-6])[::-1][:top_k]
+
+
+@pytest.mark.parametrize("seed", range(60))
+@pytest.mark.parametrize("top_k", [1, 3])
+def test_top_lineups_match_brute_force(seed, top_k):
+    costs, ppgs, positions, budget = random_instance(seed)
+    lineups = top_lineups(costs, ppgs, positions, SLOTS, NUM_FLEX, budget, top_k)
+    np.testing.assert_allclose(lineups.ppg, best_ppgs(costs, ppgs, positions, budget, top_k))
+    assert (lineups.cost <= budget + 1e-6).all()
+    np.testing.assert_allclose(lineups.selected @ costs, lineups.cost)
+    np.testing.assert_allclose(lineups.selected @ ppgs, lineups.ppg)
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_lineup_frontier_matches_brute_force(seed):
+    costs, ppgs, positions, budget = random_instance(seed)
+    frontier = lineup_frontier(costs, ppgs, positions, SLOTS, NUM_FLEX, budget)
+    # The frontier's best lineup within any smaller budget is the best lineup there
+    for b in (budget, budget - 5, budget - 10):
+        within = frontier.ppg[frontier.cost <= b + 1e-6]
+        expected = best_ppgs(costs, ppgs, positions, b, 1)
+        np.testing.assert_allclose(within.max(initial=-np.inf), expected.max(initial=-np.inf))
+
+
+def test_top_lineups_with_a_flex_count_pruned_empty():
+    # Pruning leaves one FLEX count without any partial lineup; this used to raise IndexError
+    costs = np.array([14.12, 33.91, 1.72, 43.07, 43.29, 39.12, 37.07, 5.35, 15.54, 34.89, 24.26, 59.53])
+    ppgs = np.array([23.25, 5.5, 15.57, 18.01, 5.14, 9.19, 18.47, 22.73, 9.86, 7.5, 20.9, 15.45])
+    positions = np.array(['QB', 'K', 'RB', 'RB', 'K', 'QB', 'WR', 'WR', 'RB', 'TE', 'TE', 'RB'], dtype=object)
+    lineups = top_lineups(costs, ppgs, positions, SLOTS, NUM_FLEX, 138.07, 1)
+    np.testing.assert_allclose(lineups.ppg, best_ppgs(costs, ppgs, positions, 138.07, 1))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_marginal_values_match_exhaustive_re_solves(seed):
+    costs, ppgs, positions, budget = random_instance(seed)
+    budget += 20
+    cost, ppg, selected = brute_force(costs, ppgs, positions)
+    within = cost <= budget + 1e-6
+    marginals = marginal_values(costs, ppgs, positions, SLOTS, NUM_FLEX, budget)
+    np.testing.assert_allclose(marginals.best_ppg, ppg[within].max())
+
+    for row in range(len(costs)):
+        without = within & ~selected[:, row]
+        best_without = ppg[without].max(initial=-np.inf)
+        np.testing.assert_allclose(marginals.loss[row], ppg[within].max() - best_without, atol=1e-6)
+        # Highest price for the row at which a lineup with it still matches the best one without it
+        matches = selected[:, row] & (ppg >= best_without - 1e-6)
+        others = cost[matches] - costs[row]
+        break_even = budget - others.min() if len(others) and budget - others.min() >= 0 else np.nan
+        np.testing.assert_allclose(marginals.break_even[row], break_even, atol=1e-6)
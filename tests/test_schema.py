@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+from streamlit_ui.data.schema import normalize_frame
+
+
+def test_only_known_flag_columns_become_int8():
+    df = pd.DataFrame({
+        "year": [2020, 2021], "week": [1, 2],
+        "win": [0, 1], "is_playoffs": [1, 1], "proj_wins": [0, 1], "faab_bid": [1, 0],
+        "champion": [0, 2],
+    })
+    dtypes = normalize_frame(df).dtypes
+    assert dtypes["year"] == np.int16 and dtypes["week"] == np.int16
+    assert dtypes["win"] == np.int8 and dtypes["is_playoffs"] == np.int8
+    # Counts and amounts that happen to be 0/1 keep their dtype, as do flags holding other values
+    assert dtypes["proj_wins"] == np.int64 and dtypes["faab_bid"] == np.int64
+    assert dtypes["champion"] == np.int64
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from streamlit_ui.tabs.matchup_data_and_simulations.shuffle_scores_and_schedules.shuffle_scores import (
+    NOISE_MODELS, simulate_tweaked_seasons, tweak_scores,
+)
+
+COLUMNS = ['year', 'week', 'manager', 'opponent', 'team_points']
+
+
+def season(games):
+    return pd.DataFrame(games, columns=COLUMNS)
+
+
+def std_devs(df):
+    return df.groupby('manager', as_index=False)['team_points'].std().rename(
+        columns={'team_points': 'StdDev_TeamPoints'}
+    )
+
+
+def test_empty_selection_tweaks_and_simulates_nothing():
+    # An in-progress season filtered to postseason games only
+    empty = season([])
+    std_dev_df = pd.DataFrame(columns=['manager', 'StdDev_TeamPoints'])
+    for noise_model in NOISE_MODELS:
+        tweaked = tweak_scores(empty, std_dev_df, noise_model, np.random.default_rng(0))
+        assert tweaked.empty and {'tweaked_team_points', 'Sim_Wins', 'Sim_Losses'} <= set(tweaked.columns)
+        wins, seeds = simulate_tweaked_seasons(empty, std_dev_df, 10, noise_model, seed=0, parallel=False)
+        assert wins.empty and 'Avg Wins' in wins.columns
+        assert seeds.empty and 'Avg Seed' in seeds.columns
+
+
+def test_simulated_wins_and_seeds_are_complete_distributions():
+    df = season([
+        (2024, 1, 'A', 'B', 100.0), (2024, 1, 'B', 'A', 90.0),
+        (2024, 2, 'A', 'B', 80.0), (2024, 2, 'B', 'A', 110.0),
+        (2024, 3, 'A', 'B', 95.0), (2024, 3, 'B', 'A', 94.0),
+    ])
+    wins, seeds = simulate_tweaked_seasons(df, std_devs(df), 200, "Normal", seed=0, parallel=False)
+    np.testing.assert_allclose(wins[['0', '1', '2', '3']].sum(axis=1), 100)
+    np.testing.assert_allclose(seeds[['1', '2']].sum(axis=1), 100)
+    # One game per week between two managers: their wins always add up to the weeks played
+    np.testing.assert_allclose(wins['Avg Wins'].sum(), 3)
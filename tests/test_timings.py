@@ -0,0 +1,44 @@
+import threading
+
+import numpy as np
+
+from streamlit_ui.data.timings import DIAGNOSTICS_ENV, timed
+
+
+def test_overlapping_sections_skip_memory_tracing_without_waiting(monkeypatch):
+    monkeypatch.setenv(DIAGNOSTICS_ENV, "1")
+    outer_started, other_done = threading.Event(), threading.Event()
+    records = {}
+
+    def outer():
+        with timed("test", "outer") as record:
+            outer_started.set()
+            # The other thread's section has to run to completion while this one is open
+            records["overlapped"] = other_done.wait(timeout=5)
+            with timed("test", "nested") as nested:
+                np.ones(10 * 1024 * 1024, dtype=np.uint8)
+        records["outer"], records["nested"] = record, nested
+
+    def other():
+        outer_started.wait()
+        with timed("test", "other") as record:
+            np.ones(50 * 1024 * 1024, dtype=np.uint8)
+        records["other"] = record
+        other_done.set()
+
+    threads = [threading.Thread(target=outer), threading.Thread(target=other)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert records["overlapped"]
+    # Only the first thread traces; its nested section keeps its own peak
+    assert "peak_mb" not in records["other"]
+    assert 10 <= records["nested"]["peak_mb"] < 50
+    assert records["outer"]["peak_mb"] >= records["nested"]["peak_mb"]
+
+    # Once the outer section ends, any thread can trace again
+    with timed("test", "after") as record:
+        np.ones(1024 * 1024, dtype=np.uint8)
+    assert 1 <= record["peak_mb"] < 10